@@ -0,0 +1,80 @@
+import sys
+import time
+
+from details.Detail import Detail
+from manufactoring.Factory import Factory
+from manufactoring.FactoryExport import FactoryExport
+from manufactoring.FactoryImport import FactoryImport
+from manufactoring.InnerStorage import InnerStorage
+from manufactoring.ProductionLine import ProductionLine
+from warehouse.DeliveryTruk import DeliveryTruck
+from warehouse.DetailStorageCell import DetailStorageCell
+from warehouse.Warehouse import Warehouse
+
+# Полный путь n деталей: поставщик -> склад -> фабрика -> линия ->
+# внутренний склад -> экспорт фабрики -> склад. Части пути с send_n_*
+# проходятся порциями по batch, как при сменной выгрузке. threaded выбирает
+# потокобезопасные очереди экспорта.
+
+
+def pipeline(n: int, truck_size: int = 100, batch: int = 1000, threaded: bool = False) -> dict[str, float]:
+    details = [Detail(0.0) for _ in range(n)]
+    cell = DetailStorageCell("cell-1", size=n)
+    warehouse = Warehouse(DeliveryTruck(), None, cell, "addr", [], threaded)
+    factory = Factory()
+    factory.factory_import = FactoryImport("import-1")
+    factory.factory_export = FactoryExport("export-1", threaded)
+    factory.inner_storage = InnerStorage()
+    line = ProductionLine()
+    stages = {}
+
+    def stage(name, func):
+        start = time.perf_counter()
+        func()
+        stages[name] = time.perf_counter() - start
+
+    def supply():
+        truck = DeliveryTruck()
+        truck.baggage = details
+        truck.unload_to_warehouse(warehouse, "supplier")
+        warehouse.import_from_supplier.send_all_to_details(cell)
+        cell.send_all_to_export(warehouse.export_to_factory)
+
+    def to_factory():
+        warehouse.export_to_factory.send_all_to_factory(factory, load_per_truck=truck_size)
+        while factory.factory_import.send_n_materials_to_inner(factory.inner_storage, batch):
+            pass
+
+    def produce():
+        for detail in factory.inner_storage.materials:
+            line.get_detail(detail)
+        factory.inner_storage.materials.clear()
+        while line.details_list:
+            line.move_to_finished(factory.inner_storage, batch)
+
+    def export():
+        while factory.inner_storage.send_n_finished_to_export(factory.factory_export, batch):
+            pass
+        factory.factory_export.send_all_to_warehouse(warehouse, truck_size)
+
+    stage("supplier -> warehouse", supply)
+    stage("warehouse -> factory", to_factory)
+    stage("production line", produce)
+    stage("factory -> warehouse", export)
+    assert len(warehouse.import_from_factory.queue) == n
+    return stages
+
+
+def main(n: int = 100_000) -> None:
+    print(f"details: {n}")
+    for threaded in (False, True):
+        stages = pipeline(n, threaded=threaded)
+        total = sum(stages.values())
+        print(f"export queues: {'thread-safe' if threaded else 'deque'}")
+        for name, seconds in stages.items():
+            print(f"  {name:<22} {seconds:7.3f} s")
+        print(f"  {'total':<22} {total:7.3f} s  ({n / total:,.0f} details/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,70 @@
+import sys
+import time
+
+from details.Blueprint import BluePrint
+from machines.ProductionMachine import ProductionMachine
+from manufactoring.Factory import Factory
+from manufactoring.FactoryExport import FactoryExport
+from manufactoring.Maintenance import Maintenance
+from manufactoring.ProductionLine import ProductionLine
+from manufactoring.Workshop import Workshop
+from simulation.FactorySimulation import FactorySimulation
+from staff.Worker import Worker
+from warehouse.DeliveryTruk import DeliveryTruck
+from warehouse.Warehouse import Warehouse
+
+MONTH_HOURS = 30 * 24
+
+
+def build_factory(machines: int, per_line: int = 50, capacity: int = 10) -> tuple[Factory, list[Worker]]:
+    factory = Factory()
+    factory.factory_export = FactoryExport("export-1")
+    blueprint = BluePrint()
+    blueprint.result = "detail"
+    workers = []
+    lines = []
+    for start in range(0, machines, per_line):
+        line = ProductionLine()
+        line.maintenance = Maintenance()
+        for i in range(start, min(start + per_line, machines)):
+            machine = ProductionMachine()
+            machine.capacity = capacity
+            machine.instruction = blueprint
+            line.machine_list.append(machine)
+            # каждый второй станок — с рабочим на смене
+            if i % 2 == 0:
+                worker = Worker()
+                worker.machine = machine
+                worker.production_line = line
+                worker.attentiveness = i % 4 == 0
+                workers.append(worker)
+        lines.append(line)
+    factory.workshop_list.append(Workshop("w1", "production", lines, []))
+    return factory, workers
+
+
+def trucks(count: int, size: int = 500) -> list[DeliveryTruck]:
+    result = []
+    for _ in range(count):
+        truck = DeliveryTruck()
+        truck.size = size
+        result.append(truck)
+    return result
+
+
+def main(machines: int = 2000) -> None:
+    factory, workers = build_factory(machines)
+    warehouse = Warehouse(DeliveryTruck(), None, None, "addr", [])
+    simulation = FactorySimulation(factory, warehouse, trucks(machines // 20), workers, seed=0)
+    start = time.perf_counter()
+    report = simulation.run(MONTH_HOURS)
+    elapsed = time.perf_counter() - start
+    print(f"machines: {machines}, workers: {len(workers)}, trucks: {len(simulation.trucks)}, "
+          f"{MONTH_HOURS} simulated hours")
+    print(f"  {elapsed:.3f} s, {report.events} events ({report.events / elapsed:,.0f} events/s)")
+    print(f"  produced {report.produced}, defective {report.defective}, delivered {report.delivered}, "
+          f"backlog {report.backlog}, repairs {report.repairs}, reports {report.defect_reports}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,41 @@
+import os
+import uuid
+
+import numpy as np
+
+
+# Партия деталей по столбцам: вместо n объектов Detail — массивы длины n.
+# ids — по 16 байт на деталь (UUID версии 4, как у Detail.detail_id).
+class DetailBatch:
+    def __init__(self, ids: np.ndarray, names: np.ndarray, mass: np.ndarray, price: np.ndarray,
+                 defect: np.ndarray):
+        self.ids = ids
+        self.names = names
+        self.mass = mass
+        self.price = price
+        self.defect = defect
+
+    @classmethod
+    def uniform(cls, defect: np.ndarray, name: str, mass: float, price: int) -> "DetailBatch":
+        # все детали одного станка одинаковы, кроме id и брака
+        n = len(defect)
+        return cls(_uuid4_array(n), np.full(n, name, dtype=object), np.full(n, mass, dtype=np.float64),
+                   np.full(n, price, dtype=np.int64), defect)
+
+    def __len__(self):
+        return len(self.defect)
+
+    @property
+    def defect_count(self) -> int:
+        return int(np.count_nonzero(self.defect))
+
+    def detail_id(self, index: int) -> uuid.UUID:
+        return uuid.UUID(bytes=self.ids[index].tobytes())
+
+
+def _uuid4_array(n: int) -> np.ndarray:
+    # случайные байты из os.urandom, как uuid.uuid4(), и биты версии/варианта
+    ids = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    ids[:, 6] = (ids[:, 6] & 0x0F) | 0x40
+    ids[:, 8] = (ids[:, 8] & 0x3F) | 0x80
+    return ids
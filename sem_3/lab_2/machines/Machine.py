@@ -1,4 +1,5 @@
 import uuid
+from typing import TYPE_CHECKING
 
 from exceptions.MachineAlreadyRunningError import MachineAlreadyRunningError
 from exceptions.MachineNotRunningError import MachineNotRunningError
@@ -6,6 +7,14 @@ from details.Assembly import Assembly
 from details.Blueprint import BluePrint
 from details.Detail import Detail
 
+# numpy нужен только для make_batch и импортируется в нём
+if TYPE_CHECKING:
+    import numpy as np
+    from details.DetailBatch import DetailBatch
+
+# по столько случайных чисел за раз генерирует make_batch
+DEFECT_CHUNK = 65536
+
 
 class Machine:
     def __init__(self):
@@ -35,4 +44,57 @@ class Machine:
         detail.name = self.instruction.result
         detail.mass = self.instruction.mass
         detail.price = self.instruction.price
-        return detail
\ No newline at end of file
+        return detail
+
+    def make_batch(self, n: int, rng: "np.random.Generator | int | None" = None) -> "DetailBatch":
+        # то же, что n вызовов make_detail: шанс брака растёт на 0.1 после
+        # каждой бракованной детали, но детали — столбцы DetailBatch
+        if not self.is_running:
+            raise MachineNotRunningError
+        if n < 0:
+            raise ValueError(f"Negative batch size: {n}")
+        import numpy as np
+        from details.DetailBatch import DetailBatch
+        generator = np.random.default_rng(rng)
+        defect = np.empty(n, dtype=bool)
+        chance = self.defect_chance
+        for start in range(0, n, DEFECT_CHUNK):
+            out = defect[start:start + DEFECT_CHUNK]
+            if chance >= 1:
+                # дальше брак всегда, случайные числа не нужны
+                out[:] = True
+                chance = _escalate(chance, len(out))
+            else:
+                chance = _sample_defects(generator.random(len(out)), chance, out)
+        self.defect_chance = chance
+        return DetailBatch.uniform(defect, self.instruction.result, self.instruction.mass, self.instruction.price)
+
+
+def _sample_defects(draws: "np.ndarray", chance: float, out: "np.ndarray") -> float:
+    # деталь i бракованная, если draws[i] < текущего шанса. Пока шанс не
+    # меняется, ищется только следующий брак, а после него шанс растёт;
+    # при шансе >= 1 брак уже всё, поэтому поисков не больше ~10 на партию
+    i = 0
+    while i < len(draws):
+        if chance >= 1:
+            out[i:] = True
+            return _escalate(chance, len(draws) - i)
+        hits = draws[i:] < chance
+        j = int(hits.argmax())
+        if not hits[j]:
+            out[i:] = False
+            break
+        out[i:i + j] = False
+        out[i + j] = True
+        chance += 0.1
+        i += j + 1
+    return chance
+
+
+def _escalate(chance: float, defects: int) -> float:
+    # defects раз прибавить 0.1 — последовательно, с тем же округлением,
+    # что и chance += 0.1 в цикле
+    import numpy as np
+    steps = np.full(defects + 1, 0.1)
+    steps[0] = chance
+    return float(np.add.accumulate(steps)[-1])
@@ -1,21 +1,24 @@
-from queue import Queue
 from exceptions.TruckSizeError import TruckSizeError
 
 from warehouse.DeliveryTruk import DeliveryTruck
 from warehouse.Warehouse import Warehouse
+from warehouse.ExportQueue import ExportQueue
+from warehouse.ThreadSafeExportQueue import ThreadSafeExportQueue
 
 class FactoryExport:
-    def __init__(self, export_id:str):
+    # threaded=True — потокобезопасная очередь для многопоточной работы,
+    # иначе очередь без блокировок
+    def __init__(self, export_id:str, threaded: bool = False):
         self.export_id = export_id
-        self.queue = Queue()
+        self.queue: ExportQueue | ThreadSafeExportQueue = ThreadSafeExportQueue() if threaded else ExportQueue()
 
     def load_truck(self, truck: DeliveryTruck):
         if truck.size <= 0:
             raise TruckSizeError("Размер грузовика не установлен или равен 0.")
 
-        while not self.queue.empty() and len(truck.baggage) < truck.size:
-            item = self.queue.get()
-            truck.baggage.append(item)
+        room = truck.size - len(truck.baggage)
+        if room > 0:
+            truck.baggage.extend(self.queue.get_many(room))
 
         return truck
 
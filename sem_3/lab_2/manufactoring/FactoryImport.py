@@ -1,22 +1,20 @@
 from manufactoring.InnerStorage import InnerStorage
+from warehouse.TransferQueue import TransferQueue, TransferQueueAttribute
 
 
 class FactoryImport:
+    queue = TransferQueueAttribute()
+
     def __init__(self, import_id: str):
         self.import_id = import_id
-        self.queue: list = []
+        self.queue: TransferQueue = TransferQueue()
 
     def send_all_materials_to_inner(self, inner_storage:InnerStorage):
-        for material in self.queue:
-            inner_storage.materials.append(material)
-
-        self.queue.clear()
+        inner_storage.materials.extend(self.queue.take_all())
 
     def send_n_materials_to_inner(self, inner_storage:InnerStorage, n: int):
         count = min(n, len(self.queue))
 
-        for _ in range(count):
-            material = self.queue.pop(0)
-            inner_storage.materials.append(material)
+        inner_storage.materials.extend(self.queue.take(count))
 
         return count
\ No newline at end of file
@@ -1,25 +1,23 @@
 from details.Detail import Detail
 from manufactoring.FactoryExport import FactoryExport
 from materials.Material import Material
+from warehouse.TransferQueue import TransferQueue, TransferQueueAttribute
 
 
 class InnerStorage:
+    finished_details = TransferQueueAttribute()
+
     def __init__(self):
         self.unfinished_details:list[Detail] = []
         self.materials:list[Material] = []
-        self.finished_details:list[Detail] = []
+        self.finished_details: TransferQueue = TransferQueue()
 
     def send_all_finished_to_export(self, factory_export:FactoryExport):
-        for detail in self.finished_details:
-            factory_export.queue.put(detail)
-
-        self.finished_details.clear()
+        factory_export.queue.put_many(self.finished_details.take_all())
 
     def send_n_finished_to_export(self, factory_export:FactoryExport, n: int):
         count = min(n, len(self.finished_details))
 
-        for _ in range(count):
-            detail = self.finished_details.pop(0)
-            factory_export.queue.put(detail)
+        factory_export.queue.put_many(self.finished_details.take(count))
 
         return count
\ No newline at end of file
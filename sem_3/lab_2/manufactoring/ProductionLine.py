@@ -1,16 +1,18 @@
 import uuid
 
-from details.Detail import Detail
 from machines.Machine import Machine
 
 from manufactoring.FactoryExport import FactoryExport
 from manufactoring.InnerStorage import InnerStorage
+from warehouse.TransferQueue import TransferQueue, TransferQueueAttribute
 
 
 class ProductionLine:
+    details_list = TransferQueueAttribute()
+
     def __init__(self):
         self.prod_line_id = uuid.uuid4()
-        self.details_list:list[Detail] = []
+        self.details_list: TransferQueue = TransferQueue()
         self.machine_list:list[Machine] = []
         from manufactoring.Maintenance import Maintenance
         self.maintenance:Maintenance|None = None
@@ -29,28 +31,22 @@ class ProductionLine:
         self.details_list.append(detail)
 
     def send_all_to_export(self, factory_export:FactoryExport):
-        for item in self.details_list:
-            factory_export.queue.put(item)
-        self.details_list.clear()
+        factory_export.queue.put_many(self.details_list.take_all())
 
     def send_to_export(self, factory_export:FactoryExport, amount):
-        for i in range(amount):
-            factory_export.queue.put(self.details_list.pop(0))
+        for _ in range(amount):
+            factory_export.queue.put(self.details_list.popleft())
 
     def move_all_to_unfinished(self, storage: InnerStorage):
-        storage.unfinished_details.extend(self.details_list)
-        self.details_list.clear()
+        storage.unfinished_details.extend(self.details_list.take_all())
 
     def move_to_unfinished(self, storage: InnerStorage, amount: int):
         count = min(amount, len(self.details_list))
-        for _ in range(count):
-            storage.unfinished_details.append(self.details_list.pop(0))
+        storage.unfinished_details.extend(self.details_list.take(count))
 
     def move_all_to_finished(self, storage: InnerStorage):
-        storage.finished_details.extend(self.details_list)
-        self.details_list.clear()
+        storage.finished_details.extend(self.details_list.take_all())
 
     def move_to_finished(self, storage: InnerStorage, amount: int):
         count = min(amount, len(self.details_list))
-        for _ in range(count):
-            storage.finished_details.append(self.details_list.pop(0))
\ No newline at end of file
+        storage.finished_details.extend(self.details_list.take(count))
\ No newline at end of file
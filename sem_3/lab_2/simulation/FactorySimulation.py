@@ -0,0 +1,219 @@
+import random
+
+from exceptions.MissingAttributeError import MissingAttributeError
+from exceptions.TruckSizeError import TruckSizeError
+from exceptions.WrongDefectChanceValue import WrongDefectChanceError
+from details.Detail import Detail
+from machines.Machine import Machine
+from manufactoring.Factory import Factory
+from manufactoring.Maintenance import Maintenance
+from simulation.Scheduler import Scheduler
+from simulation.Signal import Signal
+from simulation.SimulationReport import SimulationReport
+from staff.Worker import Worker
+from warehouse.DeliveryTruk import DeliveryTruck
+from warehouse.Warehouse import Warehouse
+
+HOURS_PER_DAY = 24.0
+
+
+# Модель фабрики во времени (часы). Процессы:
+#  - станок: в начале цикла делает до machine.capacity деталей через
+#    Worker.make_detail (или Machine.make_detail, если рабочего нет), через
+#    cycle_time годные детали уходят в очередь factory_export, бракованные
+#    списываются. При defect_chance >= stop_threshold (не больше 0.9, чтобы
+#    шанс не ушёл за 1) станок прерывает партию и ждёт ремонта, а станок,
+#    который уже на пороге, не начинает цикл;
+#  - рабочий: смена shift_hours из 24 часов запускает станок, после смены
+#    останавливает; при браке внимательный рабочий пишет DefectReport и
+#    станок сразу уходит в ремонт, невнимательный может потерять палец;
+#  - ремонтная служба линии: раз в repair_interval чинит все станки из списка;
+#  - грузовик: ждёт сигнала об отгрузке в экспорт, забирает через
+#    FactoryExport.load_truck до truck.size деталей, едет travel_time и
+#    выгружает их в import_from_factory склада, затем возвращается.
+class FactorySimulation:
+    def __init__(self, factory: Factory, warehouse: Warehouse, trucks: list[DeliveryTruck],
+                 workers: list[Worker] | None = None, cycle_time: float = 1.0, shift_hours: float = 8.0,
+                 repair_interval: float = 24.0, travel_time: float = 4.0, stop_threshold: float = 0.5,
+                 seed: int | None = None):
+        if not 0 < stop_threshold <= 0.9:
+            raise WrongDefectChanceError(stop_threshold, "Wrong stop threshold")
+        self.factory = factory
+        self.warehouse = warehouse
+        self.trucks = trucks
+        self.workers = workers or []
+        self.cycle_time = cycle_time
+        self.shift_hours = shift_hours
+        self.repair_interval = repair_interval
+        self.travel_time = travel_time
+        self.stop_threshold = stop_threshold
+        self.scheduler = Scheduler()
+        self.report = SimulationReport()
+        # Detail и Worker берут случайные числа из модуля random: на время
+        # прогона модуль получает состояние симуляции — seed повторяет прогон
+        # и не сбивает остальной код
+        self._random_state = random.Random(seed).getstate()
+        self._exported = Signal()
+        self._broken: set[Machine] = set()
+        self._on_duty: dict[Machine, bool] = {}
+        self._resume: dict[Machine, Signal] = {}
+        self._started = False
+
+    def run(self, hours: float) -> SimulationReport:
+        # повторный вызов продолжает модель с того же момента
+        if not self._started:
+            self._start_processes()
+            self._started = True
+        state = random.getstate()
+        random.setstate(self._random_state)
+        try:
+            self.scheduler.run(self.scheduler.now + hours)
+        finally:
+            self._random_state = random.getstate()
+            random.setstate(state)
+        self.report.hours = self.scheduler.now
+        self.report.events = self.scheduler.events
+        return self.report
+
+    def _start_processes(self):
+        if self.factory.factory_export is None:
+            raise MissingAttributeError('factory_export', self.factory)
+        operators = {worker.machine: worker for worker in self.workers if worker.machine is not None}
+        maintenances: dict[int, Maintenance] = {}
+        for workshop in self.factory.workshop_list:
+            for line in workshop.production_line_list:
+                if line.machine_list and line.maintenance is None:
+                    raise MissingAttributeError('maintenance', line)
+                for machine in line.machine_list:
+                    if machine.capacity <= 0:
+                        continue
+                    if machine.instruction is None:
+                        raise MissingAttributeError('instruction', machine)
+                    worker = operators.get(machine)
+                    if worker is not None and worker.production_line is None:
+                        # отчёт о браке уходит в ремонтную службу линии рабочего
+                        worker.production_line = line
+                    self._resume[machine] = Signal()
+                    self._on_duty[machine] = worker is None
+                    if worker is None and not machine.is_running:
+                        machine.run()
+                    self.scheduler.start(self._machine_process(machine, worker, line.maintenance))
+                    if worker is not None:
+                        self.scheduler.start(self._worker_process(worker, machine))
+                if line.machine_list:
+                    maintenances[id(line.maintenance)] = line.maintenance
+        # одна служба может обслуживать несколько линий
+        for maintenance in maintenances.values():
+            self.scheduler.start(self._maintenance_process(maintenance), self.repair_interval)
+        for truck in self.trucks:
+            if truck.size <= 0:
+                raise TruckSizeError("Размер грузовика не установлен или равен 0.")
+            self.scheduler.start(self._truck_process(truck))
+
+    def _machine_process(self, machine: Machine, worker: Worker | None, maintenance: Maintenance):
+        report = self.report
+        export = self.factory.factory_export.queue
+        resume = self._resume[machine]
+        capacity = machine.capacity
+        threshold = self.stop_threshold
+        while True:
+            if not machine.is_running:
+                yield resume
+                continue
+            if machine.defect_chance >= threshold:
+                # станок уже на пороге (например, задан таким до запуска):
+                # цикл не начинается, иначе шанс брака уйдёт за 1
+                self._send_to_repair(machine, maintenance)
+                continue
+            details = self._make_details(machine, worker, maintenance, capacity)
+            # начатый цикл доводится до конца, даже если станок остановили
+            yield self.cycle_time
+            good = [detail for detail in details if not detail.defect]
+            report.produced += len(details)
+            report.defective += len(details) - len(good)
+            if good:
+                report.backlog += len(good)
+                export.put_many(good)
+                self.scheduler.fire(self._exported)
+
+    def _make_details(self, machine: Machine, worker: Worker | None, maintenance: Maintenance,
+                      capacity: int) -> list[Detail]:
+        make = machine.make_detail if worker is None else worker.make_detail
+        attentive = worker is not None and worker.attentiveness
+        fingers = worker.fingers if worker is not None else 0
+        details = []
+        for _ in range(capacity):
+            detail = make()
+            details.append(detail)
+            if not detail.defect:
+                continue
+            # станок встаёт сразу: по отчёту рабочего или по порогу
+            if attentive:
+                # DefectReport уже передал станок ремонтной службе
+                self.report.defect_reports += 1
+                self._halt(machine)
+                break
+            if machine.defect_chance >= self.stop_threshold:
+                self._send_to_repair(machine, maintenance)
+                break
+        if worker is not None:
+            self.report.fingers_lost += fingers - worker.fingers
+        return details
+
+    def _send_to_repair(self, machine: Machine, maintenance: Maintenance):
+        maintenance.add(machine)
+        self._halt(machine)
+
+    def _halt(self, machine: Machine):
+        self._broken.add(machine)
+        if machine.is_running:
+            machine.stop()
+
+    def _worker_process(self, worker: Worker, machine: Machine):
+        rest = HOURS_PER_DAY - self.shift_hours
+        while True:
+            self._on_duty[machine] = True
+            self._resume_machine(machine)
+            if rest <= 0:
+                return
+            yield self.shift_hours
+            self._on_duty[machine] = False
+            if machine.is_running:
+                machine.stop()
+            yield rest
+
+    def _maintenance_process(self, maintenance: Maintenance):
+        while True:
+            if maintenance.broken_machines:
+                maintenance.repair_all()
+                for machine in maintenance.broken_machines:
+                    if machine in self._broken:
+                        self._broken.discard(machine)
+                        self.report.repairs += 1
+                        self._resume_machine(machine)
+                maintenance.broken_machines.clear()
+            yield self.repair_interval
+
+    def _resume_machine(self, machine: Machine):
+        if self._on_duty[machine] and machine not in self._broken and not machine.is_running:
+            machine.run()
+            self.scheduler.fire(self._resume[machine])
+
+    def _truck_process(self, truck: DeliveryTruck):
+        report = self.report
+        export = self.factory.factory_export
+        while True:
+            if export.queue.empty():
+                # ждать груза у ворот
+                yield self._exported
+                continue
+            export.load_truck(truck)
+            load = len(truck.baggage)
+            report.backlog -= load
+            report.in_transit += load
+            yield self.travel_time
+            truck.unload_to_warehouse(self.warehouse, 'factory')
+            report.in_transit -= load
+            report.delivered += load
+            report.truck_trips += 1
+            yield self.travel_time
@@ -0,0 +1,46 @@
+import heapq
+import itertools
+
+from simulation.Signal import Signal
+
+
+# Планировщик дискретных событий. Процесс — генератор: yield число —
+# продолжить через столько часов модельного времени, yield Signal — ждать
+# сигнала. События хранятся в куче по времени; при равном времени
+# выполняются в порядке постановки.
+class Scheduler:
+    def __init__(self):
+        self.now: float = 0.0
+        self.events: int = 0
+        self._queue: list = []
+        self._counter = itertools.count()
+
+    def start(self, process, delay: float = 0.0):
+        if delay < 0:
+            raise ValueError(f"Negative delay: {delay}")
+        heapq.heappush(self._queue, (self.now + delay, next(self._counter), process))
+
+    def fire(self, signal: Signal):
+        waiters, signal.waiters = signal.waiters, []
+        for process in waiters:
+            self.start(process)
+
+    def run(self, until: float):
+        queue = self._queue
+        counter = self._counter
+        push, pop = heapq.heappush, heapq.heappop
+        while queue and queue[0][0] <= until:
+            time, _, process = pop(queue)
+            self.now = time
+            self.events += 1
+            try:
+                step = next(process)
+            except StopIteration:
+                continue
+            if isinstance(step, Signal):
+                step.waiters.append(process)
+            elif step < 0:
+                raise ValueError(f"Negative delay: {step}")
+            else:
+                push(queue, (time + step, next(counter), process))
+        self.now = until
@@ -0,0 +1,5 @@
+# Сигнал, которого могут ждать процессы: процесс, выдавший (yield) сигнал,
+# продолжится в момент Scheduler.fire(signal).
+class Signal:
+    def __init__(self):
+        self.waiters: list = []
@@ -0,0 +1,17 @@
+class SimulationReport:
+    def __init__(self):
+        self.hours: float = 0.0
+        self.events: int = 0
+        self.produced: int = 0
+        self.defective: int = 0
+        self.delivered: int = 0
+        self.backlog: int = 0
+        self.in_transit: int = 0
+        self.truck_trips: int = 0
+        self.defect_reports: int = 0
+        self.repairs: int = 0
+        self.fingers_lost: int = 0
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value}" for name, value in vars(self).items())
+        return f"SimulationReport({fields})"
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from details.AssembledDetail import AssembledDetail
@@ -7,7 +8,7 @@ from exceptions.MachineAlreadyRunningError import MachineAlreadyRunningError
 from exceptions.MachineNotRunningError import MachineNotRunningError
 from machines.AssemblyMachine import AssemblyMachine
 from machines.DiskMachine import DiskMachine
-from machines.Machine import Machine
+from machines.Machine import DEFECT_CHUNK, Machine
 from machines.ProductionMachine import ProductionMachine
 from machines.TireMachine import TireMachine
 from machines.WheelAssemblyMachine import WheelAssemblyMachine
@@ -113,3 +114,52 @@ def test_assembly_machine_and_wheel_assembly_machine():
 
     with pytest.raises(MachineNotRunningError):
         WheelAssemblyMachine().assembly_detail(disk, tire)
+
+
+def _sequential_defects(draws, chance):
+    flags = []
+    for draw in draws:
+        defect = draw < chance
+        if defect:
+            chance += 0.1
+        flags.append(defect)
+    return flags, chance
+
+
+@pytest.mark.parametrize("start_chance", [0.0, 0.05, 0.1, 0.7])
+@pytest.mark.parametrize("n", [0, 1, 50, 70_000])
+def test_make_batch_matches_sequential_escalation(start_chance, n):
+    machine = ProductionMachine()
+    machine.instruction = DummyInstruction(result="Batch", mass=3.0, price=7)
+    machine.defect_chance = start_chance
+    machine.run()
+
+    batch = machine.make_batch(n, rng=123)
+
+    generator = np.random.default_rng(123)
+    chunks = [generator.random(min(DEFECT_CHUNK, n - start)) for start in range(0, n, DEFECT_CHUNK)]
+    draws = np.concatenate(chunks) if chunks else []
+    flags, chance = _sequential_defects(draws, start_chance)
+    assert len(batch) == n
+    assert batch.defect.tolist() == flags
+    assert batch.defect_count == sum(flags)
+    assert machine.defect_chance == chance
+    assert batch.names.tolist() == ["Batch"] * n
+    assert batch.mass.tolist() == [3.0] * n
+    assert batch.price.tolist() == [7] * n
+
+
+def test_make_batch_ids_and_errors():
+    machine = Machine()
+    machine.instruction = DummyInstruction()
+    with pytest.raises(MachineNotRunningError):
+        machine.make_batch(10)
+
+    machine.run()
+    with pytest.raises(ValueError):
+        machine.make_batch(-1)
+
+    batch = machine.make_batch(1000, rng=np.random.default_rng(0))
+    ids = {batch.detail_id(i) for i in range(len(batch))}
+    assert len(ids) == 1000
+    assert all(detail_id.version == 4 for detail_id in ids)
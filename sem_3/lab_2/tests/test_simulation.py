@@ -0,0 +1,184 @@
+import pytest
+
+from exceptions.MissingAttributeError import MissingAttributeError
+from exceptions.TruckSizeError import TruckSizeError
+from exceptions.WrongDefectChanceValue import WrongDefectChanceError
+from details.Blueprint import BluePrint
+from details.Detail import Detail
+from machines.Machine import Machine
+from manufactoring.Factory import Factory
+from manufactoring.FactoryExport import FactoryExport
+from manufactoring.Maintenance import Maintenance
+from manufactoring.ProductionLine import ProductionLine
+from manufactoring.Workshop import Workshop
+from simulation.FactorySimulation import FactorySimulation
+from simulation.Scheduler import Scheduler
+from simulation.Signal import Signal
+from staff.Worker import Worker
+from warehouse.DeliveryTruk import DeliveryTruck
+from warehouse.Warehouse import Warehouse
+
+
+def make_factory(machines: int, capacity: int = 5, defect_chance: float = 0.1, maintenance: bool = True):
+    line = ProductionLine()
+    line.maintenance = Maintenance() if maintenance else None
+    blueprint = BluePrint()
+    blueprint.result = "bolt"
+    for _ in range(machines):
+        machine = Machine()
+        machine.capacity = capacity
+        machine.defect_chance = defect_chance
+        machine.instruction = blueprint
+        line.machine_list.append(machine)
+    factory = Factory()
+    factory.factory_export = FactoryExport("export-1")
+    factory.workshop_list.append(Workshop("w1", "production", [line], []))
+    return factory, line
+
+
+def make_warehouse() -> Warehouse:
+    return Warehouse(DeliveryTruck(), None, None, "addr", [])
+
+
+def make_truck(size: int) -> DeliveryTruck:
+    truck = DeliveryTruck()
+    truck.size = size
+    return truck
+
+
+def test_scheduler_orders_events_by_time_and_signals():
+    scheduler = Scheduler()
+    log = []
+    signal = Signal()
+
+    def ticker(name, period):
+        while True:
+            log.append((scheduler.now, name))
+            yield period
+
+    def waiter():
+        yield signal
+        log.append((scheduler.now, "woken"))
+
+    def firer():
+        yield 2.5
+        scheduler.fire(signal)
+
+    scheduler.start(ticker("a", 2))
+    scheduler.start(ticker("b", 3))
+    scheduler.start(waiter())
+    scheduler.start(firer())
+    scheduler.run(until=6)
+
+    assert log == [(0, "a"), (0, "b"), (2, "a"), (2.5, "woken"), (3, "b"), (4, "a"), (6, "b"), (6, "a")]
+    assert scheduler.now == 6
+
+    with pytest.raises(ValueError):
+        scheduler.start(ticker("c", 1), delay=-1)
+
+
+def test_machines_without_defects_produce_every_cycle():
+    factory, line = make_factory(machines=3, capacity=5, defect_chance=0.0)
+    worker = Worker()
+    worker.machine = line.machine_list[0]
+
+    warehouse = make_warehouse()
+
+    report = FactorySimulation(factory, warehouse, [make_truck(1000)], [worker], seed=1).run(48)
+
+    # два станка без рабочего работают круглые сутки, третий — по 8 часов смены
+    assert report.produced == 2 * 48 * 5 + 2 * 8 * 5
+    assert report.defective == 0
+    assert report.delivered + report.in_transit + report.backlog == report.produced
+    assert len(factory.factory_export.queue) == report.backlog
+    delivered = warehouse.import_from_factory.queue
+    assert len(delivered) == report.delivered
+    assert all(isinstance(detail, Detail) and detail.name == "bolt" for detail in delivered)
+
+
+def test_defects_stop_machines_until_maintenance_and_are_reproducible():
+    def run():
+        factory, line = make_factory(machines=20, capacity=10)
+        simulation = FactorySimulation(factory, make_warehouse(), [make_truck(50)], seed=7, stop_threshold=0.5)
+        return simulation.run(24 * 7), line
+
+    report, line = run()
+    again, _ = run()
+    assert vars(report) == vars(again)
+
+    assert report.defective > 0
+    assert report.repairs > 0
+    assert report.produced - report.defective == report.delivered + report.in_transit + report.backlog
+    assert all(machine.defect_chance <= 0.6 + 1e-9 for machine in line.machine_list)
+
+
+def test_machine_above_threshold_waits_for_repair_without_producing():
+    factory, line = make_factory(machines=1, capacity=10, defect_chance=0.95)
+    simulation = FactorySimulation(factory, make_warehouse(), [make_truck(50)], seed=2, stop_threshold=0.5)
+
+    report = simulation.run(24)
+    assert report.produced == 0
+    assert report.repairs == 1
+    # после ремонта станок сразу начал новый цикл
+    assert line.machine_list[0].is_running
+    assert line.machine_list[0].defect_chance < 0.5
+
+    report = simulation.run(24)
+    assert report.produced > 0
+    assert all(machine.defect_chance <= 0.6 + 1e-9 for machine in line.machine_list)
+
+
+def test_attentive_worker_reports_and_careless_worker_loses_fingers():
+    factory, line = make_factory(machines=2, capacity=10, defect_chance=0.3)
+    attentive, careless = Worker(), Worker()
+    attentive.machine, careless.machine = line.machine_list
+    attentive.attentiveness, careless.attentiveness = True, False
+
+    report = FactorySimulation(factory, make_warehouse(), [make_truck(100)], [attentive, careless], seed=3).run(24 * 3)
+
+    assert report.defect_reports > 0
+    assert len(line.maintenance.reports) == report.defect_reports
+    assert all(r.operator_id == attentive.sign for r in line.maintenance.reports)
+    assert attentive.fingers == 10
+    assert careless.fingers == 10 - report.fingers_lost
+    assert report.fingers_lost > 0
+
+
+def test_truck_waits_for_export_signal():
+    factory, line = make_factory(machines=1, capacity=5, defect_chance=0.0)
+    worker = Worker()
+    worker.machine = line.machine_list[0]
+    simulation = FactorySimulation(factory, make_warehouse(), [make_truck(100)], [worker], seed=4, travel_time=1)
+
+    report = simulation.run(20)
+    assert report.delivered == 8 * 5
+    assert report.backlog == report.in_transit == 0
+
+    # до следующей смены станок стоит, а грузовик ждёт сигнала и событий не создаёт
+    events = report.events
+    report = simulation.run(3)
+    assert report.events == events
+    assert report.delivered == 8 * 5
+
+
+def test_simulation_validates_configuration():
+    factory, _ = make_factory(machines=1)
+    with pytest.raises(TruckSizeError):
+        FactorySimulation(factory, make_warehouse(), [DeliveryTruck()]).run(1)
+
+    factory, _ = make_factory(machines=1)
+    factory.factory_export = None
+    with pytest.raises(MissingAttributeError):
+        FactorySimulation(factory, make_warehouse(), []).run(1)
+
+    factory, line = make_factory(machines=1)
+    line.machine_list[0].instruction = None
+    with pytest.raises(MissingAttributeError):
+        FactorySimulation(factory, make_warehouse(), []).run(1)
+
+    factory, _ = make_factory(machines=1, maintenance=False)
+    with pytest.raises(MissingAttributeError):
+        FactorySimulation(factory, make_warehouse(), []).run(1)
+
+    with pytest.raises(WrongDefectChanceError):
+        FactorySimulation(factory, make_warehouse(), [], stop_threshold=1.5)
@@ -1,3 +1,6 @@
+import queue
+import threading
+
 import pytest
 
 from details.Detail import Detail
@@ -13,7 +16,10 @@ from manufactoring.FactoryImport import FactoryImport
 from materials.Steel import Steel
 from warehouse.DeliveryTruk import DeliveryTruck
 from warehouse.DetailStorageCell import DetailStorageCell
+from warehouse.ExportQueue import ExportQueue
 from warehouse.MaterialStorageCell import MaterialStorageCell
+from warehouse.ThreadSafeExportQueue import ThreadSafeExportQueue
+from warehouse.TransferQueue import TransferQueue
 from warehouse.Warehouse import Warehouse
 from warehouse.WarehouseExport import WarehouseExport
 from warehouse.WarehouseImport import WarehouseImport
@@ -139,3 +145,70 @@ def test_delivery_truck_unloading_paths():
     truck.unload_to_factory(factory_stub)
     assert factory_stub.factory_import.queue != []
     assert truck.baggage == []
+
+
+def test_transfer_queues_keep_fifo_order_and_list_semantics():
+    importer = WarehouseImport("factory")
+    importer.queue = [Detail(0.0) for _ in range(3)]
+    assert isinstance(importer.queue, TransferQueue)
+    first, second, third = importer.queue
+
+    cell = DetailStorageCell("det-1", size=3)
+    importer.send_to_details(cell, amount=2)
+    assert cell.storage == [first, second]
+    assert importer.queue == [third]
+
+    with pytest.raises(IndexError):
+        cell.storage.take(3)
+    assert len(cell.storage) == 2
+
+    factory_import = FactoryImport("import-1")
+    factory_import.queue.extend(cell.storage.take_all())
+    assert cell.storage == []
+    assert factory_import.queue != []
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_export_queue_backends(threaded):
+    export = WarehouseExport("factory", threaded=threaded)
+    assert isinstance(export.queue, ThreadSafeExportQueue if threaded else ExportQueue)
+
+    details = [Detail(0.0) for _ in range(5)]
+    export.queue.put_many(details[:4])
+    export.queue.put(details[4])
+    assert export.queue.qsize() == 5
+
+    truck = DeliveryTruck()
+    export.load_truck(truck, amount=3)
+    assert truck.baggage == details[:3]
+    assert export.queue.get_many(10) == details[3:]
+    assert export.queue.empty()
+    assert export.queue.get_many(1) == []
+
+    factory_export = FactoryExport("exp-1", threaded=threaded)
+    factory_export.queue.put_many(details)
+    truck = DeliveryTruck()
+    truck.size = 4
+    factory_export.load_truck(truck)
+    assert truck.baggage == details[:4]
+    assert factory_export.queue.qsize() == 1
+
+
+def test_deque_export_queue_get_on_empty_raises():
+    with pytest.raises(queue.Empty):
+        ExportQueue().get()
+
+
+def test_thread_safe_export_queue_with_producers():
+    export_queue = ThreadSafeExportQueue()
+    batches = [[(t, i) for i in range(100)] for t in range(4)]
+    threads = [threading.Thread(target=export_queue.put_many, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    items = export_queue.get_many(1000)
+    assert sorted(items) == sorted(item for batch in batches for item in batch)
+    for t in range(4):
+        assert [item for item in items if item[0] == t] == batches[t]
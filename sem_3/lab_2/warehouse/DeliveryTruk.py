@@ -22,8 +22,7 @@ class DeliveryTruck:
         else:
             raise ImportDirectionError(direction)
 
-        for item in self.baggage:
-            target_import.queue.append(item)
+        target_import.queue.extend(self.baggage)
 
         self.baggage.clear()
 
@@ -32,8 +31,7 @@ class DeliveryTruck:
             raise NoImportModuleError("У фабрики нет import модуля!")
 
         # Выгружаем в фабричный импорт
-        for item in self.baggage:
-            factory.factory_import.queue.append(item)
+        factory.factory_import.queue.extend(self.baggage)
 
         # Очищаем грузовик
         self.baggage.clear()
@@ -0,0 +1,29 @@
+from queue import Empty
+
+from warehouse.TransferQueue import TransferQueue
+
+
+# Однопоточная очередь экспорта: интерфейс queue.Queue (put/get/qsize/empty)
+# без блокировок, плюс пакетные put_many/get_many для погрузки грузовиков.
+class ExportQueue(TransferQueue):
+    def put(self, item):
+        self.append(item)
+
+    def put_many(self, items):
+        self.extend(items)
+
+    def get(self):
+        # ждать некому: пустая очередь — сразу queue.Empty, как get_nowait()
+        if not self:
+            raise Empty
+        return self.popleft()
+
+    def get_many(self, amount: int) -> list:
+        # не больше amount элементов, сколько есть
+        return self.take(min(amount, len(self)))
+
+    def qsize(self) -> int:
+        return len(self)
+
+    def empty(self) -> bool:
+        return not self
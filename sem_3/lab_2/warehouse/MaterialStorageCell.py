@@ -1,14 +1,16 @@
-from materials.Material import Material
 from exceptions.StorageOverflowError import StorageOverflowError
 from exceptions.InsufficientMaterialsError import InsufficientMaterialsError
+from warehouse.TransferQueue import TransferQueue, TransferQueueAttribute
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from warehouse.WarehouseExport import WarehouseExport
 
 class MaterialStorageCell:
+    storage = TransferQueueAttribute()
+
     def __init__(self, storage_cell_id:str, size:int):
-        self.storage: list[Material] = []
+        self.storage: TransferQueue = TransferQueue()
         self.storage_cell_id = storage_cell_id
         self.size = size
 
@@ -23,9 +25,7 @@ class MaterialStorageCell:
                 f"Requested {amount} items but storage '{self.storage_cell_id}' contains only {len(self.storage)}"
             )
 
-        for _ in range(amount):
-            warehouse_export.queue.put(self.storage.pop(0))
+        warehouse_export.queue.put_many(self.storage.take(amount))
 
     def send_all_to_export(self, warehouse_export: "WarehouseExport"):
-        while self.storage:
-            warehouse_export.queue.put(self.storage.pop(0))
\ No newline at end of file
+        warehouse_export.queue.put_many(self.storage.take_all())
\ No newline at end of file
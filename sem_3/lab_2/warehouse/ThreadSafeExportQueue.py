@@ -0,0 +1,27 @@
+from queue import Queue
+
+
+# Потокобезопасная очередь экспорта для многопоточной работы фабрики:
+# queue.Queue с пакетными put_many/get_many под одним захватом блокировки.
+class ThreadSafeExportQueue(Queue):
+    def put_many(self, items):
+        if self.maxsize > 0:
+            # ограниченная очередь: ждать места нужно поэлементно
+            for item in items:
+                self.put(item)
+            return
+        with self.not_empty:
+            count = 0
+            for item in items:
+                self._put(item)
+                count += 1
+            self.unfinished_tasks += count
+            self.not_empty.notify(count)
+
+    def get_many(self, amount: int) -> list:
+        # не блокирует: не больше amount элементов, сколько есть
+        with self.not_empty:
+            items = [self._get() for _ in range(min(amount, self._qsize()))]
+            if items:
+                self.not_full.notify(len(items))
+            return items
@@ -0,0 +1,44 @@
+from collections import deque
+
+
+# Очередь передачи (FIFO) на deque: забор с начала за O(1), а не за O(n),
+# как list.pop(0). Сравнивается со списками поэлементно, как прежние списки.
+class TransferQueue(deque):
+    def take(self, amount: int) -> list:
+        # снимает amount элементов с начала; если их меньше — IndexError,
+        # очередь при этом не меняется
+        if amount > len(self):
+            raise IndexError("take from a queue with too few items")
+        popleft = self.popleft
+        return [popleft() for _ in range(amount)]
+
+    def take_all(self) -> list:
+        items = list(self)
+        self.clear()
+        return items
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, deque)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+
+# Атрибут-очередь: присвоенный список (или другой iterable) оборачивается
+# в TransferQueue, так что `obj.queue = [...]` продолжает работать.
+class TransferQueueAttribute:
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.__dict__[self.name]
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value if isinstance(value, TransferQueue) else TransferQueue(value)
@@ -8,13 +8,13 @@ from warehouse.WarehouseImport import WarehouseImport
 
 class Warehouse:
     def __init__(self, delivery_truck:DeliveryTruck, materials:MaterialStorageCell, details:DetailStorageCell,
-                 address:str, security:list[Security]):
+                 address:str, security:list[Security], threaded: bool = False):
         self.delivery_truck:DeliveryTruck|None = delivery_truck
         self.materials:MaterialStorageCell|None = materials
         self.details:DetailStorageCell|None = details
         self.address:str = address
         self.security:list[Security] = security
-        self.export_for_sale:WarehouseExport = WarehouseExport('export')
-        self.export_to_factory:WarehouseExport = WarehouseExport('factory')
+        self.export_for_sale:WarehouseExport = WarehouseExport('export', threaded)
+        self.export_to_factory:WarehouseExport = WarehouseExport('factory', threaded)
         self.import_from_factory:WarehouseImport = WarehouseImport('factory')
         self.import_from_supplier:WarehouseImport = WarehouseImport('supplier')
\ No newline at end of file
@@ -1,19 +1,20 @@
-from queue import Queue
 import uuid
 from exceptions.ExportDirectionError import ExportDirectionError
 from exceptions.NotEnoughItemsForTruckError import NotEnoughItemsForTruckError
 from warehouse.DeliveryTruk import DeliveryTruck
+from warehouse.ExportQueue import ExportQueue
+from warehouse.ThreadSafeExportQueue import ThreadSafeExportQueue
 
 
 class WarehouseExport:
-    def __init__(self, direction: str):
+    def __init__(self, direction: str, threaded: bool = False):
         if direction != 'factory' and direction != 'export':
             raise ExportDirectionError(direction)
         else:
             self.direction = direction
 
         self.export_id = uuid.uuid4()
-        self.queue = Queue()
+        self.queue: ExportQueue | ThreadSafeExportQueue = ThreadSafeExportQueue() if threaded else ExportQueue()
 
     def set_direction(self, direction: str):
         if direction != 'factory' and direction != 'export':
@@ -27,8 +28,7 @@ class WarehouseExport:
                 f"Requested {amount} items, but only {self.queue.qsize()} available"
             )
 
-        for _ in range(amount):
-            truck.baggage.append(self.queue.get())
+        truck.baggage.extend(self.queue.get_many(amount))
 
     def send_trucks_to_factory(self, factory, trucks_count: int, load_per_truck: int):
         for _ in range(trucks_count):
@@ -5,15 +5,18 @@ from exceptions.InsufficientMaterialsError import InsufficientMaterialsError
 from exceptions.InsufficientDetailsError import InsufficientDetailsError
 from materials.Material import Material
 from details.Detail import Detail
+from warehouse.TransferQueue import TransferQueue, TransferQueueAttribute
 
 class WarehouseImport:
+    queue = TransferQueueAttribute()
+
     def __init__(self, direction:str):
         if direction!='factory' and direction!='supplier':
             raise ImportDirectionError(direction)
         else:
             self.direction = direction
         self.import_id = uuid.uuid4()
-        self.queue:list = []
+        self.queue: TransferQueue = TransferQueue()
 
     def set_direction(self, direction:str):
         if direction!='factory' and direction!='export':
@@ -29,7 +32,7 @@ class WarehouseImport:
             )
 
         for _ in range(amount):
-            item = self.queue.pop(0)
+            item = self.queue.popleft()
             if not isinstance(item, Material):
                 raise TypeError("WarehouseImport contains non-Material item where Material expected")
             material_storage.append(item)
@@ -39,7 +42,7 @@ class WarehouseImport:
             item = self.queue[0]
             if not isinstance(item, Material):
                 raise TypeError("WarehouseImport contains non-Material item where Material expected")
-            material_storage.append(self.queue.pop(0))
+            material_storage.append(self.queue.popleft())
 
     def send_to_details(self, detail_storage, amount: int):
         if amount > len(self.queue):
@@ -48,7 +51,7 @@ class WarehouseImport:
             )
 
         for _ in range(amount):
-            item = self.queue.pop(0)
+            item = self.queue.popleft()
             if not isinstance(item, Detail):
                 raise TypeError("WarehouseImport contains non-Detail item where Detail expected")
             detail_storage.append(item)
@@ -58,4 +61,4 @@ class WarehouseImport:
             item = self.queue[0]
             if not isinstance(item, Detail):
                 raise TypeError("WarehouseImport contains non-Detail item where Detail expected")
-            detail_storage.append(self.queue.pop(0))
\ No newline at end of file
+            detail_storage.append(self.queue.popleft())
\ No newline at end of file
@@ -0,0 +1,49 @@
+import argparse
+import json
+import sys
+
+from benchmarks.suite import cases, measure, metadata, compare
+
+# python -m benchmarks [--full] [--filter graph/add_edge] [--output results.json]
+#                      [--baseline old.json --threshold 0.2]
+# Код возврата 1, если по сравнению с baseline найдены регрессии.
+DEFAULT_SIZES = [1_000, 10_000]
+FULL_SIZES = [1_000, 10_000, 100_000]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", help="input sizes (default: 1000 10000)")
+    parser.add_argument("--full", action="store_true", help="also run 100000-element inputs")
+    parser.add_argument("--filter", default="", help="run only cases whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best one is kept")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write JSON results")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    results = {"meta": metadata(), "results": {}}
+    for name, prepare, kind, n in cases(sizes, args.filter):
+        result = measure(prepare, kind, n, args.repeat)
+        results["results"][name] = result
+        print(f"{name:<52} {result['seconds']:10.4f} s {result['peak_bytes'] / 2 ** 20:10.2f} MiB", flush=True)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import random
+import sys
+import time
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.algorithms import bfs, dfs, topological_sort, strongly_connected_components, dijkstra
+
+
+def random_graph(n: int, avg_degree: int = 5, dag: bool = False, seed: int = 0) -> DirectedGraphIncidence[int]:
+    rng = random.Random(seed)
+    edges = set()
+    while len(edges) < n * avg_degree:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if dag:
+            if u == v:
+                continue
+            u, v = min(u, v), max(u, v)
+        edges.add((u, v))
+    return DirectedGraphIncidence[int].from_edge_list(list(edges), vertices=range(n))
+
+
+def timed(name: str, func, *args, **kwargs) -> None:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    print(f"  {name:<32} {time.perf_counter() - start:.3f} s")
+
+
+def main(n: int = 100_000) -> None:
+    g = random_graph(n)
+    dag = random_graph(n, dag=True)
+    print(f"vertices: {n}, edges: {g.edge_count()}")
+    timed("bfs", bfs, g, 0)
+    timed("dfs", dfs, g, 0)
+    timed("topological_sort (dag)", topological_sort, dag)
+    timed("strongly_connected_components", strongly_connected_components, g)
+    timed("dijkstra (unit weights)", dijkstra, g, 0)
+    timed("dijkstra (weighted)", dijkstra, g, 0, weight=lambda u, v: (u * 31 + v) % 17 + 1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
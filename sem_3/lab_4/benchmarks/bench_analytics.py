@@ -0,0 +1,25 @@
+import os
+import sys
+import time
+
+from graph.GraphAnalytics import GraphAnalytics
+from benchmarks.bench_algorithms import random_graph
+
+
+def main(n: int = 200_000) -> None:
+    frozen = random_graph(n).freeze()
+    print(f"vertices: {n}, edges: {len(frozen.indices)}, cpus: {os.cpu_count()}")
+    metrics = ("degree_histogram", "weakly_connected_components", "pagerank", "triangle_count")
+    baseline = {}
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        with GraphAnalytics(frozen, workers=workers) as analytics:
+            for metric in metrics:
+                start = time.perf_counter()
+                getattr(analytics, metric)()
+                elapsed = time.perf_counter() - start
+                baseline.setdefault(metric, elapsed)
+                print(f"  workers={workers:<3} {metric:<28} {elapsed:.3f} s  x{baseline[metric] / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,41 @@
+import random
+import sys
+import time
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+
+
+def random_edges(n_vertices: int, n_edges: int, seed: int = 0) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    edges = set()
+    while len(edges) < n_edges:
+        edges.add((rng.randrange(n_vertices), rng.randrange(n_vertices)))
+    return list(edges)
+
+
+def one_by_one(n_vertices: int, edges: list[tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    g = DirectedGraphIncidence[int]()
+    for v in range(n_vertices):
+        g.add_vertex(v)
+    for u, v in edges:
+        g.add_edge(u, v)
+    return time.perf_counter() - start
+
+
+def bulk(n_vertices: int, edges: list[tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    DirectedGraphIncidence[int].from_edge_list(edges, vertices=range(n_vertices))
+    return time.perf_counter() - start
+
+
+def main(n_edges: int = 1_000_000) -> None:
+    n_vertices = n_edges // 10
+    edges = random_edges(n_vertices, n_edges)
+    print(f"vertices: {n_vertices}, edges: {n_edges}")
+    print(f"  add_vertex/add_edge: {one_by_one(n_vertices, edges):.3f} s")
+    print(f"  from_edge_list:      {bulk(n_vertices, edges):.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
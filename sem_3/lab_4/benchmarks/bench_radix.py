@@ -0,0 +1,47 @@
+import random
+import sys
+import time
+
+import numpy as np
+
+from sort.RadixSort import RadixSort, lsd_argsort
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def bench_ints(n: int, bound: int, rng: random.Random) -> None:
+    values = [rng.randrange(bound) for _ in range(n)]
+    keys = np.array(values, dtype=np.int64)
+    lsd = timed(RadixSort().lsd_radix_sort, values.copy())
+    builtin = timed(sorted, values)
+    lsd_array = timed(lsd_argsort, keys)
+    numpy_stable = timed(np.argsort, keys, kind="stable")
+    print(f"  ints n={n:<9} < {bound:<14} lsd {lsd:7.3f}s  sorted {builtin:7.3f}s"
+          f"  | arrays: lsd_argsort {lsd_array:7.3f}s  np.argsort {numpy_stable:7.3f}s")
+
+
+def bench_strings(n: int, prefix: str, rng: random.Random) -> None:
+    words = [prefix + "".join(rng.choice("abcdefgh") for _ in range(rng.randrange(4, 12))) for _ in range(n)]
+    msd = timed(RadixSort().msd_radix_sort, words.copy())
+    builtin = timed(sorted, words)
+    print(f"  strs n={n:<9} prefix={len(prefix):<4} msd {msd:7.3f}s  sorted {builtin:7.3f}s")
+
+
+def main(scale: int = 7) -> None:
+    rng = random.Random(0)
+    for exponent in range(5, scale + 1):
+        n = 10 ** exponent
+        bench_ints(n, 2 ** 16, rng)
+        bench_ints(n, 2 ** 62, rng)
+    for exponent in range(4, min(scale, 6) + 1):
+        n = 10 ** exponent
+        bench_strings(n, "", rng)
+        bench_strings(n, "common/" * 16, rng)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
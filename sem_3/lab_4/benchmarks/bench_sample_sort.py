@@ -0,0 +1,33 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from sort.SampleSort import SampleSort
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(n: int = 10_000_000) -> None:
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 2 ** 62, n)
+    values = rng.integers(0, 2 ** 31, n // 10).tolist()
+    print(f"keys: {n} int64 array, {len(values)} Python ints; cpus: {os.cpu_count()}")
+    base_array = base_list = None
+    for workers in (1, 2, 4, 8, 16):
+        sorter = SampleSort(workers=workers)
+        array_time = timed(sorter.sample_sort, keys)
+        list_time = timed(sorter.sample_sort, values.copy())
+        base_array = base_array or array_time
+        base_list = base_list or list_time
+        print(f"  workers={workers:<3} array {array_time:7.3f}s x{base_array / array_time:5.2f}"
+              f"   list {list_time:7.3f}s x{base_list / list_time:5.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
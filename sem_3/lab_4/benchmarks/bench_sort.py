@@ -0,0 +1,58 @@
+import random
+import sys
+import time
+
+from sort.ExampleClass import ExampleClass
+from sort.GnomeSort import GnomeSort
+from sort.MergeSort import MergeSort
+from sort.IntroSort import IntroSort
+from benchmarks.generators import GNOME_LIMIT
+
+
+def make_input(kind: str, n: int, seed: int = 0) -> list[ExampleClass]:
+    rng = random.Random(seed)
+    if kind == "random":
+        values = [rng.randrange(n) for _ in range(n)]
+    elif kind == "nearly_sorted":
+        values = list(range(n))
+        for _ in range(max(1, n // 100)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            values[i], values[j] = values[j], values[i]
+    else:
+        values = list(range(n, 0, -1))
+    return [ExampleClass(v) for v in values]
+
+
+def value(x: ExampleClass):
+    return x.value
+
+
+SORTERS = {
+    "gnome": lambda arr: GnomeSort().gnome_sort(arr),
+    "merge": lambda arr: MergeSort().merge_sort(arr, key=value),
+    "intro": lambda arr: IntroSort().intro_sort(arr, key=value),
+    "sorted": lambda arr: sorted(arr, key=value),
+}
+
+
+def main(sizes: list[int]) -> None:
+    for kind in ("random", "nearly_sorted", "reversed"):
+        print(kind)
+        for n in sizes:
+            data = make_input(kind, n)
+            expected = sorted(data, key=value)
+            line = [f"  n={n:<9}"]
+            for name, sorter in SORTERS.items():
+                if name == "gnome" and n > GNOME_LIMIT:
+                    line.append(f"{name} {'-':>8}")
+                    continue
+                start = time.perf_counter()
+                result = sorter(data.copy())
+                elapsed = time.perf_counter() - start
+                assert result == expected
+                line.append(f"{name} {elapsed:8.3f}s")
+            print("  ".join(line))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
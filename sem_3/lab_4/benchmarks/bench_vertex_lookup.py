@@ -0,0 +1,40 @@
+import sys
+import time
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.exceptions import VertexNotExistsError
+
+
+class LinearLookupGraph(DirectedGraphIncidence):
+    # поиск вершины так, как он был сделан до появления индекса
+    def _get_vertex_id(self, value) -> int:
+        try:
+            return self._vertices.index(value)
+        except ValueError:
+            raise VertexNotExistsError(f"Vertex {value} not in graph")
+
+    def has_vertex(self, value) -> bool:
+        return value in self._vertices
+
+
+def build(graph_cls, n: int) -> float:
+    g = graph_cls()
+    start = time.perf_counter()
+    for i in range(n):
+        g.add_vertex(i)
+    for i in range(0, n, max(1, n // 100)):
+        g.has_vertex(i)
+    return time.perf_counter() - start
+
+
+def main(n: int = 100_000) -> None:
+    indexed = build(DirectedGraphIncidence, n)
+    linear = build(LinearLookupGraph, n)
+    print(f"vertices: {n}")
+    print(f"  linear lookup:  {linear:.3f} s")
+    print(f"  indexed lookup: {indexed:.3f} s")
+    print(f"  speedup:        {linear / indexed:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,83 @@
+import random
+
+from sort.ExampleClass import ExampleClass
+
+# Воспроизводимые входные данные: всё определяется размером и seed.
+
+
+def random_graph_edges(n: int, avg_degree: int = 5, seed: int = 0) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    edges = set()
+    target = min(n * avg_degree, n * n)
+    while len(edges) < target:
+        edges.add((rng.randrange(n), rng.randrange(n)))
+    return sorted(edges)
+
+
+def power_law_edges(n: int, m: int = 3, seed: int = 0) -> list[tuple[int, int]]:
+    # предпочтительное присоединение (Барабаши — Альберт): новая вершина
+    # получает m дуг от уже существующих, выбранных с вероятностью,
+    # пропорциональной степени; дуги идут от старых вершин к новым
+    rng = random.Random(seed)
+    edges = []
+    targets = list(range(min(m, n)))
+    repeated: list[int] = []
+    for v in range(len(targets), n):
+        chosen = set(targets)
+        edges.extend((u, v) for u in chosen)
+        repeated.extend(chosen)
+        repeated.extend([v] * len(chosen))
+        targets = set()
+        while len(targets) < min(m, v + 1):
+            targets.add(rng.choice(repeated))
+        targets = list(targets)
+    return edges
+
+
+def grid_edges(n: int) -> list[tuple[int, int]]:
+    # решётка side×side (side = ⌊√n⌋), дуги вправо и вниз
+    side = max(1, int(n ** 0.5))
+    edges = []
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            if col + 1 < side:
+                edges.append((v, v + 1))
+            if row + 1 < side:
+                edges.append((v, v + side))
+    return edges
+
+
+GRAPHS = {
+    "random": random_graph_edges,
+    "power_law": power_law_edges,
+    "grid": grid_edges,
+}
+
+
+def random_values(n: int, seed: int = 0) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def sorted_values(n: int, seed: int = 0) -> list[int]:
+    return list(range(n))
+
+
+def duplicate_values(n: int, seed: int = 0) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(10) for _ in range(n)]
+
+
+ARRAYS = {
+    "random": random_values,
+    "sorted": sorted_values,
+    "duplicates": duplicate_values,
+}
+
+# GnomeSort квадратичная: на входах больше этого размера не запускается
+GNOME_LIMIT = 2_000
+
+
+def records(values: list[int]) -> list[ExampleClass]:
+    return [ExampleClass(v) for v in values]
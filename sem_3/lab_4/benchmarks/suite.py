@@ -0,0 +1,283 @@
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.algorithms import bfs, dfs, strongly_connected_components, dijkstra
+from sort.GnomeSort import GnomeSort
+from sort.PigeonholeSort import PigeonholeSort
+from sort.MergeSort import MergeSort
+from sort.IntroSort import IntroSort
+from sort.RadixSort import RadixSort
+from sort.SampleSort import SampleSort
+from sort.ExternalSort import ExternalSort
+from benchmarks.generators import GRAPHS, ARRAYS, GNOME_LIMIT, records
+
+# Случай — функция (вид входа, размер) -> функция без аргументов, которая и
+# замеряется. Подготовка входа в замер не входит и повторяется перед каждым
+# прогоном, поэтому изменяющие граф операции получают свежую копию. Если у
+# функции есть атрибут cleanup, он вызывается после прогона (вне замера).
+Prepare = Callable[[str, int], Callable[[], object]]
+
+
+def _graph(kind: str, n: int) -> DirectedGraphIncidence[int]:
+    return DirectedGraphIncidence[int].from_edge_list(GRAPHS[kind](n))
+
+
+def _every(values: list, part: int) -> list:
+    return values[::max(1, len(values) // part)]
+
+
+def _from_edge_list(kind, n):
+    edges = GRAPHS[kind](n)
+    return lambda: DirectedGraphIncidence[int].from_edge_list(edges)
+
+
+def _add_vertex(kind, n):
+    g = DirectedGraphIncidence[int]()
+    return lambda: [g.add_vertex(v) for v in range(n)]
+
+
+def _add_edge(kind, n):
+    edges = GRAPHS[kind](n)
+    g = DirectedGraphIncidence[int]()
+    g.add_vertices_from({v: None for edge in edges for v in edge})
+    return lambda: [g.add_edge(u, v) for u, v in edges]
+
+
+def _has_vertex(kind, n):
+    g = _graph(kind, n)
+    values = list(g.begin_vertices())
+    return lambda: [g.has_vertex(v) for v in values]
+
+
+def _has_edge(kind, n):
+    g = _graph(kind, n)
+    edges = list(g.begin_edges())
+    return lambda: [g.has_edge(u, v) for u, v in edges]
+
+
+def _degrees(kind, n):
+    g = _graph(kind, n)
+    values = list(g.begin_vertices())
+    return lambda: [g.in_degree(v) + g.out_degree(v) for v in values]
+
+
+def _iterate_vertices_edges(kind, n):
+    g = _graph(kind, n)
+    return lambda: (list(g.begin_vertices()), list(g.rbegin_edges()))
+
+
+def _iterate_incident_adjacent(kind, n):
+    g = _graph(kind, n)
+    values = list(g.begin_vertices())
+    return lambda: [(list(g.begin_incident_edges(v)), list(g.begin_adjacent_vertices(v))) for v in values]
+
+
+def _remove_edge(kind, n):
+    g = _graph(kind, n)
+    edges = _every(list(g.begin_edges()), 10)
+    return lambda: [g.remove_edge(u, v) for u, v in edges]
+
+
+def _remove_vertex(kind, n):
+    g = _graph(kind, n)
+    values = _every(list(g.begin_vertices()), 10)
+    return lambda: [g.remove_vertex(v) for v in values]
+
+
+def _remove_vertices(kind, n):
+    g = _graph(kind, n)
+    values = _every(list(g.begin_vertices()), 10)
+    return lambda: g.remove_vertices(values)
+
+
+def _fork_and_mutate(kind, n):
+    g = _graph(kind, n)
+
+    def run():
+        fork = g.fork()
+        fork.add_vertex(-1)
+        return fork
+    return run
+
+
+def _fork_and_change_edges(kind, n):
+    # правка дуг копии копирует только затронутые куски столбцов и слой
+    # изменений словаря номеров, а не хранилище целиком — это проверяется
+    # прямо по внутренностям, пик памяти показывает то же в отчёте
+    g = _graph(kind, n)
+    g.add_edge_attribute("weight", 1.0)
+    (a, b), (c, d) = _every(list(g.begin_edges()), 2)[:2]
+
+    def run():
+        fork = g.fork()
+        fork.set_edge_weight(a, b, -1.0)
+        fork.remove_edge(c, d)
+        fork.add_vertex(-1)
+        fork.add_edge(-1, a)
+        assert fork._edges._base is g._edges and len(fork._edges._dirty) <= 3
+        assert fork._edge_columns["weight"]._base is g._edge_columns["weight"]
+        assert len(fork._edge_ids._changes) <= 3 and len(fork._vertex_ids._changes) == 1
+        return fork
+    return run
+
+
+def _freeze(kind, n):
+    g = _graph(kind, n)
+    return g.freeze
+
+
+def _save_load(kind, n):
+    g = _graph(kind, n)
+    directory = tempfile.TemporaryDirectory(prefix="bench-")
+    path = os.path.join(directory.name, "graph.dgig")
+
+    def run():
+        g.save(path)
+        DirectedGraphIncidence.load(path)
+    run.cleanup = directory.cleanup
+    return run
+
+
+def _fingerprint_eq(kind, n):
+    g, h = _graph(kind, n), _graph(kind, n)
+    return lambda: g == h
+
+
+def _bfs_dfs(kind, n):
+    g = _graph(kind, n)
+    return lambda: (bfs(g, 0), dfs(g, 0))
+
+
+def _scc(kind, n):
+    g = _graph(kind, n)
+    return lambda: strongly_connected_components(g)
+
+
+def _dijkstra(kind, n):
+    g = _graph(kind, n)
+    return lambda: dijkstra(g, 0)
+
+
+GRAPH_CASES: dict[str, Prepare] = {
+    "from_edge_list": _from_edge_list,
+    "add_vertex": _add_vertex,
+    "add_edge": _add_edge,
+    "has_vertex": _has_vertex,
+    "has_edge": _has_edge,
+    "degrees": _degrees,
+    "iterate_vertices_edges": _iterate_vertices_edges,
+    "iterate_incident_adjacent": _iterate_incident_adjacent,
+    "remove_edge": _remove_edge,
+    "remove_vertex": _remove_vertex,
+    "remove_vertices": _remove_vertices,
+    "fork_and_mutate": _fork_and_mutate,
+    "fork_and_change_edges": _fork_and_change_edges,
+    "freeze": _freeze,
+    "save_load": _save_load,
+    "equality": _fingerprint_eq,
+    "bfs_dfs": _bfs_dfs,
+    "scc": _scc,
+    "dijkstra": _dijkstra,
+}
+
+
+def _value(x):
+    return x.value
+
+
+def _sorter(sort: Callable[[list], object]) -> Prepare:
+    def prepare(kind, n):
+        data = records(ARRAYS[kind](n))
+        return lambda: sort(data)
+    return prepare
+
+
+SORT_CASES: dict[str, Prepare] = {
+    "gnome": _sorter(lambda data: GnomeSort().gnome_sort(data)),
+    "pigeonhole": _sorter(lambda data: PigeonholeSort().pigeonhole_sort(data)),
+    "merge": _sorter(lambda data: MergeSort().merge_sort(data, key=_value)),
+    "intro": _sorter(lambda data: IntroSort().intro_sort(data, key=_value)),
+    "radix": _sorter(lambda data: RadixSort().radix_sort(data, key=_value)),
+    "sample": _sorter(lambda data: SampleSort().sample_sort(data, key=_value)),
+    "external": _sorter(lambda data: list(ExternalSort(memory_budget=2 ** 20).external_sort(data, key=_value))),
+    "sorted": _sorter(lambda data: sorted(data, key=_value)),
+}
+
+
+def cases(sizes: list[int], pattern: str = ""):
+    # (имя, подготовка, вид, размер); имя — "группа/операция/вид/размер"
+    for group, table, kinds in (("graph", GRAPH_CASES, GRAPHS), ("sort", SORT_CASES, ARRAYS)):
+        for operation, prepare in table.items():
+            for kind in kinds:
+                for n in sizes:
+                    if operation == "gnome" and n > GNOME_LIMIT:
+                        continue
+                    name = f"{group}/{operation}/{kind}/{n}"
+                    if pattern in name:
+                        yield name, prepare, kind, n
+
+
+def measure(prepare: Prepare, kind: str, n: int, repeat: int) -> dict:
+    # время — лучший из repeat прогонов без трассировки; пик памяти — отдельный
+    # прогон под tracemalloc (учитываются только выделения внутри операции)
+    best = float("inf")
+    for _ in range(repeat):
+        run = prepare(kind, n)
+        try:
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            _cleanup(run)
+    run = prepare(kind, n)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        _cleanup(run)
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def _cleanup(run) -> None:
+    cleanup = getattr(run, "cleanup", None)
+    if cleanup is not None:
+        cleanup()
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_seconds: float = 1e-3) -> list[str]:
+    # регрессия — рост времени или пика памяти больше чем на threshold;
+    # совсем короткие замеры по времени не сравниваются (шум)
+    regressions = []
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        if new["seconds"] > old["seconds"] * (1 + threshold) and new["seconds"] - old["seconds"] > min_seconds:
+            regressions.append(f"{name}: time {old['seconds']:.4f}s -> {new['seconds']:.4f}s")
+        if new["peak_bytes"] > old["peak_bytes"] * (1 + threshold) and new["peak_bytes"] - old["peak_bytes"] > 4096:
+            regressions.append(f"{name}: peak memory {old['peak_bytes']} -> {new['peak_bytes']} bytes")
+    return regressions
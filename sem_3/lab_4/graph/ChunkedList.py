@@ -0,0 +1,97 @@
+from collections.abc import Sequence
+from itertools import chain
+
+_CHUNK_BITS = 10
+_CHUNK = 1 << _CHUNK_BITS
+_MASK = _CHUNK - 1
+
+
+class ChunkedList[T](Sequence[T]):
+    # список с копированием при записи по кускам по _CHUNK элементов: база
+    # общая и не меняется, изменённые куски хранятся в _dirty. copy() — за
+    # O(числа изменённых кусков), запись в новый кусок копирует только его.
+    # База может быть list или array — куски получаются срезами того же типа
+    def __init__(self, base):
+        self._base = base
+        self._dirty: dict[int, object] = {}  # номер куска -> собственная копия
+        self._shared: set[int] = set()  # куски из _dirty, общие с другой копией
+        self._len = len(base)
+
+    def copy(self) -> "ChunkedList[T]":
+        other = object.__new__(ChunkedList)
+        other._base = self._base
+        other._dirty = self._dirty.copy()
+        other._len = self._len
+        self._shared = set(self._dirty)
+        other._shared = set(self._dirty)
+        return other
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        try:
+            if index < 0:
+                index += self._len
+            if not 0 <= index < self._len:
+                raise IndexError("ChunkedList index out of range")
+        except TypeError:
+            return self.flatten()[index]
+        chunk = self._dirty.get(index >> _CHUNK_BITS)
+        if chunk is None:
+            return self._base[index]
+        return chunk[index & _MASK]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._len))
+            if len(value) != len(positions):
+                raise ValueError("ChunkedList slice assignment must keep the length")
+            for i, item in zip(positions, value):
+                self[i] = item
+            return
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ChunkedList assignment index out of range")
+        self._own(index >> _CHUNK_BITS)[index & _MASK] = value
+
+    def append(self, value) -> None:
+        self._own(self._len >> _CHUNK_BITS).append(value)
+        self._len += 1
+
+    def extend(self, values) -> None:
+        for value in values:
+            self.append(value)
+
+    def pop(self):
+        if not self._len:
+            raise IndexError("pop from empty ChunkedList")
+        value = self._own((self._len - 1) >> _CHUNK_BITS).pop()
+        self._len -= 1
+        return value
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunk(c) for c in range((self._len + _MASK) >> _CHUNK_BITS))
+
+    def flatten(self):
+        # весь список одним объектом типа базы
+        result = self._base[:0]
+        for c in range((self._len + _MASK) >> _CHUNK_BITS):
+            result.extend(self._chunk(c))
+        return result
+
+    def _chunk(self, c: int):
+        chunk = self._dirty.get(c)
+        if chunk is None:
+            chunk = self._base[c << _CHUNK_BITS:min((c + 1) << _CHUNK_BITS, self._len)]
+        return chunk
+
+    def _own(self, c: int):
+        chunk = self._dirty.get(c)
+        if chunk is None or c in self._shared:
+            chunk = chunk[:] if chunk is not None else \
+                self._base[c << _CHUNK_BITS:min((c + 1) << _CHUNK_BITS, self._len)]
+            self._dirty[c] = chunk
+            self._shared.discard(c)
+        return chunk
@@ -1,7 +1,17 @@
+import hashlib
+import heapq
+import numbers
+import struct
+from array import array
+from collections import Counter
+from collections.abc import Iterable
 from copy import deepcopy
 
+from .ChunkedList import ChunkedList
+from .OverlayDict import OverlayDict
 from .iterators.BidirectionalIterator import BidirectionalIterator
 from .iterators.ConstBidirectionalIterator import ConstBidirectionalIterator
+from .iterators.views import GraphView, VertexView, EdgeView, IncidentEdgeView, AdjacentVertexView
 
 from .exceptions import (
     VertexNotExistsError,
@@ -12,33 +22,167 @@ from .exceptions import (
 
 
 class DirectedGraphIncidence[T]:
-    def __init__(self):
+    def __init__(self, multigraph: bool = False):
+        self._multigraph = multigraph
+        # вершины хранятся в слотах, номер слота (v_id) не меняется, пока вершина
+        # существует; слоты удалённых вершин помечены _TOMBSTONE и попадают в
+        # _free (куча, сначала занимаются младшие слоты)
         self._vertices: list[T] = []
+        self._vertex_ids: dict[T, int] = {}  # value -> v_id (только хешируемые значения)
+        self._serials: list[int] = []  # поколение вершины в слоте, 0 — слот свободен
+        self._next_serial = 1
+        self._order: list[int] = []  # слоты существующих вершин в порядке обхода
+        self._order_pos: list[int] = []  # позиция слота в _order, -1 — слот свободен
+        self._free: list[int] = []
+        self._in_degrees: list[int] = []  # число входящих дуг (с петлями); исходящие — len(_out_edges[v_id])
+        self._log: list[tuple[str, T | None, T | None]] | None = None
+        self._fingerprint: int | None = None  # считается при первом запросе, дальше обновляется
         self._edges: list[tuple[int, int]] = []
-        self._incidence: list[list[int]] = []  # incidence[v_id][e_id]
+        # (u, v) -> e_id; в мультиграфе — номер одной из параллельных дуг
+        self._edge_ids: dict[tuple[int, int], int] = {}
+        # числовые атрибуты дуг: по массиву array('d') на атрибут, индекс — e_id
+        self._edge_columns: dict[str, array] = {}
+        self._edge_defaults: dict[str, float] = {}
+        # разреженная матрица инцидентности: номера дуг, исходящих из вершины
+        # и входящих в неё (петли хранятся только среди исходящих)
+        self._out_edges: list[list[int]] = []
+        self._in_edges: list[list[int]] = []
+        self._version = 0  # увеличивается при каждом изменении графа
+        # копирование при записи: после fork() контейнеры и списки дуг
+        # общие с другим графом, пока один из них не начнёт изменяться
+        self._shared = False
+        # id() списков дуг, уже скопированных после fork(); None — все списки свои
+        self._own_buckets: set[int] | None = None
 
     def __deepcopy__(self, memo) -> "DirectedGraphIncidence[T]":
-        new_graph = DirectedGraphIncidence[T]()
+        new_graph = DirectedGraphIncidence[T](self._multigraph)
+        memo[id(_TOMBSTONE)] = _TOMBSTONE
         new_graph._vertices = deepcopy(self._vertices, memo)
+        new_graph._serials = self._serials.copy()
+        new_graph._next_serial = self._next_serial
+        new_graph._order = self._order.copy()
+        new_graph._order_pos = self._order_pos.copy()
+        new_graph._free = self._free.copy()
+        new_graph._in_degrees = self._in_degrees.copy()
+        new_graph._fingerprint = self._fingerprint
+        for v_id in new_graph._order:
+            new_graph._index_vertex(v_id)
         new_graph._edges = deepcopy(self._edges, memo)
-        new_graph._incidence = deepcopy(self._incidence, memo)
+        new_graph._edge_ids = self._edge_ids.copy()
+        new_graph._out_edges = [bucket.copy() for bucket in self._out_edges]
+        new_graph._in_edges = [bucket.copy() for bucket in self._in_edges]
+        new_graph._edge_columns = {name: column[:] for name, column in self._edge_columns.items()}
+        new_graph._edge_defaults = self._edge_defaults.copy()
         return new_graph
 
+    def fork(self) -> "DirectedGraphIncidence[T]":
+        # O(1): новый граф разделяет хранилище с исходным;
+        # значения вершин не копируются
+        new_graph = object.__new__(type(self))
+        new_graph.__dict__.update(self.__dict__)
+        new_graph._version = 0
+        new_graph._log = None
+        new_graph._shared = self._shared = True
+        return new_graph
+
+    __copy__ = fork
+
+    def _touch(self) -> None:
+        # вызывается перед каждым изменением графа
+        self._version += 1
+        if self._shared:
+            self._shared = False
+            self._vertices = self._vertices.copy()
+            self._vertex_ids = _cow(self._vertex_ids)
+            self._serials = self._serials.copy()
+            self._order = self._order.copy()
+            self._order_pos = self._order_pos.copy()
+            self._free = self._free.copy()
+            self._in_degrees = self._in_degrees.copy()
+            self._edges = _cow(self._edges)
+            self._edge_ids = _cow(self._edge_ids)
+            self._out_edges = self._out_edges.copy()
+            self._in_edges = self._in_edges.copy()
+            self._edge_columns = {name: _cow(column) for name, column in self._edge_columns.items()}
+            self._edge_defaults = self._edge_defaults.copy()
+            self._own_buckets = set()
+
+    def _out_bucket(self, v_id: int) -> list[int]:
+        bucket = self._out_edges[v_id]
+        own = self._own_buckets
+        if own is not None and id(bucket) not in own:
+            bucket = self._out_edges[v_id] = bucket.copy()
+            own.add(id(bucket))
+        return bucket
+
+    def _in_bucket(self, v_id: int) -> list[int]:
+        bucket = self._in_edges[v_id]
+        own = self._own_buckets
+        if own is not None and id(bucket) not in own:
+            bucket = self._in_edges[v_id] = bucket.copy()
+            own.add(id(bucket))
+        return bucket
+
     def clear(self) -> None:
-            self._vertices.clear()
-            self._edges.clear()
-            self._incidence.clear()
+            # хранилище может быть общим с fork(), поэтому не очищается на месте
+            # _next_serial не сбрасывается, чтобы старые дескрипторы оставались недействительными
+            self._vertices = []
+            self._vertex_ids = {}
+            self._serials = []
+            self._order = []
+            self._order_pos = []
+            self._free = []
+            self._in_degrees = []
+            self._edges = []
+            self._edge_ids = {}
+            self._out_edges = []
+            self._in_edges = []
+            self._edge_columns = {name: array("d") for name in self._edge_columns}
+            self._shared = False
+            self._own_buckets = None
+            self._version += 1
+            self._fingerprint = 0 if self._fingerprint is not None else None
+            self._log_mutation("clear")
 
     def __del__(self):
         self.clear()
 
     def empty(self) -> bool:
-        return len(self._vertices) == 0
+        return len(self._order) == 0
 
     def __eq__(self, other: "DirectedGraphIncidence") -> bool:
+        # сравниваются множество вершин и мультимножество дуг, порядок добавления не важен
         if not isinstance(other, DirectedGraphIncidence):
             return False
-        return self._vertices == other._vertices and self._edges == other._edges
+        if len(self._order) != len(other._order) or len(self._edges) != len(other._edges):
+            return False
+        if self.graph_fingerprint() != other.graph_fingerprint():
+            return False
+        other_ids = [-1] * len(self._vertices)
+        for v_id in self._order:
+            other_id = other._find_vertex_id(self._vertices[v_id])
+            if other_id is None:
+                return False
+            other_ids[v_id] = other_id
+        return Counter((other_ids[u], other_ids[v]) for u, v in self._edges) == Counter(other._edges)
+
+    def graph_fingerprint(self) -> int:
+        # 128-битная сумма хешей вершин и дуг по модулю 2**128: не зависит от
+        # порядка добавления и после первого вызова обновляется при каждом изменении.
+        # Хеши — blake2b от канонической записи значений, поэтому отпечаток
+        # одинаков в разных процессах (см. _encode_value)
+        if self._fingerprint is None:
+            encoded = [b""] * len(self._vertices)
+            for v_id in self._order:
+                encoded[v_id] = _encode_value(self._vertices[v_id])
+            fingerprint = sum(_digest(encoded[v_id], _VERTEX_PERSON) for v_id in self._order)
+            fingerprint += sum(_digest(_pair(encoded[u], encoded[v]), _EDGE_PERSON) for u, v in self._edges)
+            self._fingerprint = fingerprint & _FINGERPRINT_MASK
+        return self._fingerprint
+
+    def _update_fingerprint(self, delta: int) -> None:
+        if self._fingerprint is not None:
+            self._fingerprint = (self._fingerprint + delta) & _FINGERPRINT_MASK
 
     def __ne__(self, other: "DirectedGraphIncidence") -> bool:
         return not self.__eq__(other)
@@ -64,96 +208,60 @@ class DirectedGraphIncidence[T]:
         return len(self._edges) >= len(other._edges)
 
     def begin_vertices(self) -> BidirectionalIterator[T]:
-        return BidirectionalIterator(self._vertices)
+        return BidirectionalIterator(VertexView(self))
     
     def rbegin_vertices(self) -> BidirectionalIterator[T]:
-        return BidirectionalIterator(self._vertices, reverse=True)
+        return BidirectionalIterator(VertexView(self), reverse=True)
     
     def const_begin_vertices(self) -> BidirectionalIterator[T]:
-        return ConstBidirectionalIterator(self._vertices)
+        return ConstBidirectionalIterator(VertexView(self))
     
     def const_rbegin_vertices(self) -> BidirectionalIterator[T]:
-        return ConstBidirectionalIterator(self._vertices, reverse=True)
+        return ConstBidirectionalIterator(VertexView(self), reverse=True)
 
     def begin_edges(self) -> BidirectionalIterator[tuple[T, T]]:
-        edge_values = [(self._vertices[u], self._vertices[v]) for u, v in self._edges]
-        return BidirectionalIterator(edge_values)
+        return BidirectionalIterator(EdgeView(self))
     
     def rbegin_edges(self) -> BidirectionalIterator[tuple[T, T]]:
-        edge_values = [(self._vertices[u], self._vertices[v]) for u, v in self._edges]
-        return BidirectionalIterator(edge_values, reverse=True)
+        return BidirectionalIterator(EdgeView(self), reverse=True)
     
     def const_begin_edges(self) -> BidirectionalIterator[tuple[T, T]]:
-        edge_values = [(self._vertices[u], self._vertices[v]) for u, v in self._edges]
-        return ConstBidirectionalIterator(edge_values)
+        return ConstBidirectionalIterator(EdgeView(self))
     
     def const_rbegin_edges(self) -> BidirectionalIterator[tuple[T, T]]:
-        edge_values = [(self._vertices[u], self._vertices[v]) for u, v in self._edges]
-        return ConstBidirectionalIterator(edge_values, reverse=True)
+        return ConstBidirectionalIterator(EdgeView(self), reverse=True)
     
     def begin_incident_edges(self, vertex: T) -> BidirectionalIterator[tuple[T, T]]:
         v_id = self._get_vertex_id(vertex)
-        incident = []
-        for u, v in self._edges:
-            if u == v_id or v == v_id:
-                incident.append((self._vertices[u], self._vertices[v]))
-        return BidirectionalIterator(incident)
+        return BidirectionalIterator(IncidentEdgeView(self, v_id))
     
     def rbegin_incident_edges(self, vertex: T) -> BidirectionalIterator[tuple[T, T]]:
         v_id = self._get_vertex_id(vertex)
-        incident = []
-        for u, v in self._edges:
-            if u == v_id or v == v_id:
-                incident.append((self._vertices[u], self._vertices[v]))
-        return BidirectionalIterator(incident, reverse=True)
+        return BidirectionalIterator(IncidentEdgeView(self, v_id), reverse=True)
     
     def const_begin_incident_edges(self, vertex: T) -> BidirectionalIterator[tuple[T, T]]:
         v_id = self._get_vertex_id(vertex)
-        incident = []
-        for u, v in self._edges:
-            if u == v_id or v == v_id:
-                incident.append((self._vertices[u], self._vertices[v]))
-        return ConstBidirectionalIterator(incident)
+        return ConstBidirectionalIterator(IncidentEdgeView(self, v_id))
     
     def const_rbegin_incident_edges(self, vertex: T) -> BidirectionalIterator[tuple[T, T]]:
         v_id = self._get_vertex_id(vertex)
-        incident = []
-        for u, v in self._edges:
-            if u == v_id or v == v_id:
-                incident.append((self._vertices[u], self._vertices[v]))
-        return ConstBidirectionalIterator(incident, reverse=True)
+        return ConstBidirectionalIterator(IncidentEdgeView(self, v_id), reverse=True)
 
     def begin_adjacent_vertices(self, vertex: T) -> BidirectionalIterator[T]:
         v_id = self._get_vertex_id(vertex)
-        adjacent = []
-        for u, v in self._edges:
-            if u == v_id:
-                adjacent.append(self._vertices[v])
-        return BidirectionalIterator(adjacent)
+        return BidirectionalIterator(AdjacentVertexView(self, v_id))
     
     def rbegin_adjacent_vertices(self, vertex: T) -> BidirectionalIterator[T]:
         v_id = self._get_vertex_id(vertex)
-        adjacent = []
-        for u, v in self._edges:
-            if u == v_id:
-                adjacent.append(self._vertices[v])
-        return BidirectionalIterator(adjacent, reverse=True)
+        return BidirectionalIterator(AdjacentVertexView(self, v_id), reverse=True)
     
     def const_begin_adjacent_vertices(self, vertex: T) -> BidirectionalIterator[T]:
         v_id = self._get_vertex_id(vertex)
-        adjacent = []
-        for u, v in self._edges:
-            if u == v_id:
-                adjacent.append(self._vertices[v])
-        return ConstBidirectionalIterator(adjacent)
+        return ConstBidirectionalIterator(AdjacentVertexView(self, v_id))
     
     def const_rbegin_adjacent_vertices(self, vertex: T) -> BidirectionalIterator[T]:
         v_id = self._get_vertex_id(vertex)
-        adjacent = []
-        for u, v in self._edges:
-            if u == v_id:
-                adjacent.append(self._vertices[v])
-        return ConstBidirectionalIterator(adjacent, reverse=True)
+        return ConstBidirectionalIterator(AdjacentVertexView(self, v_id), reverse=True)
 
     def __str__(self) -> str:
         from io import StringIO
@@ -169,52 +277,351 @@ class DirectedGraphIncidence[T]:
 
         return output.getvalue().rstrip()
 
-    def _get_vertex_id(self, value: T) -> int:
+    def _edge_values(self, e_id: int) -> tuple[T, T]:
+        u, v = self._edges[e_id]
+        return self._vertices[u], self._vertices[v]
+
+    def _find_vertex_id(self, value: T) -> int | None:
         try:
-            return self._vertices.index(value)
-        except ValueError:
+            return self._vertex_ids.get(value)
+        except TypeError:
+            # нехешируемые значения не попадают в индекс — ищем линейно
+            for v_id in self._order:
+                if self._vertices[v_id] == value:
+                    return v_id
+            return None
+
+    def _index_vertex(self, v_id: int) -> None:
+        try:
+            self._vertex_ids[self._vertices[v_id]] = v_id
+        except TypeError:
+            pass
+
+    def _allocate_slot(self, value: T) -> int:
+        while self._free:
+            v_id = heapq.heappop(self._free)
+            # в куче могут остаться слоты, отброшенные с конца или уже занятые
+            if v_id < len(self._vertices) and self._vertices[v_id] is _TOMBSTONE:
+                self._vertices[v_id] = value
+                self._serials[v_id] = self._next_serial
+                self._out_edges[v_id] = []
+                self._in_edges[v_id] = []
+                self._in_degrees[v_id] = 0
+                break
+        else:
+            v_id = len(self._vertices)
+            self._vertices.append(value)
+            self._serials.append(self._next_serial)
+            self._order_pos.append(-1)
+            self._out_edges.append([])
+            self._in_edges.append([])
+            self._in_degrees.append(0)
+        self._next_serial += 1
+        self._order_pos[v_id] = len(self._order)
+        self._order.append(v_id)
+        self._index_vertex(v_id)
+        self._log_mutation("add_vertex", value)
+        self._update_fingerprint(_vertex_hash(value))
+        return v_id
+
+    def _release_slot(self, v_id: int) -> None:
+        # дуги вершины к этому моменту уже удалены
+        self._log_mutation("remove_vertex", self._vertices[v_id])
+        self._update_fingerprint(-_vertex_hash(self._vertices[v_id]))
+        try:
+            del self._vertex_ids[self._vertices[v_id]]
+        except (KeyError, TypeError):
+            pass
+        pos = self._order_pos[v_id]
+        last = self._order[-1]
+        self._order[pos] = last
+        self._order_pos[last] = pos
+        self._order.pop()
+
+        self._vertices[v_id] = _TOMBSTONE
+        self._serials[v_id] = 0
+        self._order_pos[v_id] = -1
+        heapq.heappush(self._free, v_id)
+
+        # периодическое уплотнение: свободные слоты в конце отбрасываются,
+        # куча перестраивается, когда в ней накопилось много лишних номеров
+        while self._vertices and self._vertices[-1] is _TOMBSTONE:
+            self._vertices.pop()
+            self._serials.pop()
+            self._order_pos.pop()
+            self._out_edges.pop()
+            self._in_edges.pop()
+            self._in_degrees.pop()
+        if len(self._free) > 2 * len(self._vertices) + 16:
+            self._free = [v_id for v_id, value in enumerate(self._vertices) if value is _TOMBSTONE]
+
+    def _handle(self, v_id: int) -> int:
+        return self._serials[v_id] << _SLOT_BITS | v_id
+
+    def _resolve_handle(self, handle: int) -> int:
+        v_id = handle & _SLOT_MASK
+        serial = handle >> _SLOT_BITS
+        if serial == 0 or v_id >= len(self._serials) or self._serials[v_id] != serial:
+            raise VertexNotExistsError(f"Vertex handle {handle} is not valid")
+        return v_id
+
+    def vertex_handle(self, value: T) -> int:
+        # дескриптор остаётся действительным, пока вершина не удалена
+        return self._handle(self._get_vertex_id(value))
+
+    def vertex_value(self, handle: int) -> T:
+        return self._vertices[self._resolve_handle(handle)]
+
+    def is_valid_handle(self, handle: int) -> bool:
+        try:
+            self._resolve_handle(handle)
+        except VertexNotExistsError:
+            return False
+        return True
+
+    def _get_vertex_id(self, value: T) -> int:
+        v_id = self._find_vertex_id(value)
+        if v_id is None:
             raise VertexNotExistsError(f"Vertex {value} not in graph")
+        return v_id
 
     def has_vertex(self, value: T) -> bool:
-        return value in self._vertices
+        return self._find_vertex_id(value) is not None
 
     def has_edge(self, from_val: T, to_val: T) -> bool:
         try:
             u = self._get_vertex_id(from_val)
             v = self._get_vertex_id(to_val)
-            return (u, v) in self._edges
+            return (u, v) in self._edge_ids
         except VertexNotExistsError:
             return False
 
-    def add_vertex(self, value: T) -> None:
+    def add_vertex(self, value: T) -> int:
         if self.has_vertex(value):
             raise VertexAlreadyExistsError(f"Vertex {value} already exists")
-        v_id = len(self._vertices)
-        self._vertices.append(value)
+        self._touch()
+        return self._handle(self._allocate_slot(value))
 
-        self._incidence.append([0] * len(self._edges))
-
-    def add_edge(self, from_val: T, to_val: T) -> None:
-        if self.has_edge(from_val, to_val):
+    def add_edge(self, from_val: T, to_val: T, weight: float | None = None) -> None:
+        if not self._multigraph and self.has_edge(from_val, to_val):
             raise EdgeAlreadyExistsError(f"Edge ({from_val} → {to_val}) already exists")
         u = self._get_vertex_id(from_val)
         v = self._get_vertex_id(to_val)
+        self._touch()
         e_id = len(self._edges)
         self._edges.append((u, v))
+        self._edge_ids.setdefault((u, v), e_id)
+        for name, column in self._edge_columns.items():
+            column.append(self._edge_defaults[name])
+        if weight is not None:
+            self._edge_column(WEIGHT)[e_id] = weight
+
+        self._out_bucket(u).append(e_id)  # исходит
+        if u != v:
+            self._in_bucket(v).append(e_id)  # входит
+        self._in_degrees[v] += 1
+        self._log_mutation("add_edge", from_val, to_val)
+        self._update_fingerprint(_edge_hash(from_val, to_val))
+
+    @classmethod
+    def from_edge_list(
+        cls,
+        edges,
+        vertices: Iterable[T] | None = None,
+        weights: Iterable[float] | None = None,
+        multigraph: bool = False
+    ) -> "DirectedGraphIncidence[T]":
+        # без явного списка вершины берутся из дуг в порядке первого появления
+        graph = cls(multigraph)
+        if vertices is None:
+            edges = _as_pairs(edges)
+            vertices = {}
+            for pair in edges:
+                vertices.setdefault(pair[0])
+                vertices.setdefault(pair[1])
+        graph.add_vertices_from(vertices)
+        graph.add_edges_from(edges, weights)
+        return graph
 
-        for row in self._incidence:
-            row.append(0)
+    def add_vertices_from(self, vertices: Iterable[T]) -> list[int]:
+        new_vertices = list(vertices)
+        seen = {}
+        for i, value in enumerate(new_vertices):
+            duplicate = self._find_vertex_id(value) is not None
+            try:
+                duplicate = duplicate or seen.setdefault(value, i) != i
+            except TypeError:
+                duplicate = duplicate or value in new_vertices[:i]
+            if duplicate:
+                raise VertexAlreadyExistsError(f"Vertex #{i} {value} already exists")
 
-        self._incidence[u][e_id] = -1  # исходит
-        self._incidence[v][e_id] = +1  # входит
+        self._touch()
+        if self._free:
+            return [self._handle(self._allocate_slot(value)) for value in new_vertices]
 
-    def in_degree(self, value: T) -> int:
+        start, count = len(self._vertices), len(new_vertices)
+        self._vertices.extend(new_vertices)
+        self._serials.extend(range(self._next_serial, self._next_serial + count))
+        self._next_serial += count
+        self._order_pos.extend(range(len(self._order), len(self._order) + count))
+        self._order.extend(range(start, start + count))
+        self._out_edges.extend([] for _ in new_vertices)
+        self._in_edges.extend([] for _ in new_vertices)
+        self._in_degrees.extend([0] * count)
+        for v_id in range(start, start + count):
+            self._index_vertex(v_id)
+        if self._log is not None:
+            self._log.extend(("add_vertex", value, None) for value in new_vertices)
+        if self._fingerprint is not None:
+            self._update_fingerprint(sum(_vertex_hash(value) for value in new_vertices))
+        return [self._handle(v_id) for v_id in range(start, start + count)]
+
+    def add_edges_from(self, edges, weights: Iterable[float] | None = None) -> None:
+        # принимает пары (from, to) или массив NumPy формы (E, 2);
+        # граф не меняется, если хотя бы одна дуга некорректна
+        pairs = _as_pairs(edges)
+        if weights is not None:
+            weights = array("d", weights)
+            if len(weights) != len(pairs):
+                raise ValueError(f"Got {len(weights)} weights for {len(pairs)} edges")
+        start = len(self._edges)
+        vertex_ids = self._vertex_ids
+        try:
+            new_edges = [(vertex_ids[from_val], vertex_ids[to_val]) for from_val, to_val in pairs]
+            new_ids = dict(zip(new_edges, range(start, start + len(new_edges))))
+            valid = self._multigraph or (
+                len(new_ids) == len(new_edges) and self._edge_ids.keys().isdisjoint(new_ids)
+            )
+        except (KeyError, TypeError):
+            valid = False
+        if not valid:
+            # медленный проход нужен только чтобы найти первую ошибку
+            new_edges, new_ids = self._validate_edges(pairs, start)
+        self._append_edges(new_edges, new_ids)
+        if weights is not None:
+            self._edge_column(WEIGHT)[start:] = weights
+
+    def _append_edges(self, new_edges: list[tuple[int, int]], new_ids: dict[tuple[int, int], int]) -> None:
+        # дуги уже проверены: концы существуют, повторов нет
+        start = len(self._edges)
+        self._touch()
+        self._edges.extend(new_edges)
+        if self._multigraph:
+            for key, e_id in new_ids.items():
+                self._edge_ids.setdefault(key, e_id)
+        else:
+            self._edge_ids.update(new_ids)
+        for name, column in self._edge_columns.items():
+            column.extend(array("d", [self._edge_defaults[name]]) * len(new_edges))
+        if self._own_buckets is not None:
+            for u, v in new_edges:
+                self._out_bucket(u)
+                self._in_bucket(v)
+        out_edges, in_edges, in_degrees = self._out_edges, self._in_edges, self._in_degrees
+        for e_id, (u, v) in enumerate(new_edges, start):
+            out_edges[u].append(e_id)
+            if u != v:
+                in_edges[v].append(e_id)
+            in_degrees[v] += 1
+        if self._log is not None:
+            self._log.extend(("add_edge", *self._edge_values(e_id)) for e_id in range(start, len(self._edges)))
+        if self._fingerprint is not None:
+            self._update_fingerprint(sum(_edge_hash(*self._edge_values(e_id)) for e_id in range(start, len(self._edges))))
+
+    def _validate_edges(self, pairs: list, start: int) -> tuple[list[tuple[int, int]], dict[tuple[int, int], int]]:
+        new_edges = []
+        new_ids = {}
+        for i, (from_val, to_val) in enumerate(pairs):
+            u = self._find_vertex_id(from_val)
+            v = self._find_vertex_id(to_val)
+            if u is None or v is None:
+                missing = from_val if u is None else to_val
+                raise VertexNotExistsError(f"Edge #{i} ({from_val} → {to_val}): vertex {missing} not in graph")
+            duplicate = (u, v) in self._edge_ids or new_ids.setdefault((u, v), start + i) != start + i
+            if duplicate and not self._multigraph:
+                raise EdgeAlreadyExistsError(f"Edge #{i} ({from_val} → {to_val}) already exists")
+            new_edges.append((u, v))
+        return new_edges, new_ids
+
+    def in_degree(self, value: T, weighted: bool = False) -> int | float:
+        # weighted=True — сумма весов входящих дуг
         v_id = self._get_vertex_id(value)
-        return sum(1 for e_id in range(len(self._edges)) if self._incidence[v_id][e_id] == 1)
+        if weighted:
+            loops = [e_id for e_id in self._out_edges[v_id] if self._edges[e_id][1] == v_id]
+            return self._weight_sum(self._in_edges[v_id]) + self._weight_sum(loops)
+        return self._in_degrees[v_id]
 
-    def out_degree(self, value: T) -> int:
+    def out_degree(self, value: T, weighted: bool = False) -> int | float:
+        # weighted=True — сумма весов исходящих дуг
         v_id = self._get_vertex_id(value)
-        return sum(1 for e_id in range(len(self._edges)) if self._incidence[v_id][e_id] == -1)
+        if weighted:
+            return self._weight_sum(self._out_edges[v_id])
+        return len(self._out_edges[v_id])
+
+    def _weight_sum(self, edge_ids: list[int]) -> float:
+        weights = self._edge_columns.get(WEIGHT)
+        if weights is None:
+            return float(len(edge_ids))
+        return sum(weights[e_id] for e_id in edge_ids)
+
+    def is_multigraph(self) -> bool:
+        return self._multigraph
+
+    def edge_multiplicity(self, from_val: T, to_val: T) -> int:
+        # число параллельных дуг from -> to
+        if not self.has_edge(from_val, to_val):
+            return 0
+        u = self._get_vertex_id(from_val)
+        v = self._get_vertex_id(to_val)
+        return sum(1 for e_id in self._out_edges[u] if self._edges[e_id][1] == v)
+
+    def _get_edge_id(self, from_val: T, to_val: T) -> int:
+        try:
+            u = self._get_vertex_id(from_val)
+            v = self._get_vertex_id(to_val)
+        except VertexNotExistsError:
+            raise EdgeNotExistsError(f"Edge ({from_val} -> {to_val}) does not exist")
+        e_id = self._edge_ids.get((u, v))
+        if e_id is None:
+            raise EdgeNotExistsError(f"Edge ({from_val} -> {to_val}) does not exist")
+        return e_id
+
+    def _edge_column(self, name: str) -> array:
+        column = self._edge_columns.get(name)
+        if column is None:
+            self.add_edge_attribute(name, 1.0 if name == WEIGHT else 0.0)
+            column = self._edge_columns[name]
+        return column
+
+    def add_edge_attribute(self, name: str, default: float = 0.0) -> None:
+        if name in self._edge_columns:
+            raise ValueError(f"Edge attribute {name!r} already exists")
+        self._touch()
+        self._edge_columns[name] = array("d", [default]) * len(self._edges)
+        self._edge_defaults[name] = default
+
+    def edge_attributes(self) -> list[str]:
+        return list(self._edge_columns)
+
+    def edge_attribute(self, from_val: T, to_val: T, name: str) -> float:
+        # в мультиграфе — значение одной из параллельных дуг
+        e_id = self._get_edge_id(from_val, to_val)
+        if name not in self._edge_columns:
+            raise KeyError(name)
+        return self._edge_columns[name][e_id]
+
+    def set_edge_attribute(self, from_val: T, to_val: T, name: str, value: float) -> None:
+        e_id = self._get_edge_id(from_val, to_val)
+        self._touch()
+        self._edge_column(name)[e_id] = value
+
+    def edge_weight(self, from_val: T, to_val: T) -> float:
+        e_id = self._get_edge_id(from_val, to_val)
+        weights = self._edge_columns.get(WEIGHT)
+        return 1.0 if weights is None else weights[e_id]
+
+    def set_edge_weight(self, from_val: T, to_val: T, weight: float) -> None:
+        self.set_edge_attribute(from_val, to_val, WEIGHT, weight)
     
     def edge_degree(self, from_val: T, to_val: T) -> int:
         if not self.has_edge(from_val, to_val):
@@ -226,7 +633,7 @@ class DirectedGraphIncidence[T]:
             return 2
 
     def vertex_count(self) -> int:
-        return len(self._vertices)
+        return len(self._order)
 
     def edge_count(self) -> int:
         return len(self._edges)
@@ -238,56 +645,380 @@ class DirectedGraphIncidence[T]:
         except VertexNotExistsError:
             raise EdgeNotExistsError(f"Edge ({from_val} -> {to_val}) cannot be removed: one of vertices does not exist")
 
-        try:
-            e_id = self._edges.index((u, v))
-        except ValueError:
+        e_id = self._edge_ids.get((u, v))
+        if e_id is None:
             raise EdgeNotExistsError(f"Edge ({from_val} -> {to_val}) does not exist")
 
-        del self._edges[e_id]
+        self._remove_edge_id(e_id)
+
+    def _remove_edge_id(self, e_id: int) -> None:
+        # на место удаляемой дуги переносится последняя
+        self._touch()
+        u, v = self._edges[e_id]
+        self._log_mutation("remove_edge", self._vertices[u], self._vertices[v])
+        self._update_fingerprint(-_edge_hash(self._vertices[u], self._vertices[v]))
+        self._in_degrees[v] -= 1
+        out_bucket = self._out_bucket(u)
+        out_bucket.remove(e_id)
+        if u != v:
+            self._in_bucket(v).remove(e_id)
+        if self._edge_ids[(u, v)] == e_id:
+            del self._edge_ids[(u, v)]
+            if self._multigraph:
+                for other_id in out_bucket:
+                    if self._edges[other_id][1] == v:
+                        self._edge_ids[(u, v)] = other_id
+                        break
 
-        for row in self._incidence:
-            del row[e_id]
+        last_id = len(self._edges) - 1
+        if e_id != last_id:
+            last_u, last_v = self._edges[last_id]
+            self._edges[e_id] = (last_u, last_v)
+            if self._edge_ids[(last_u, last_v)] == last_id:
+                self._edge_ids[(last_u, last_v)] = e_id
+            _replace_id(self._out_bucket(last_u), last_id, e_id)
+            if last_u != last_v:
+                _replace_id(self._in_bucket(last_v), last_id, e_id)
+        self._edges.pop()
+        for column in self._edge_columns.values():
+            column[e_id] = column[last_id]
+            column.pop()
 
     def remove_vertex(self, value: T) -> None:
         if not self.has_vertex(value):
             raise VertexNotExistsError(f"Vertex {value} does not exist")
+        self._remove_vertex_id(self._get_vertex_id(value))
 
-        v_id = self._get_vertex_id(value)
+    def _remove_vertex_id(self, v_id: int) -> None:
+        # O(степени): номера остальных вершин не меняются
+        self._touch()
+        while self._out_edges[v_id]:
+            self._remove_edge_id(self._out_edges[v_id][-1])
+        while self._in_edges[v_id]:
+            self._remove_edge_id(self._in_edges[v_id][-1])
+        self._release_slot(v_id)
+
+    def remove_edges(self, edges) -> None:
+        # все дуги проверяются до изменения графа; в мультиграфе каждая пара
+        # удаляет одну параллельную дугу
+        drop = set()
+        candidates = {}
+        for i, (from_val, to_val) in enumerate(_as_pairs(edges)):
+            u = self._find_vertex_id(from_val)
+            v = self._find_vertex_id(to_val)
+            key = (u, v)
+            if key not in self._edge_ids:
+                raise EdgeNotExistsError(f"Edge #{i} ({from_val} -> {to_val}) does not exist")
+            if key not in candidates:
+                if self._multigraph:
+                    candidates[key] = [e_id for e_id in self._out_edges[u] if self._edges[e_id][1] == v]
+                else:
+                    candidates[key] = [self._edge_ids[key]]
+            if not candidates[key]:
+                raise EdgeNotExistsError(f"Edge #{i} ({from_val} -> {to_val}) does not exist")
+            drop.add(candidates[key].pop())
+
+        if len(drop) * _COMPACT_RATIO < len(self._edges):
+            # по убыванию номеров: перенос последней дуги не задевает оставшиеся
+            for e_id in sorted(drop, reverse=True):
+                self._remove_edge_id(e_id)
+        elif drop:
+            self._compact(drop)
+
+    def remove_vertices(self, vertices: Iterable[T]) -> None:
+        values = list(vertices)
+        drop = set()
+        for i, value in enumerate(values):
+            v_id = self._find_vertex_id(value)
+            if v_id is None or v_id in drop:
+                raise VertexNotExistsError(f"Vertex #{i} {value} does not exist")
+            drop.add(v_id)
+
+        incident = set()
+        for v_id in drop:
+            incident.update(self._out_edges[v_id])
+            incident.update(self._in_edges[v_id])
+        if len(incident) * _COMPACT_RATIO < len(self._edges):
+            for v_id in drop:
+                self._remove_vertex_id(v_id)
+        elif drop:
+            self._compact(incident)
+            for v_id in drop:
+                self._release_slot(v_id)
 
-        edges_to_remove = []
+    def _compact(self, drop_edges: set[int]) -> None:
+        # одна перенумерация дуг за O(V + E) с сохранением порядка;
+        # номера вершин не меняются
+        self._touch()
+        if self._log is not None:
+            self._log.extend(("remove_edge", *self._edge_values(e_id)) for e_id in sorted(drop_edges))
+        if self._fingerprint is not None:
+            self._update_fingerprint(-sum(_edge_hash(*self._edge_values(e_id)) for e_id in drop_edges))
+        keep_edges = [e_id for e_id in range(len(self._edges)) if e_id not in drop_edges]
+        self._edges = [self._edges[e_id] for e_id in keep_edges]
+        self._edge_ids = {}
+        for e_id, key in enumerate(self._edges):
+            self._edge_ids.setdefault(key, e_id)
+        self._edge_columns = {
+            name: array("d", (column[e_id] for e_id in keep_edges))
+            for name, column in self._edge_columns.items()
+        }
+        self._out_edges = [[] for _ in self._vertices]
+        self._in_edges = [[] for _ in self._vertices]
+        self._in_degrees = [0] * len(self._vertices)
+        self._own_buckets = None
         for e_id, (u, v) in enumerate(self._edges):
-            if u == v_id or v == v_id:
-                edges_to_remove.append(e_id)
+            self._out_edges[u].append(e_id)
+            if u != v:
+                self._in_edges[v].append(e_id)
+            self._in_degrees[v] += 1
 
-        for e_id in reversed(edges_to_remove):
-            del self._edges[e_id]
-            for row in self._incidence:
-                del row[e_id]
+    def batch(self) -> "GraphBatch[T]":
+        from .GraphBatch import GraphBatch
+        return GraphBatch(self)
 
-        del self._incidence[v_id]
+    def _restore(self, snapshot: "DirectedGraphIncidence[T]", log_start: int = 0) -> None:
+        # откат к состоянию, сохранённому через fork(); журнал не укорачивается,
+        # вместо этого в него дописываются обратные записи
+        version, log = self._version, self._log
+        self.__dict__.update(snapshot.__dict__)
+        self._version = version + 1
+        self._shared = True
+        self._log = log
+        if log is None or len(log) <= log_start:
+            return
+        undone = log[log_start:]
+        if any(op == "clear" for op, _, _ in undone):
+            log.append(("clear", None, None))
+            log.extend(("add_vertex", value, None) for value in self.begin_vertices())
+            log.extend(("add_edge", u, v) for u, v in self.begin_edges())
+        else:
+            log.extend((_INVERSE_OPS[op], u, v) for op, u, v in reversed(undone))
 
-        del self._vertices[v_id]
+    def enable_mutation_log(self) -> None:
+        # журнал записей (операция, u, v) только для дописывания; для операций
+        # с вершинами v = None. Копии графа (fork, deepcopy) журнал не наследуют
+        if self._log is None:
+            self._log = []
 
-        for i in range(len(self._edges)):
-            u, v = self._edges[i]
-            new_u = u - 1 if u > v_id else u
-            new_v = v - 1 if v > v_id else v
-            self._edges[i] = (new_u, new_v)
+    def disable_mutation_log(self) -> None:
+        self._log = None
 
-    
+    def mutation_log(self, start: int = 0) -> list[tuple[str, T | None, T | None]]:
+        # записи, начиная с позиции start
+        if self._log is None:
+            raise ValueError("Mutation log is not enabled")
+        return self._log[start:]
+
+    def _log_mutation(self, op: str, u: T | None = None, v: T | None = None) -> None:
+        if self._log is not None:
+            self._log.append((op, u, v))
+
+    def incidence_matrix(self) -> list[list[int]]:
+        # плотная матрица V×E строится только по запросу:
+        # -1 — дуга исходит из вершины, +1 — входит (у петли +1)
+        # строки идут в порядке обхода вершин
+        matrix = [[0] * len(self._edges) for _ in self._order]
+        for e_id, (u, v) in enumerate(self._edges):
+            matrix[self._order_pos[u]][e_id] = -1
+            matrix[self._order_pos[v]][e_id] = +1
+        return matrix
+
+
+    def to_csr(self):
+        # снимок в формате CSR: (indptr, indices, значения вершин)
+        indptr, indices, vertices, _ = self._csr()
+        return indptr, indices, vertices
+
+    def _csr(self):
+        # to_csr и номера дуг в порядке indices (для столбцов атрибутов)
+        import numpy as np
+
+        n = len(self._order)
+        pairs, order = self._csr_order()
+        indices = pairs[order, 1].astype(np.int32)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pairs[:, 0], minlength=n), out=indptr[1:])
+        return indptr, indices, tuple(self._vertices[v_id] for v_id in self._order), order
+
+    def _csr_order(self):
+        # концы дуг в плотной нумерации (позиции в порядке обхода вершин)
+        # и номера дуг, упорядоченные по (начало, конец)
+        import numpy as np
+        from itertools import chain
+
+        dense = np.full(len(self._vertices), -1, dtype=np.int64)
+        dense[np.array(self._order, dtype=np.int64)] = np.arange(len(self._order))
+        flat = chain.from_iterable(self._edges)
+        pairs = dense[np.fromiter(flat, dtype=np.int64, count=2 * len(self._edges)).reshape(-1, 2)]
+        return pairs, np.lexsort((pairs[:, 1], pairs[:, 0]))
+
+    def freeze(self):
+        from .FrozenGraph import FrozenGraph
+        return FrozenGraph.from_graph(self)
+
+    def save(self, path, codec=None) -> None:
+        from .serialization import save
+        save(self, path, codec)
 
-    def erase_vertex(self, it: BidirectionalIterator[T]) -> None:
-        if it._container is not self._vertices:
+    @classmethod
+    def load(cls, path, mmap: bool = True, codec=None) -> "DirectedGraphIncidence[T]":
+        from .serialization import load
+        return load(path, mmap=mmap, codec=codec, graph_type=cls)
+
+    def erase_vertex(self, it: BidirectionalIterator[T] | int) -> None:
+        # принимает итератор вершин или дескриптор вершины
+        if isinstance(it, int):
+            self._remove_vertex_id(self._resolve_handle(it))
+            return
+        container = it._container
+        if not isinstance(container, VertexView) or container._graph is not self:
             raise ValueError("Iterator does not belong to this graph's vertices")
-        if not (0 <= it._index < len(self._vertices)):
+        if not (0 <= it._index < len(container)):
             raise VertexNotExistsError("Iterator out of range")
-        vertex_value = self._vertices[it._index]
-        self.remove_vertex(vertex_value)
+        self._remove_vertex_id(container._vertex_id(it._index))
+        _advance_erased(it)
 
-    def erase_edge(self, it: BidirectionalIterator[tuple[T, T]]) -> None:
-        if not (0 <= it._index < len(it._container)):
+    def erase_edge(self, it: BidirectionalIterator[tuple[T, T]] | tuple[int, int]) -> None:
+        # принимает итератор дуг или пару дескрипторов (начало, конец)
+        if isinstance(it, tuple):
+            u, v = self._resolve_handle(it[0]), self._resolve_handle(it[1])
+            e_id = self._edge_ids.get((u, v))
+            if e_id is None:
+                raise EdgeNotExistsError(f"Edge with handles {it} does not exist")
+            self._remove_edge_id(e_id)
+            return
+        container = it._container
+        if not (0 <= it._index < len(container)):
             raise EdgeNotExistsError("Iterator out of range")
-        from_val, to_val = it._container[it._index]
+        if isinstance(container, GraphView) and container._graph is self and hasattr(container, "_edge_id"):
+            self._remove_edge_id(container._edge_id(it._index))
+            _advance_erased(it)
+            return
+        from_val, to_val = container[it._index]
         if not self.has_edge(from_val, to_val):
             raise EdgeNotExistsError(f"Edge ({from_val} -> {to_val}) does not exist")
-        self.remove_edge(from_val, to_val)
\ No newline at end of file
+        self.remove_edge(from_val, to_val)
+
+def _advance_erased(it) -> None:
+    # как erase в STL: итератор остаётся действительным и указывает на следующий
+    # элемент. На место удалённого встаёт последний (вершины, дуги) или
+    # сдвигаются следующие (списки дуг вершины), так что прямой обход остаётся
+    # на том же индексе, а обратный сдвигается на один назад
+    it._container._resync()
+    if it._reverse:
+        it._index -= 1
+
+
+WEIGHT = "weight"
+_INVERSE_OPS = {
+    "add_vertex": "remove_vertex",
+    "remove_vertex": "add_vertex",
+    "add_edge": "remove_edge",
+    "remove_edge": "add_edge",
+}
+_FINGERPRINT_MASK = (1 << 128) - 1
+_VERTEX_PERSON = b"dgi-vertex"
+_EDGE_PERSON = b"dgi-edge"
+_TOMBSTONE = object()  # метка свободного слота вершины
+# дескриптор вершины: (поколение << _SLOT_BITS) | номер слота
+_SLOT_BITS = 32
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+# удаление пачкой перенумеровывает граф целиком, если удаляется
+# больше 1/_COMPACT_RATIO вершин или дуг; иначе удаляет по одной
+_COMPACT_RATIO = 16
+
+
+def _cow(container):
+    # копия при записи: дуги, их атрибуты и словари номеров не копируются
+    # целиком — копируются только изменяемые куски (ChunkedList) или
+    # изменения ложатся в отдельный слой (OverlayDict)
+    if isinstance(container, (ChunkedList, OverlayDict)):
+        return container.copy()
+    if isinstance(container, dict):
+        return OverlayDict(container)
+    return ChunkedList(container)
+
+
+def _replace_id(bucket: list[int], old_id: int, new_id: int) -> None:
+    bucket[bucket.index(old_id)] = new_id
+
+
+def _as_pairs(edges) -> list:
+    if hasattr(edges, "tolist"):  # numpy.ndarray
+        if len(edges.shape) != 2 or edges.shape[1] != 2:
+            raise ValueError(f"Edge array must have shape (E, 2), got {edges.shape}")
+        return edges.tolist()
+    return edges if isinstance(edges, list) else list(edges)
+
+
+def _digest(data: bytes, person: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16, person=person).digest(), "little")
+
+
+def _vertex_hash(value) -> int:
+    return _digest(_encode_value(value), _VERTEX_PERSON)
+
+
+def _edge_hash(from_val, to_val) -> int:
+    return _digest(_pair(_encode_value(from_val), _encode_value(to_val)), _EDGE_PERSON)
+
+
+def _pair(first: bytes, second: bytes) -> bytes:
+    return len(first).to_bytes(8, "little") + first + second
+
+
+def _encode_value(value) -> bytes:
+    # каноническая запись: равные значения (1 == 1.0 == True,
+    # Decimal("0.5") == Fraction(1, 2) == 0.5) записываются одинаково, разные —
+    # различимо. Строки, байты, числа, None и кортежи/frozenset из них не
+    # зависят от процесса; для остальных типов берётся hash(), стабильный
+    # только в пределах процесса
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    if isinstance(value, bytes):
+        return b"b" + value
+    if isinstance(value, int):
+        return _encode_int(int(value))
+    if isinstance(value, float):
+        return _encode_real(value)
+    if value is None:
+        return b"n"
+    if isinstance(value, tuple):
+        return b"t" + b"".join(_pair(_encode_value(item), b"") for item in value)
+    if isinstance(value, frozenset):
+        return b"f" + b"".join(sorted(_pair(_encode_value(item), b"") for item in value))
+    if isinstance(value, numbers.Number):
+        if isinstance(value, numbers.Integral):
+            return _encode_int(int(value))
+        if isinstance(value, numbers.Complex) and not isinstance(value, numbers.Real):
+            if value.imag == 0:
+                return _encode_real(value.real)
+            return b"c" + _pair(_encode_real(value.real), _encode_real(value.imag))
+        if hasattr(value, "as_integer_ratio"):  # Fraction, Decimal, numpy
+            return _encode_real(value)
+    try:
+        return b"h" + _encode_int(hash(value))
+    except TypeError:
+        # нехешируемые значения различаются только при полном сравнении в __eq__
+        return b"?"
+
+
+def _encode_int(n: int) -> bytes:
+    return b"i" + n.to_bytes(n.bit_length() // 8 + 1, "little", signed=True)
+
+
+def _encode_real(x) -> bytes:
+    # конечное вещественное число — точная дробь: числа разных типов равны
+    # тогда и только тогда, когда равны их дроби
+    try:
+        numerator, denominator = x.as_integer_ratio()
+    except (OverflowError, ValueError):
+        # бесконечности и NaN
+        try:
+            return b"d" + struct.pack("<d", float(x))
+        except ValueError:
+            return b"?"  # Decimal("sNaN")
+    if denominator == 1:
+        return _encode_int(numerator)
+    return b"q" + _pair(_encode_int(numerator), _encode_int(denominator))
@@ -0,0 +1,125 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from .iterators.ConstBidirectionalIterator import ConstBidirectionalIterator
+from .exceptions import VertexNotExistsError
+
+
+class FrozenGraph[T]:
+    # неизменяемый снимок графа в формате CSR: дуги вершины v_id —
+    # indices[indptr[v_id]:indptr[v_id + 1]], отсортированные по возрастанию.
+    # Массивы доступны только для чтения, поэтому снимок можно безопасно
+    # передавать в другие процессы.
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, vertices: Sequence[T]):
+        if len(indptr) != len(vertices) + 1:
+            raise ValueError("indptr must have len(vertices) + 1 elements")
+        self._indptr = indptr
+        self._indices = indices
+        # таблица вершин может быть ленивой (см. serialization.load)
+        self._vertices = vertices if isinstance(vertices, Sequence) else tuple(vertices)
+        self._indptr.flags.writeable = False
+        self._indices.flags.writeable = False
+        self._vertex_ids: dict[T, int] | None = None
+        self._in_degrees: np.ndarray | None = None
+
+    @classmethod
+    def from_graph(cls, graph) -> "FrozenGraph[T]":
+        return cls(*graph.to_csr())
+
+    def __getstate__(self) -> dict:
+        # индексы строятся лениво и не передаются между процессами
+        return {"indptr": self._indptr, "indices": self._indices, "vertices": tuple(self._vertices)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["indptr"], state["indices"], state["vertices"])
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def vertices(self) -> Sequence[T]:
+        return self._vertices
+
+    def _find_vertex_id(self, value: T) -> int | None:
+        if self._vertex_ids is None:
+            self._vertex_ids = {}
+            for v_id, vertex in enumerate(self._vertices):
+                try:
+                    self._vertex_ids[vertex] = v_id
+                except TypeError:
+                    pass
+        try:
+            return self._vertex_ids.get(value)
+        except TypeError:
+            try:
+                return self._vertices.index(value)
+            except ValueError:
+                return None
+
+    def _get_vertex_id(self, value: T) -> int:
+        v_id = self._find_vertex_id(value)
+        if v_id is None:
+            raise VertexNotExistsError(f"Vertex {value} not in graph")
+        return v_id
+
+    def _row(self, v_id: int) -> np.ndarray:
+        return self._indices[self._indptr[v_id]:self._indptr[v_id + 1]]
+
+    def vertex_count(self) -> int:
+        return len(self._vertices)
+
+    def edge_count(self) -> int:
+        return len(self._indices)
+
+    def empty(self) -> bool:
+        return len(self._vertices) == 0
+
+    def has_vertex(self, value: T) -> bool:
+        return self._find_vertex_id(value) is not None
+
+    def has_edge(self, from_val: T, to_val: T) -> bool:
+        u = self._find_vertex_id(from_val)
+        v = self._find_vertex_id(to_val)
+        if u is None or v is None:
+            return False
+        row = self._row(u)
+        pos = np.searchsorted(row, v)
+        return bool(pos < len(row) and row[pos] == v)
+
+    def out_degree(self, value: T) -> int:
+        v_id = self._get_vertex_id(value)
+        return int(self._indptr[v_id + 1] - self._indptr[v_id])
+
+    def in_degree(self, value: T) -> int:
+        return int(self.in_degrees()[self._get_vertex_id(value)])
+
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self._indptr)
+
+    def in_degrees(self) -> np.ndarray:
+        if self._in_degrees is None:
+            self._in_degrees = np.bincount(self._indices, minlength=len(self._vertices))
+            self._in_degrees.flags.writeable = False
+        return self._in_degrees
+
+    def adjacent_vertices(self, value: T) -> list[T]:
+        vertices = self._vertices
+        return [vertices[v_id] for v_id in self._row(self._get_vertex_id(value)).tolist()]
+
+    def begin_vertices(self) -> ConstBidirectionalIterator[T]:
+        return ConstBidirectionalIterator(self._vertices)
+
+    def rbegin_vertices(self) -> ConstBidirectionalIterator[T]:
+        return ConstBidirectionalIterator(self._vertices, reverse=True)
+
+    def begin_adjacent_vertices(self, vertex: T) -> ConstBidirectionalIterator[T]:
+        return ConstBidirectionalIterator(self.adjacent_vertices(vertex))
+
+    def rbegin_adjacent_vertices(self, vertex: T) -> ConstBidirectionalIterator[T]:
+        return ConstBidirectionalIterator(self.adjacent_vertices(vertex), reverse=True)
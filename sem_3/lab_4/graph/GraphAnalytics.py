@@ -0,0 +1,264 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .FrozenGraph import FrozenGraph
+
+# Массивы исполнителя: подключаются к общей памяти один раз при запуске процесса
+_worker_arrays: dict[str, np.ndarray] = {}
+_worker_blocks: list[SharedMemory] = []
+
+
+def _release(pool: ProcessPoolExecutor | None, blocks: list[SharedMemory]) -> None:
+    # вызывается из close() или финализатором, один раз
+    if pool is not None:
+        pool.shutdown()
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # на массивы ещё есть ссылки: отображение уйдёт вместе с ними
+            pass
+        block.unlink()
+
+
+def _attach(specs: dict) -> None:
+    for name, (shm_name, dtype, shape) in specs.items():
+        block = SharedMemory(name=shm_name)
+        _worker_blocks.append(block)
+        _worker_arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _run(kernel: str, lo: int, hi: int, *args):
+    return _KERNELS[kernel](_worker_arrays, lo, hi, *args)
+
+
+def _segment_reduce(ufunc, values: np.ndarray, offsets: np.ndarray, identity) -> np.ndarray:
+    # ufunc по строкам: строка i — values[offsets[i]:offsets[i + 1]], у пустых строк — identity
+    out = np.full(len(offsets) - 1, identity, dtype=values.dtype)
+    non_empty = np.diff(offsets) > 0
+    if len(values):
+        out[non_empty] = ufunc.reduceat(values, offsets[:-1][non_empty])
+    return out
+
+
+def _rows(indptr: np.ndarray, indices: np.ndarray, lo: int, hi: int) -> tuple[np.ndarray, np.ndarray]:
+    # соседи вершин lo..hi-1 и смещения строк относительно начала отрезка
+    return indices[indptr[lo]:indptr[hi]], indptr[lo:hi + 1] - indptr[lo]
+
+
+def _degree_kernel(arrays: dict, lo: int, hi: int) -> tuple[np.ndarray, np.ndarray]:
+    out_degrees = np.diff(arrays["indptr"][lo:hi + 1])
+    in_degrees = np.diff(arrays["in_indptr"][lo:hi + 1])
+    return np.bincount(out_degrees), np.bincount(in_degrees)
+
+
+def _label_kernel(arrays: dict, lo: int, hi: int) -> bool:
+    # один шаг распространения минимальной метки по неориентированным рёбрам
+    labels = arrays["labels"]
+    neighbours, offsets = _rows(arrays["sym_indptr"], arrays["sym_indices"], lo, hi)
+    neighbour_min = _segment_reduce(np.minimum, labels.take(neighbours), offsets, np.iinfo(np.int64).max)
+    updated = np.minimum(labels[lo:hi], neighbour_min)
+    arrays["labels_next"][lo:hi] = updated
+    return bool((updated != labels[lo:hi]).any())
+
+
+def _pagerank_kernel(arrays: dict, lo: int, hi: int, base: float, damping: float) -> float:
+    # вершина забирает вклад входящих соседей; возвращает L1-изменение на отрезке
+    neighbours, offsets = _rows(arrays["in_indptr"], arrays["in_indices"], lo, hi)
+    sums = _segment_reduce(np.add, arrays["contrib"].take(neighbours), offsets, 0.0)
+    rank = base + damping * sums
+    delta = float(np.abs(rank - arrays["rank"][lo:hi]).sum())
+    arrays["rank_next"][lo:hi] = rank
+    return delta
+
+
+def _triangle_kernel(arrays: dict, lo: int, hi: int) -> int:
+    # каждый треугольник u < v < w считается один раз — из вершины u
+    indptr, indices = arrays["tri_indptr"], arrays["tri_indices"]
+    marked = np.zeros(len(indptr) - 1, dtype=bool)
+    count = 0
+    for u in range(lo, hi):
+        higher = indices[indptr[u]:indptr[u + 1]]
+        if len(higher) < 2:
+            continue
+        marked[higher] = True
+        for v in higher:
+            count += int(np.count_nonzero(marked[indices[indptr[v]:indptr[v + 1]]]))
+        marked[higher] = False
+    return count
+
+
+_KERNELS = {
+    "degrees": _degree_kernel,
+    "labels": _label_kernel,
+    "pagerank": _pagerank_kernel,
+    "triangles": _triangle_kernel,
+}
+
+
+def _build_csr(sources: np.ndarray, targets: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return indptr, targets[order].astype(np.int64)
+
+
+class GraphAnalytics[T]:
+    # метрики всего графа по снимку CSR. Массивы снимка выкладываются в
+    # multiprocessing.shared_memory, вершины делятся на отрезки с примерно
+    # равным числом рёбер и обрабатываются пулом процессов. Частичные
+    # результаты сливаются в порядке отрезков, поэтому ответ не зависит от
+    # числа исполнителей. При workers=1 всё считается в текущем процессе.
+    def __init__(self, graph, workers: int | None = None, chunks_per_worker: int = 4):
+        if not isinstance(graph, FrozenGraph):
+            graph = graph.freeze()
+        self._workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self._workers < 1:
+            raise ValueError("workers must be positive")
+        self._vertices = graph.vertices
+        n = len(self._vertices)
+
+        indptr = np.asarray(graph.indptr, dtype=np.int64)
+        indices = np.asarray(graph.indices, dtype=np.int64)
+        sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+        in_indptr, in_indices = _build_csr(indices, sources, n)
+        sym_indptr, sym_indices = _build_csr(
+            np.concatenate((sources, indices)), np.concatenate((indices, sources)), n
+        )
+        # для треугольников: простой неориентированный граф, только соседи с большим номером
+        keys = np.unique(np.minimum(sources, indices) * n + np.maximum(sources, indices))
+        low, high = keys // n, keys % n
+        loops = low == high
+        tri_indptr, tri_indices = _build_csr(low[~loops], high[~loops], n)
+
+        arrays = {
+            "indptr": indptr,
+            "in_indptr": in_indptr,
+            "in_indices": in_indices,
+            "out_degrees": np.diff(indptr),
+            "sym_indptr": sym_indptr,
+            "sym_indices": sym_indices,
+            "tri_indptr": tri_indptr,
+            "tri_indices": tri_indices,
+            "labels": np.arange(n, dtype=np.int64),
+            "labels_next": np.arange(n, dtype=np.int64),
+            "contrib": np.zeros(n),
+            "rank": np.zeros(n),
+            "rank_next": np.zeros(n),
+        }
+        # границы отрезков: поровну рёбер симметричного графа (и хотя бы по вершине)
+        parts = max(1, min(n, self._workers * chunks_per_worker))
+        cost = sym_indptr + np.arange(n + 1)
+        bounds = np.searchsorted(cost, np.linspace(0, cost[-1], parts + 1))
+        bounds[0], bounds[-1] = 0, n
+        self._ranges = [(int(lo), int(hi)) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+        self._blocks: list[SharedMemory] = []
+        self._pool: ProcessPoolExecutor | None = None
+        self._finalizer = None
+        if self._workers == 1:
+            self._arrays = arrays
+            return
+        self._arrays = {}
+        specs = {}
+        try:
+            for name, array in arrays.items():
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                shared[...] = array
+                self._arrays[name] = shared
+                specs[name] = (block.name, array.dtype.str, array.shape)
+            self._pool = ProcessPoolExecutor(self._workers, initializer=_attach, initargs=(specs,))
+        except BaseException:
+            self._arrays = {}
+            _release(None, self._blocks)
+            raise
+        # если close() не вызвали, блоки удалятся из /dev/shm при сборке объекта
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._blocks)
+
+    def __enter__(self) -> "GraphAnalytics[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # ссылки на буферы нужно отпустить до закрытия блоков
+        self._arrays = {}
+        if self._finalizer is not None:
+            self._finalizer()
+        self._pool = None
+        self._blocks = []
+
+    def _map(self, kernel: str, *args) -> list:
+        if not self._arrays:
+            raise ValueError("GraphAnalytics is closed")
+        if self._pool is None:
+            return [_KERNELS[kernel](self._arrays, lo, hi, *args) for lo, hi in self._ranges]
+        futures = [self._pool.submit(_run, kernel, lo, hi, *args) for lo, hi in self._ranges]
+        return [future.result() for future in futures]
+
+    def degree_histogram(self) -> tuple[list[int], list[int]]:
+        # (out, in): histogram[k] — число вершин степени k
+        out_hist = np.zeros(1, dtype=np.int64)
+        in_hist = np.zeros(1, dtype=np.int64)
+        for out_part, in_part in self._map("degrees"):
+            out_hist = _add_padded(out_hist, out_part)
+            in_hist = _add_padded(in_hist, in_part)
+        if not len(self._vertices):
+            return [], []
+        return out_hist.tolist(), in_hist.tolist()
+
+    def weakly_connected_components(self) -> list[list[T]]:
+        # метка вершины — наименьший номер в её компоненте; после каждого шага
+        # метки сжимаются переходом по указателям (labels[labels])
+        labels, labels_next = self._arrays["labels"], self._arrays["labels_next"]
+        labels[:] = np.arange(len(labels))
+        while any(self._map("labels")):
+            labels[:] = labels_next
+            while True:
+                jumped = labels[labels]
+                if np.array_equal(jumped, labels):
+                    break
+                labels[:] = jumped
+        components: dict[int, list[T]] = {}
+        for v_id, label in enumerate(labels.tolist()):
+            components.setdefault(label, []).append(self._vertices[v_id])
+        return list(components.values())
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1e-9, max_iter: int = 100) -> list[tuple[T, float]]:
+        # пары (вершина, ранг) в порядке обхода вершин графа, а не словарь:
+        # вершины могут быть нехешируемыми
+        n = len(self._vertices)
+        if n == 0:
+            return []
+        out_degrees = self._arrays["out_degrees"]
+        dangling = out_degrees == 0
+        rank, rank_next, contrib = self._arrays["rank"], self._arrays["rank_next"], self._arrays["contrib"]
+        rank[:] = 1.0 / n
+        for _ in range(max_iter):
+            np.divide(rank, out_degrees, out=contrib, where=~dangling)
+            contrib[dangling] = 0.0
+            # вес висячих вершин распределяется равномерно
+            base = (1.0 - damping) / n + damping * float(rank[dangling].sum()) / n
+            delta = sum(self._map("pagerank", base, damping))
+            rank[:] = rank_next
+            if delta < tol:
+                break
+        return list(zip(self._vertices, rank.tolist()))
+
+    def triangle_count(self) -> int:
+        # треугольники неориентированного графа без петель и кратных рёбер
+        return sum(self._map("triangles"))
+
+
+def _add_padded(total: np.ndarray, part: np.ndarray) -> np.ndarray:
+    if len(part) > len(total):
+        total = np.concatenate((total, np.zeros(len(part) - len(total), dtype=total.dtype)))
+    total[:len(part)] += part
+    return total
@@ -0,0 +1,40 @@
+class GraphBatch[T]:
+    # with graph.batch() as batch: ... — удаления накапливаются и применяются
+    # одной перенумерацией при выходе из блока; при исключении граф
+    # возвращается в состояние на момент входа (в том числе после
+    # изменений, сделанных внутри блока напрямую)
+    def __init__(self, graph):
+        self._graph = graph
+        self._vertices: list[T] = []
+        self._edges: list[tuple[T, T]] = []
+        self._snapshot = None
+        self._log_start = 0
+
+    def __enter__(self) -> "GraphBatch[T]":
+        self._snapshot = self._graph.fork()
+        log = self._graph._log
+        self._log_start = len(log) if log is not None else 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            if exc_type is None:
+                self._graph.remove_edges(self._edges)
+                self._graph.remove_vertices(self._vertices)
+        except BaseException:
+            self._graph._restore(self._snapshot, self._log_start)
+            raise
+        else:
+            if exc_type is not None:
+                self._graph._restore(self._snapshot, self._log_start)
+        finally:
+            self._snapshot = None
+            self._vertices.clear()
+            self._edges.clear()
+        return False
+
+    def remove_vertex(self, value: T) -> None:
+        self._vertices.append(value)
+
+    def remove_edge(self, from_val: T, to_val: T) -> None:
+        self._edges.append((from_val, to_val))
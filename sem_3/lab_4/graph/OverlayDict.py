@@ -0,0 +1,72 @@
+from collections.abc import MutableMapping
+
+_DELETED = object()  # ключ удалён в слое изменений
+_UNCHANGED = object()
+
+
+class OverlayDict[K, V](MutableMapping[K, V]):
+    # словарь с копированием при записи: общая база не меняется, изменения
+    # и удаления лежат в собственном слое. Когда слой дорастает до размера
+    # базы, он вливается в новую базу — запись остаётся O(1) в среднем
+    def __init__(self, base: dict[K, V]):
+        self._base = base
+        self._changes: dict[K, object] = {}
+        self._len = len(base)
+
+    def copy(self) -> "OverlayDict[K, V]":
+        other = object.__new__(OverlayDict)
+        other._base = self._base
+        other._changes = self._changes.copy()
+        other._len = self._len
+        return other
+
+    def get(self, key: K, default=None):
+        value = self._changes.get(key, _UNCHANGED)
+        if value is _UNCHANGED:
+            return self._base.get(key, default)
+        return default if value is _DELETED else value
+
+    def __contains__(self, key) -> bool:
+        value = self._changes.get(key, _UNCHANGED)
+        if value is _UNCHANGED:
+            return key in self._base
+        return value is not _DELETED
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _DELETED)
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key not in self:
+            self._len += 1
+        self._changes[key] = value
+        self._compact()
+
+    def __delitem__(self, key: K) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._len -= 1
+        if key in self._base:
+            self._changes[key] = _DELETED
+            self._compact()
+        else:
+            del self._changes[key]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        changes = self._changes
+        for key in self._base:
+            if key not in changes:
+                yield key
+        for key, value in changes.items():
+            if value is not _DELETED:
+                yield key
+
+    def _compact(self) -> None:
+        if len(self._changes) > len(self._base):
+            self._base = dict(self.items())
+            self._changes = {}
@@ -0,0 +1,195 @@
+import heapq
+from collections import deque
+from collections.abc import Callable
+
+from .DirectedGraphIncidence import DirectedGraphIncidence
+from .exceptions import GraphHasCycleError
+
+# Алгоритмы работают с внутренними номерами вершин и списками исходящих дуг
+# графа, значения вершин получаются только при формировании результата.
+
+
+def _successors(graph: DirectedGraphIncidence, v_id: int) -> list[int]:
+    edges = graph._edges
+    return [edges[e_id][1] for e_id in graph._out_edges[v_id]]
+
+
+def _bfs_ids(graph: DirectedGraphIncidence, source_id: int) -> list[int]:
+    edges, out_edges = graph._edges, graph._out_edges
+    visited = [False] * len(graph._vertices)
+    visited[source_id] = True
+    order = []
+    queue = deque([source_id])
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for e_id in out_edges[u]:
+            v = edges[e_id][1]
+            if not visited[v]:
+                visited[v] = True
+                queue.append(v)
+    return order
+
+
+def bfs[T](graph: DirectedGraphIncidence[T], source: T) -> list[T]:
+    vertices = graph._vertices
+    return [vertices[v_id] for v_id in _bfs_ids(graph, graph._get_vertex_id(source))]
+
+
+def dfs[T](graph: DirectedGraphIncidence[T], source: T) -> list[T]:
+    # порядок совпадает с рекурсивным обходом в глубину
+    vertices = graph._vertices
+    visited = [False] * len(vertices)
+    order = []
+    stack = [graph._get_vertex_id(source)]
+    while stack:
+        u = stack.pop()
+        if visited[u]:
+            continue
+        visited[u] = True
+        order.append(vertices[u])
+        for v in reversed(_successors(graph, u)):
+            if not visited[v]:
+                stack.append(v)
+    return order
+
+
+def is_reachable[T](graph: DirectedGraphIncidence[T], source: T, target: T) -> bool:
+    # обход в ширину, который останавливается на target
+    target_id = graph._get_vertex_id(target)
+    source_id = graph._get_vertex_id(source)
+    if source_id == target_id:
+        return True
+    edges, out_edges = graph._edges, graph._out_edges
+    visited = [False] * len(graph._vertices)
+    visited[source_id] = True
+    queue = deque([source_id])
+    while queue:
+        for e_id in out_edges[queue.popleft()]:
+            v = edges[e_id][1]
+            if v == target_id:
+                return True
+            if not visited[v]:
+                visited[v] = True
+                queue.append(v)
+    return False
+
+
+def reachable_vertices[T](graph: DirectedGraphIncidence[T], source: T) -> set[T]:
+    return set(bfs(graph, source))
+
+
+def topological_sort[T](graph: DirectedGraphIncidence[T]) -> list[T]:
+    # алгоритм Кана
+    edges, out_edges = graph._edges, graph._out_edges
+    in_degree = [0] * len(graph._vertices)
+    for _, v in edges:
+        in_degree[v] += 1
+    queue = deque(v_id for v_id in graph._order if in_degree[v_id] == 0)
+    order = []
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for e_id in out_edges[u]:
+            v = edges[e_id][1]
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                queue.append(v)
+    if len(order) != len(graph._order):
+        raise GraphHasCycleError("Graph contains a cycle")
+    vertices = graph._vertices
+    return [vertices[v_id] for v_id in order]
+
+
+def strongly_connected_components[T](graph: DirectedGraphIncidence[T]) -> list[list[T]]:
+    # алгоритм Тарьяна без рекурсии: стек вызовов хранит пары (вершина, позиция в списке дуг)
+    edges, out_edges, vertices = graph._edges, graph._out_edges, graph._vertices
+    n = len(vertices)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+
+    for root in graph._order:
+        if index[root] != -1:
+            continue
+        call_stack = [(root, 0)]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while call_stack:
+            u, pos = call_stack[-1]
+            bucket = out_edges[u]
+            if pos < len(bucket):
+                call_stack[-1] = (u, pos + 1)
+                v = edges[bucket[pos]][1]
+                if index[v] == -1:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = True
+                    call_stack.append((v, 0))
+                elif on_stack[v]:
+                    low[u] = min(low[u], index[v])
+                continue
+
+            call_stack.pop()
+            if call_stack:
+                parent = call_stack[-1][0]
+                low[parent] = min(low[parent], low[u])
+            if low[u] == index[u]:
+                component = []
+                while True:
+                    v = stack.pop()
+                    on_stack[v] = False
+                    component.append(vertices[v])
+                    if v == u:
+                        break
+                components.append(component)
+    return components
+
+
+def dijkstra[T](
+    graph: DirectedGraphIncidence[T],
+    source: T,
+    weight: Callable[[T, T], float] | str | None = None
+) -> dict[T, float]:
+    # weight — функция weight(from, to) или имя числового атрибута дуг
+    # (например, "weight"); без него все веса равны 1. Если у графа нет
+    # столбца "weight", веса тоже единичные.
+    # В результат попадают только достижимые вершины.
+    edges, out_edges, vertices = graph._edges, graph._out_edges, graph._vertices
+    column = None
+    if isinstance(weight, str):
+        column = graph._edge_columns.get(weight)
+        if column is None:
+            if weight != "weight":
+                raise KeyError(weight)
+            weight = None
+    source_id = graph._get_vertex_id(source)
+    dist = {source_id: 0.0}
+    done = [False] * len(vertices)
+    heap = [(0.0, source_id)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        for e_id in out_edges[u]:
+            v = edges[e_id][1]
+            if column is not None:
+                w = column[e_id]
+            elif weight is None:
+                w = 1.0
+            else:
+                w = weight(vertices[u], vertices[v])
+            if w < 0:
+                raise ValueError(f"Negative edge weight ({vertices[u]} -> {vertices[v]}): {w}")
+            nd = d + w
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return {vertices[v_id]: d for v_id, d in dist.items()}
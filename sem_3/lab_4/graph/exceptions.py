@@ -21,4 +21,18 @@ class EdgeNotExistsError(GraphError):
 
 class EdgeAlreadyExistsError(GraphError):
     """Выбрасывается при попытке добавить дугу, которая уже существует."""
-    pass
\ No newline at end of file
+    pass
+
+class ConcurrentModificationError(GraphError):
+    """Выбрасывается, если граф изменился во время обхода итератором."""
+    pass
+
+
+class GraphHasCycleError(GraphError):
+    """Выбрасывается, если операция требует ациклического графа."""
+    pass
+
+
+class GraphFormatError(GraphError):
+    """Выбрасывается, если файл графа повреждён или имеет неизвестную версию."""
+    pass
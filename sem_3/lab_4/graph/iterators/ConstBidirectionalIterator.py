@@ -1,7 +1,10 @@
+from collections.abc import Sequence
+
 from .BidirectionalIterator import BidirectionalIterator
+from .views import same_container
 
 class ConstBidirectionalIterator[T]:
-    def __init__(self, container: list[T], reverse: bool = False):
+    def __init__(self, container: Sequence[T], reverse: bool = False):
         self._container = container
         self._reverse = reverse
         if reverse:
@@ -38,7 +41,7 @@ class ConstBidirectionalIterator[T]:
         if not hasattr(other, '_container'):
             return False
         return (
-            self._container is other._container and
+            same_container(self._container, other._container) and
             self._index == other._index and
             self._reverse == other._reverse
         )
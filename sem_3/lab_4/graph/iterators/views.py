@@ -0,0 +1,129 @@
+from ..exceptions import ConcurrentModificationError
+
+
+class GraphView[T]:
+    # ленивое представление части графа: элементы читаются из хранилища
+    # по индексу, без копирования; изменение графа делает вид недействительным
+    def __init__(self, graph):
+        self._graph = graph
+        self._version = graph._version
+
+    def _check_version(self) -> None:
+        if self._graph._version != self._version:
+            raise ConcurrentModificationError("Graph was modified during iteration")
+
+    def _resync(self) -> None:
+        # граф изменён через итератор этого вида (erase) — вид остаётся действительным
+        self._version = self._graph._version
+
+    def _key(self) -> tuple:
+        return type(self), id(self._graph)
+
+    def __eq__(self, other) -> bool:
+        # виды одного рода над одним графом равны, как и прежние общие списки
+        if not isinstance(other, GraphView):
+            return NotImplemented
+        return self._graph is other._graph and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __len__(self) -> int:
+        self._check_version()
+        return self._length()
+
+    def __getitem__(self, index: int) -> T:
+        self._check_version()
+        if not (0 <= index < self._length()):
+            raise IndexError(index)
+        return self._item(index)
+
+    def _length(self) -> int:
+        raise NotImplementedError
+
+    def _item(self, index: int) -> T:
+        raise NotImplementedError
+
+
+class VertexView[T](GraphView[T]):
+    def _length(self) -> int:
+        return len(self._graph._order)
+
+    def _item(self, index: int) -> T:
+        graph = self._graph
+        return graph._vertices[graph._order[index]]
+
+    def _vertex_id(self, index: int) -> int:
+        self._check_version()
+        return self._graph._order[index]
+
+
+class EdgeView[T](GraphView[tuple[T, T]]):
+    def _length(self) -> int:
+        return len(self._graph._edges)
+
+    def _item(self, index: int) -> tuple[T, T]:
+        return self._graph._edge_values(index)
+
+    def _edge_id(self, index: int) -> int:
+        self._check_version()
+        return index
+
+
+class IncidentEdgeView[T](GraphView[tuple[T, T]]):
+    # сначала исходящие дуги вершины, затем входящие
+    def __init__(self, graph, v_id: int):
+        super().__init__(graph)
+        self._v_id = v_id
+        self._out = graph._out_edges[v_id]
+        self._in = graph._in_edges[v_id]
+
+    def _resync(self) -> None:
+        # после копирования при записи у вершины могут быть новые списки дуг
+        super()._resync()
+        self._out = self._graph._out_edges[self._v_id]
+        self._in = self._graph._in_edges[self._v_id]
+
+    def _key(self) -> tuple:
+        return type(self), id(self._graph), self._v_id
+
+    def _length(self) -> int:
+        return len(self._out) + len(self._in)
+
+    def _item(self, index: int) -> tuple[T, T]:
+        return self._graph._edge_values(self._edge_id(index))
+
+    def _edge_id(self, index: int) -> int:
+        self._check_version()
+        if index < len(self._out):
+            return self._out[index]
+        return self._in[index - len(self._out)]
+
+
+class AdjacentVertexView[T](GraphView[T]):
+    def __init__(self, graph, v_id: int):
+        super().__init__(graph)
+        self._v_id = v_id
+        self._out = graph._out_edges[v_id]
+
+    def _resync(self) -> None:
+        super()._resync()
+        self._out = self._graph._out_edges[self._v_id]
+
+    def _key(self) -> tuple:
+        return type(self), id(self._graph), self._v_id
+
+    def _length(self) -> int:
+        return len(self._out)
+
+    def _item(self, index: int) -> T:
+        graph = self._graph
+        return graph._vertices[graph._edges[self._out[index]][1]]
+
+    def _edge_id(self, index: int) -> int:
+        self._check_version()
+        return self._out[index]
+
+
+def same_container(a, b) -> bool:
+    return a is b or (isinstance(a, GraphView) and a == b)
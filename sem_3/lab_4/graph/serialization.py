@@ -0,0 +1,217 @@
+import pickle
+import struct
+from array import array
+from collections.abc import Sequence
+
+import numpy as np
+
+from .exceptions import GraphFormatError
+
+# Формат файла (little-endian):
+#   заголовок HEADER, дополненный до 8 байт;
+#   indptr         int64[V + 1] — CSR: дуги вершины v — indices[indptr[v]:indptr[v + 1]];
+#   vertex_offsets int64[V + 1] — границы закодированных значений вершин в blob;
+#   indices        int32[E]     — конечные вершины дуг, упорядоченные по начальной;
+#   blob           bytes        — значения вершин, закодированные кодеком;
+#   (версия 2) числовые атрибуты дуг: uint32 число столбцов, затем для каждого
+#   uint16 длина имени, имя в UTF-8, float64 значение по умолчанию и float64[E]
+#   значения в порядке indices.
+
+MAGIC = b"DGIG"
+FORMAT_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sHHQQQ16s")  # magic, version, флаги, V, E, размер blob, имя кодека
+HEADER_SIZE = (HEADER.size + 7) // 8 * 8
+FLAG_MULTIGRAPH = 1
+
+
+class PickleCodec:
+    name = "pickle"
+
+    def encode(self, value) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes):
+        return pickle.loads(data)
+
+
+class StrCodec:
+    name = "str"
+
+    def encode(self, value: str) -> bytes:
+        return value.encode("utf-8")
+
+    def decode(self, data: bytes) -> str:
+        return data.decode("utf-8")
+
+
+class IntCodec:
+    name = "int"
+
+    def encode(self, value: int) -> bytes:
+        return value.to_bytes(8, "little", signed=True)
+
+    def decode(self, data: bytes) -> int:
+        return int.from_bytes(data, "little", signed=True)
+
+
+CODECS = {codec.name: codec for codec in (PickleCodec(), StrCodec(), IntCodec())}
+
+
+def register_codec(codec) -> None:
+    # кодек — объект с атрибутом name (до 16 байт ASCII) и методами encode/decode
+    if len(codec.name.encode("ascii")) > 16:
+        raise ValueError(f"Codec name {codec.name!r} is longer than 16 bytes")
+    CODECS[codec.name] = codec
+
+
+def _choose_codec(vertices: Sequence):
+    if all(type(v) is int and -2 ** 63 <= v < 2 ** 63 for v in vertices):
+        return CODECS["int"]
+    if all(type(v) is str for v in vertices):
+        return CODECS["str"]
+    return CODECS["pickle"]
+
+
+class VertexTable(Sequence):
+    # значения вершин декодируются при обращении, blob может быть отображён в память
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray, codec):
+        self._offsets = offsets
+        self._blob = blob
+        self._codec = codec
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int):
+        if not (0 <= index < len(self)):
+            raise IndexError(index)
+        start, stop = int(self._offsets[index]), int(self._offsets[index + 1])
+        return self._codec.decode(self._blob[start:stop].tobytes())
+
+    def __reduce__(self):
+        return tuple, (tuple(self),)
+
+
+def save(graph, path, codec=None) -> None:
+    indptr, indices, vertices, order = graph._csr()
+    if codec is None:
+        codec = _choose_codec(vertices)
+    elif isinstance(codec, str):
+        codec = CODECS[codec]
+
+    encoded = [codec.encode(v) for v in vertices]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+
+    flags = FLAG_MULTIGRAPH if graph.is_multigraph() else 0
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(vertices), len(indices),
+                         int(offsets[-1]), codec.name.encode("ascii"))
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(indptr.astype("<i8").tobytes())
+        f.write(offsets.astype("<i8").tobytes())
+        f.write(indices.astype("<i4").tobytes())
+        for data in encoded:
+            f.write(data)
+
+        f.write(struct.pack("<I", len(graph._edge_columns)))
+        for name, column in graph._edge_columns.items():
+            encoded_name = name.encode("utf-8")
+            f.write(struct.pack("<H", len(encoded_name)) + encoded_name)
+            f.write(struct.pack("<d", graph._edge_defaults[name]))
+            if not isinstance(column, array):
+                column = column.flatten()  # ChunkedList после fork()
+            values = np.frombuffer(column, dtype=np.float64)[order]
+            f.write(values.astype("<f8").tobytes())
+
+
+def _read_array(path, mmap: bool, dtype: str, offset: int, count: int) -> np.ndarray:
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    if mmap:
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+    return np.fromfile(path, dtype=dtype, count=count, offset=offset)
+
+
+def _read_header(path) -> tuple:
+    with open(path, "rb") as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise GraphFormatError(f"{path}: file is too short")
+    header = HEADER.unpack(raw)
+    magic, version = header[:2]
+    if magic != MAGIC:
+        raise GraphFormatError(f"{path}: not a graph file")
+    if version not in SUPPORTED_VERSIONS:
+        raise GraphFormatError(f"{path}: unsupported format version {version}")
+    return header
+
+
+def _read_edge_columns(path, offset: int, n_edges: int) -> dict[str, tuple[float, np.ndarray]]:
+    columns = {}
+    with open(path, "rb") as f:
+        f.seek(offset)
+        (count,) = struct.unpack("<I", f.read(4))
+        for _ in range(count):
+            (name_size,) = struct.unpack("<H", f.read(2))
+            name = f.read(name_size).decode("utf-8")
+            (default,) = struct.unpack("<d", f.read(8))
+            values = np.frombuffer(f.read(8 * n_edges), dtype="<f8")
+            if len(values) != n_edges:
+                raise GraphFormatError(f"{path}: truncated edge attribute {name!r}")
+            columns[name] = (default, values)
+    return columns
+
+
+def open_frozen(path, mmap: bool = True, codec=None):
+    # представление только для чтения: при mmap=True файл не читается целиком
+    from .FrozenGraph import FrozenGraph
+
+    _, _, _, n_vertices, n_edges, blob_size, codec_name = _read_header(path)
+    if codec is None:
+        name = codec_name.rstrip(b"\0").decode("ascii")
+        if name not in CODECS:
+            raise GraphFormatError(f"{path}: unknown vertex codec {name!r}")
+        codec = CODECS[name]
+    elif isinstance(codec, str):
+        codec = CODECS[codec]
+
+    offset = HEADER_SIZE
+    indptr = _read_array(path, mmap, "<i8", offset, n_vertices + 1)
+    offset += 8 * (n_vertices + 1)
+    vertex_offsets = _read_array(path, mmap, "<i8", offset, n_vertices + 1)
+    offset += 8 * (n_vertices + 1)
+    indices = _read_array(path, mmap, "<i4", offset, n_edges)
+    offset += 4 * n_edges
+    blob = _read_array(path, mmap, "u1", offset, blob_size)
+    return FrozenGraph(indptr, indices, VertexTable(vertex_offsets, blob, codec))
+
+
+def load(path, mmap: bool = True, codec=None, frozen: bool = False, graph_type=None):
+    # frozen=True возвращает FrozenGraph поверх файла, иначе — изменяемый граф
+    view = open_frozen(path, mmap=mmap, codec=codec)
+    if frozen:
+        return view
+    if graph_type is None:
+        from .DirectedGraphIncidence import DirectedGraphIncidence
+        graph_type = DirectedGraphIncidence
+
+    _, version, flags, n_vertices, n_edges, blob_size, _ = _read_header(path)
+    graph = graph_type(multigraph=bool(flags & FLAG_MULTIGRAPH))
+    graph.add_vertices_from(view.vertices)
+    sources = np.repeat(np.arange(view.vertex_count()), view.out_degrees())
+    new_edges = list(zip(sources.tolist(), view.indices.tolist()))
+    new_ids = {}
+    for e_id, key in enumerate(new_edges):
+        new_ids.setdefault(key, e_id)
+    if len(new_ids) != len(new_edges) and not graph.is_multigraph():
+        raise GraphFormatError(f"{path}: duplicate edges")
+    graph._append_edges(new_edges, new_ids)
+
+    if version >= 2:
+        offset = HEADER_SIZE + 16 * (n_vertices + 1) + 4 * n_edges + blob_size
+        for name, (default, values) in _read_edge_columns(path, offset, n_edges).items():
+            graph.add_edge_attribute(name, default)
+            graph._edge_columns[name] = array("d", values.astype(np.float64).tobytes())
+    return graph
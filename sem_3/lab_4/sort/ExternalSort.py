@@ -0,0 +1,139 @@
+import heapq
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# наибольший кадр в файле серии: элементы пишутся пачками через pickle.dump,
+# при слиянии в памяти держится по одному кадру на серию
+FRAME_SIZE = 1024
+# по выборке из первых элементов оценивается их размер в памяти
+SAMPLE_SIZE = 256
+
+
+# Внешняя сортировка слиянием для данных больше памяти: вход читается
+# кусками в пределах memory_budget байт, каждый кусок сортируется в памяти
+# (при workers > 1 — в пуле процессов) и сбрасывается во временный файл,
+# затем серии сливаются heapq.merge по не более чем max_fan_in за проход.
+# Устойчивая; результат — генератор. Для пула key должен сериализоваться pickle.
+class ExternalSort:
+    def __init__(self, memory_budget: int = 256 * 2 ** 20, tmpdir: str | None = None,
+                 workers: int | None = None, max_fan_in: int = 64):
+        if memory_budget <= 0:
+            raise ValueError("memory_budget must be positive")
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in must be at least 2")
+        self.memory_budget = memory_budget
+        self.tmpdir = tmpdir
+        self.workers = workers
+        self.max_fan_in = max_fan_in
+
+    def external_sort(self, iterable, key=None, reverse=False):
+        items = iter(iterable)
+        sample = list(islice(items, SAMPLE_SIZE))
+        if not sample:
+            return
+        # при пуле в памяти одновременно до workers + 1 кусков
+        parallel = self.workers is not None and self.workers > 1
+        budget = self.memory_budget // (self.workers + 1) if parallel else self.memory_budget
+        item_size = sum(_estimate_size(x) for x in sample) / len(sample)
+        chunk_size = max(1, int(budget / item_size))
+        # кадры слияния (по одному на серию) тоже укладываются в бюджет
+        frame_size = max(1, min(FRAME_SIZE, chunk_size // self.max_fan_in))
+
+        # если куска меньше выборки, первым куском становится сама выборка
+        first = sample + list(islice(items, max(0, chunk_size - len(sample))))
+        if len(first) < max(chunk_size, SAMPLE_SIZE):
+            # всё поместилось в память — временные файлы не нужны
+            yield from sorted(first, key=key, reverse=reverse)
+            return
+
+        with tempfile.TemporaryDirectory(prefix="external-sort-", dir=self.tmpdir) as directory:
+            chunks = _chunks(first, items, chunk_size)
+            if parallel:
+                runs = self._sort_runs_parallel(chunks, directory, key, reverse, frame_size)
+            else:
+                runs = [_write_run(chunk, directory, key, reverse, frame_size) for chunk in chunks]
+            # многопроходное слияние, пока серий больше max_fan_in
+            while len(runs) > self.max_fan_in:
+                runs = [
+                    _merge_to_run(runs[i:i + self.max_fan_in], directory, key, reverse, frame_size)
+                    for i in range(0, len(runs), self.max_fan_in)
+                ]
+            readers = [_read_run(path) for path in runs]
+            try:
+                yield from heapq.merge(*readers, key=key, reverse=reverse)
+            finally:
+                for reader in readers:
+                    reader.close()
+
+    def _sort_runs_parallel(self, chunks, directory: str, key, reverse: bool, frame_size: int) -> list[str]:
+        # порядок серий совпадает с порядком кусков во входе — это нужно для устойчивости
+        runs = []
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending = []
+            for chunk in chunks:
+                pending.append(pool.submit(_write_run, chunk, directory, key, reverse, frame_size))
+                if len(pending) >= self.workers:
+                    runs.append(pending.pop(0).result())
+            runs.extend(future.result() for future in pending)
+        return runs
+
+
+def _chunks(first: list, items, chunk_size: int):
+    chunk = first
+    while chunk:
+        yield chunk
+        chunk = list(islice(items, chunk_size))
+
+
+def _estimate_size(item) -> int:
+    # объект, его __dict__ или элементы кортежа/списка — на один уровень вглубь
+    size = sys.getsizeof(item)
+    fields = getattr(item, "__dict__", None)
+    if fields is not None:
+        size += sys.getsizeof(fields) + sum(sys.getsizeof(v) for v in fields.values())
+    elif isinstance(item, (tuple, list)):
+        size += sum(sys.getsizeof(v) for v in item)
+    return size
+
+
+def _write_run(chunk: list, directory: str, key, reverse: bool, frame_size: int) -> str:
+    chunk.sort(key=key, reverse=reverse)
+    path = _dump_run(chunk, directory, frame_size)
+    # кусок освобождается до чтения следующего, хотя ссылки на список ещё живы
+    chunk.clear()
+    return path
+
+
+def _dump_run(items, directory: str, frame_size: int) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        items = iter(items)
+        while frame := list(islice(items, frame_size)):
+            pickle.dump(frame, f, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str):
+    with open(path, "rb") as f:
+        while True:
+            try:
+                frame = pickle.load(f)
+            except EOFError:
+                return
+            yield from frame
+
+
+def _merge_to_run(paths: list[str], directory: str, key, reverse: bool, frame_size: int) -> str:
+    readers = [_read_run(path) for path in paths]
+    try:
+        path = _dump_run(heapq.merge(*readers, key=key, reverse=reverse), directory, frame_size)
+    finally:
+        for reader in readers:
+            reader.close()
+    for old in paths:
+        os.remove(old)
+    return path
@@ -0,0 +1,91 @@
+
+
+# Интроспективная сортировка: быстрая сортировка с медианой трёх, при
+# слишком глубокой рекурсии — пирамидальная, короткие отрезки — вставками.
+# Неустойчивая, сравнивает только через "<".
+INSERTION_THRESHOLD = 16
+
+
+class IntroSort:
+    def intro_sort(self, arr, key=None, reverse=False):
+        n = len(arr)
+        if n < 2:
+            return arr
+        keys = [key(x) for x in arr] if key is not None else arr
+        order = list(range(n))
+        _introsort(keys, order, 0, n, 2 * n.bit_length())
+        if reverse:
+            order.reverse()
+        arr[:] = [arr[i] for i in order]
+        return arr
+
+
+def _introsort(keys, order, lo: int, hi: int, depth: int) -> None:
+    while hi - lo > INSERTION_THRESHOLD:
+        if depth == 0:
+            _heap_sort(keys, order, lo, hi)
+            return
+        depth -= 1
+        p = _partition(keys, order, lo, hi)
+        # рекурсия по меньшей части, цикл по большей
+        if p - lo < hi - p:
+            _introsort(keys, order, lo, p, depth)
+            lo = p
+        else:
+            _introsort(keys, order, p, hi, depth)
+            hi = p
+    _insertion_sort(keys, order, lo, hi)
+
+
+def _partition(keys, order, lo: int, hi: int) -> int:
+    # разбиение Хоара: ключи order[lo:p] не больше опорного, order[p:hi] — не меньше
+    a, b, c = keys[order[lo]], keys[order[(lo + hi) // 2]], keys[order[hi - 1]]
+    if b < a:
+        a, b = b, a
+    if c < b:
+        b = a if c < a else c
+    pivot = b
+    i, j = lo, hi - 1
+    while True:
+        while keys[order[i]] < pivot:
+            i += 1
+        while pivot < keys[order[j]]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        order[i], order[j] = order[j], order[i]
+        i += 1
+        j -= 1
+
+
+def _insertion_sort(keys, order, lo: int, hi: int) -> None:
+    for i in range(lo + 1, hi):
+        item = order[i]
+        item_key = keys[item]
+        j = i - 1
+        while j >= lo and item_key < keys[order[j]]:
+            order[j + 1] = order[j]
+            j -= 1
+        order[j + 1] = item
+
+
+def _heap_sort(keys, order, lo: int, hi: int) -> None:
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(keys, order, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        order[lo], order[lo + end] = order[lo + end], order[lo]
+        _sift_down(keys, order, lo, 0, end)
+
+
+def _sift_down(keys, order, lo: int, root: int, n: int) -> None:
+    while True:
+        child = 2 * root + 1
+        if child >= n:
+            return
+        if child + 1 < n and keys[order[lo + child]] < keys[order[lo + child + 1]]:
+            child += 1
+        if not keys[order[lo + root]] < keys[order[lo + child]]:
+            return
+        order[lo + root], order[lo + child] = order[lo + child], order[lo + root]
+        root = child
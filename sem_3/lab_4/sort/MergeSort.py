@@ -0,0 +1,192 @@
+
+
+# Адаптивная сортировка слиянием (по схеме timsort): ищет готовые серии,
+# короткие дополняет вставками, сливает с галопом. Устойчивая, сравнивает
+# только через "<". Сортируется список номеров элементов, ключи не копируются.
+MIN_GALLOP = 7
+
+
+class MergeSort:
+    def merge_sort(self, arr, key=None, reverse=False):
+        n = len(arr)
+        if n < 2:
+            return arr
+        # reverse=True: сортировка перевёрнутого списка с переворотом результата
+        # сохраняет исходный порядок равных элементов
+        items = arr[::-1] if reverse else list(arr)
+        keys = [key(x) for x in items] if key is not None else items
+        order = list(range(n))
+        _timsort(keys, order)
+        if reverse:
+            order.reverse()
+        arr[:] = [items[i] for i in order]
+        return arr
+
+
+def _min_run(n: int) -> int:
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _timsort(keys, order) -> None:
+    n = len(order)
+    min_run = _min_run(n)
+    runs: list[list[int]] = []  # [начало, длина]
+    state = [MIN_GALLOP]
+    lo = 0
+    while lo < n:
+        run_len = _count_run(keys, order, lo, n)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(keys, order, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append([lo, run_len])
+        _merge_collapse(keys, order, runs, state)
+        lo += run_len
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(keys, order, runs, i, state)
+
+
+def _count_run(keys, order, lo: int, hi: int) -> int:
+    # неубывающая серия или строго убывающая (её можно развернуть без потери устойчивости)
+    r = lo + 1
+    if r == hi:
+        return 1
+    if keys[order[r]] < keys[order[lo]]:
+        while r + 1 < hi and keys[order[r + 1]] < keys[order[r]]:
+            r += 1
+        order[lo:r + 1] = order[lo:r + 1][::-1]
+    else:
+        while r + 1 < hi and not keys[order[r + 1]] < keys[order[r]]:
+            r += 1
+    return r + 1 - lo
+
+
+def _binary_insertion_sort(keys, order, lo: int, hi: int, start: int) -> None:
+    # order[lo:start] уже отсортирован
+    for i in range(start, hi):
+        pivot = order[i]
+        pos = _gallop_right(keys, order, keys[pivot], lo, i)
+        order[pos + 1:i + 1] = order[pos:i]
+        order[pos] = pivot
+
+
+def _gallop_right(keys, seq, pivot, lo: int, hi: int) -> int:
+    # первая позиция в seq[lo:hi], где ключ строго больше pivot;
+    # экспоненциальный поиск от lo, затем двоичный
+    step = 1
+    bound = lo
+    while bound < hi and not pivot < keys[seq[bound]]:
+        lo = bound + 1
+        bound = lo + step
+        step *= 2
+    hi = min(bound, hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if pivot < keys[seq[mid]]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _gallop_left(keys, seq, pivot, lo: int, hi: int) -> int:
+    # первая позиция в seq[lo:hi], где ключ не меньше pivot
+    step = 1
+    bound = lo
+    while bound < hi and keys[seq[bound]] < pivot:
+        lo = bound + 1
+        bound = lo + step
+        step *= 2
+    hi = min(bound, hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys[seq[mid]] < pivot:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _merge_collapse(keys, order, runs, state) -> None:
+    # поддерживает инварианты длин серий на стеке (с исправлением для глубины 4)
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _merge_at(keys, order, runs, i, state)
+
+
+def _merge_at(keys, order, runs, i: int, state) -> None:
+    base_a, len_a = runs[i]
+    base_b, len_b = runs[i + 1]
+    runs[i][1] = len_a + len_b
+    del runs[i + 1]
+
+    # начало A, которое меньше B[0], и конец B, который больше A[-1], уже на месте
+    start = _gallop_right(keys, order, keys[order[base_b]], base_a, base_b)
+    len_a -= start - base_a
+    if len_a == 0:
+        return
+    len_b = _gallop_left(keys, order, keys[order[start + len_a - 1]], base_b, base_b + len_b) - base_b
+    if len_b == 0:
+        return
+    _merge_lo(keys, order, start, len_a, base_b, len_b, state)
+
+
+def _merge_lo(keys, order, base_a: int, len_a: int, base_b: int, len_b: int, state) -> None:
+    tmp = order[base_a:base_a + len_a]
+    i, j, k = 0, base_b, base_a
+    end_b = base_b + len_b
+    min_gallop = state[0]
+    while i < len_a and j < end_b:
+        # поэлементное слияние, пока одна серия не выигрывает min_gallop раз подряд
+        count_a = count_b = 0
+        while i < len_a and j < end_b:
+            if keys[order[j]] < keys[tmp[i]]:
+                order[k] = order[j]
+                j += 1
+                count_b += 1
+                count_a = 0
+            else:
+                order[k] = tmp[i]
+                i += 1
+                count_a += 1
+                count_b = 0
+            k += 1
+            if count_a >= min_gallop or count_b >= min_gallop:
+                break
+        # галоп: копирование сразу целых кусков
+        while i < len_a and j < end_b:
+            n_a = _gallop_right(keys, tmp, keys[order[j]], i, len_a) - i
+            order[k:k + n_a] = tmp[i:i + n_a]
+            k += n_a
+            i += n_a
+            if i == len_a:
+                break
+            n_b = _gallop_left(keys, order, keys[tmp[i]], j, end_b) - j
+            order[k:k + n_b] = order[j:j + n_b]
+            k += n_b
+            j += n_b
+            if j == end_b:
+                break
+            order[k] = tmp[i]
+            k += 1
+            i += 1
+            if n_a < MIN_GALLOP and n_b < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+    # остаток B уже на месте
+    order[k:k + len_a - i] = tmp[i:]
+    state[0] = min_gallop
@@ -1,22 +1,60 @@
+import numpy as np
+
+from .RadixSort import int_array, lsd_argsort
+
+# если диапазон ключей больше n в SPARSE_FACTOR раз, ячейки почти все пусты
+# и вместо них используется поразрядная сортировка
+SPARSE_FACTOR = 8
+
 
 class PigeonholeSort:
-    def pigeonhole_sort(self, arr):
-        if not arr:
+    def pigeonhole_sort(self, arr, key=None, reverse=False):
+        # по умолчанию ключ — x.value; массив numpy из целых сортируется целиком
+        # по счётчикам ячеек и возвращается как массив
+        if isinstance(arr, np.ndarray) and key is None:
+            return _sort_int_array(arr, reverse)
+        if len(arr) == 0:
             return arr
 
-        values = [x.value for x in arr]
-        min_val = min(values)
-        max_val = max(values)
-        size = max_val - min_val + 1
+        items = arr[::-1] if reverse else list(arr)
+        get_key = key if key is not None else _value
+        keys = int_array([get_key(x) for x in items])
+        if keys.dtype.kind not in "iub":
+            raise TypeError(f"Pigeonhole sort needs integer keys, got {keys.dtype}")
+
+        low, high = int(keys.min()), int(keys.max())
+        if high - low + 1 > SPARSE_FACTOR * len(keys):
+            order = lsd_argsort(keys)
+        else:
+            # номер ячейки в самом узком типе: для uint8/uint16 устойчивый argsort
+            # numpy выполняется подсчётом
+            holes = _offsets(keys, low).astype(np.min_scalar_type(high - low))
+            order = np.argsort(holes, kind="stable")
+        if reverse:
+            order = order[::-1]
+        return [items[i] for i in order.tolist()]
+
+
+def _value(x):
+    return x.value
 
-        pigeon_holes = [[] for _ in range(size)]
 
-        for obj in arr:
-            index = obj.value - min_val
-            pigeon_holes[index].append(obj)
+def _sort_int_array(arr: np.ndarray, reverse: bool) -> np.ndarray:
+    if arr.dtype.kind not in "iu":
+        raise TypeError(f"Pigeonhole sort needs integer keys, got {arr.dtype}")
+    if len(arr) == 0:
+        return arr.copy()
+    low, high = int(arr.min()), int(arr.max())
+    if high - low + 1 > SPARSE_FACTOR * len(arr):
+        result = arr[lsd_argsort(arr)]
+    else:
+        counts = np.bincount(_offsets(arr, low).astype(np.intp), minlength=high - low + 1)
+        result = np.repeat(np.arange(low, high + 1, dtype=arr.dtype), counts)
+    return result[::-1].copy() if reverse else result
 
-        result = []
-        for hole in pigeon_holes:
-            result.extend(hole)
 
-        return result
\ No newline at end of file
+def _offsets(keys: np.ndarray, low: int) -> np.ndarray:
+    # keys - low без перехода через int64: беззнаковые ключи бывают >= 2**63
+    if keys.dtype.kind == "u":
+        return keys.astype(np.uint64) - np.uint64(low)
+    return keys.astype(np.int64) - low
@@ -0,0 +1,132 @@
+from os.path import commonprefix
+
+import numpy as np
+
+# MSD: отрезки короче этого сортируются вставками
+INSERTION_CUTOFF = 32
+
+
+# Поразрядные сортировки, обе устойчивые и принимают key= и reverse=.
+# LSD по целым ключам: ключи сдвигаются к нулю, раскладываются на байтовые
+# плоскости, и по каждой плоскости, начиная с младшей, выполняется устойчивая
+# сортировка подсчётом (argsort для uint8).
+# MSD по строкам: раскладка по очередному символу, короткие группы — вставками.
+class RadixSort:
+    def radix_sort(self, arr, key=None, reverse=False):
+        # строковые ключи — MSD, остальные — LSD
+        return _sort(arr, key, reverse, _radix_argsort)
+
+    def lsd_radix_sort(self, arr, key=None, reverse=False):
+        return _sort(arr, key, reverse, _lsd_argsort_list)
+
+    def msd_radix_sort(self, arr, key=None, reverse=False):
+        return _sort(arr, key, reverse, _msd_argsort_checked)
+
+
+def _sort(arr, key, reverse, argsort):
+    if len(arr) < 2:
+        return arr
+    # reverse=True: сортировка перевёрнутого списка с переворотом результата
+    # сохраняет исходный порядок равных элементов
+    items = arr[::-1] if reverse else list(arr)
+    order = argsort([key(x) for x in items] if key is not None else items)
+    if reverse:
+        order.reverse()
+    arr[:] = [items[i] for i in order]
+    return arr
+
+
+def _radix_argsort(keys) -> list[int]:
+    if all(isinstance(k, str) for k in keys):
+        return msd_argsort(keys)
+    return _lsd_argsort_list(keys)
+
+
+def _lsd_argsort_list(keys) -> list[int]:
+    return lsd_argsort(_int_keys(keys)).tolist()
+
+
+def _msd_argsort_checked(keys) -> list[int]:
+    if not all(isinstance(k, str) for k in keys):
+        raise TypeError("MSD radix sort needs string keys")
+    return msd_argsort(keys)
+
+
+def int_array(keys) -> np.ndarray:
+    # np.asarray превращает int >= 2**63 во float64; если такие ключи
+    # помещаются в uint64, массив строится беззнаковым
+    array = np.asarray(keys)
+    if array.dtype.kind in "fO" and len(array) and all(isinstance(k, int) for k in keys):
+        try:
+            return np.array(keys, dtype=np.uint64)
+        except OverflowError:
+            pass
+    return array
+
+
+def _int_keys(keys) -> np.ndarray:
+    keys = int_array(keys)
+    if keys.dtype.kind not in "iub":
+        raise TypeError(f"Radix sort needs integer keys, got {keys.dtype}")
+    return keys
+
+
+def lsd_argsort(keys: np.ndarray) -> np.ndarray:
+    # устойчивая перестановка, упорядочивающая целочисленный массив keys
+    n = len(keys)
+    if n == 0:
+        return np.zeros(0, dtype=np.intp)
+    keys = np.asarray(keys)
+    # беззнаковые ключи >= 2**63 не помещаются в int64 и остаются uint64
+    keys = keys.astype(np.uint64 if keys.dtype.kind == "u" else np.int64)
+    low = int(keys.min())
+    shifted = (keys.astype(np.uint64) - np.uint64(low % 2 ** 64)).astype("<u8")
+    width = (int(keys.max()) - low).bit_length()
+    planes = shifted.view(np.uint8).reshape(n, 8)
+    order = np.arange(n)
+    for byte in range((width + 7) // 8):
+        digits = planes[order, byte]
+        order = order[np.argsort(digits, kind="stable")]
+    return order
+
+
+def msd_argsort(keys: list[str]) -> list[int]:
+    # устойчивая перестановка для строк; обход групп в глубину через явный стек,
+    # чтобы длинные общие префиксы не упирались в предел рекурсии
+    order: list[int] = []
+    stack = [(list(range(len(keys))), 0)]
+    while stack:
+        group, depth = stack.pop()
+        if len(group) <= INSERTION_CUTOFF:
+            order.extend(_insertion_sort_suffixes(keys, group, depth))
+            continue
+        buckets: dict[int, list[int]] = {}
+        for i in group:
+            s = keys[i]
+            # закончившаяся строка идёт раньше любых продолжений
+            buckets.setdefault(ord(s[depth]) if depth < len(s) else -1, []).append(i)
+        ended = buckets.pop(-1, None)
+        if ended is None and len(buckets) == 1:
+            # общий префикс пропускается целиком: он совпадает у наименьшей и наибольшей строки
+            strings = [keys[i] for i in group]
+            stack.append((group, len(commonprefix([min(strings), max(strings)]))))
+            continue
+        # потомки кладутся в обратном порядке, чтобы сниматься со стека по возрастанию
+        for char in sorted(buckets, reverse=True):
+            stack.append((buckets[char], depth + 1))
+        if ended:
+            order.extend(ended)
+    return order
+
+
+def _insertion_sort_suffixes(keys: list[str], group: list[int], depth: int) -> list[int]:
+    # у всех строк группы первые depth символов совпадают
+    suffixes = [keys[i][depth:] for i in group]
+    for j in range(1, len(group)):
+        item, suffix = group[j], suffixes[j]
+        k = j - 1
+        while k >= 0 and suffix < suffixes[k]:
+            group[k + 1], suffixes[k + 1] = group[k], suffixes[k]
+            k -= 1
+        group[k + 1], suffixes[k + 1] = item, suffix
+    return group
@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# ниже этого размера процессы не запускаются: пересылка дороже сортировки
+PARALLEL_THRESHOLD = 100_000
+# элементов выборки на одну корзину
+OVERSAMPLING = 64
+# исполнители не порождаются fork(): сортировка может вызываться из
+# многопоточного процесса, и копия его блокировок грозит взаимоблокировкой
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+# Параллельная сортировка выборкой: разделители берутся из случайной
+# выборки ключей, элементы раскладываются по корзинам (по одной-несколько на
+# исполнителя), корзины сортируются в пуле процессов и склеиваются. В процессы
+# уходят только ключи, элементы остаются на месте. Числовые ключи
+# раскладываются и сортируются через NumPy. Устойчивая: равные ключи всегда
+# попадают в одну корзину, а раскладка и сортировка корзин сохраняют порядок.
+class SampleSort:
+    def __init__(self, workers: int | None = None, threshold: int = PARALLEL_THRESHOLD, seed: int | None = None):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError("workers must be positive")
+        self.threshold = threshold
+        self.seed = seed
+
+    def sample_sort(self, arr, key=None, reverse=False):
+        # массив numpy без key сортируется по значениям и возвращается новым массивом
+        if isinstance(arr, np.ndarray) and key is None:
+            return self._sort_array(arr, reverse)
+        n = len(arr)
+        if n < 2:
+            return arr
+        if n < self.threshold or self.workers == 1:
+            arr[:] = sorted(arr, key=key, reverse=reverse)
+            return arr
+
+        items = arr[::-1] if reverse else list(arr)
+        keys = [key(x) for x in items] if key is not None else items
+        numeric = _numeric_keys(keys)
+        if numeric is not None:
+            buckets = _partition_numeric(numeric, self.workers, self._rng())
+            payloads = [numeric[bucket] for bucket in buckets]
+        else:
+            buckets = _partition_objects(keys, self.workers, self._rng())
+            payloads = [[keys[i] for i in bucket] for bucket in buckets]
+
+        with ProcessPoolExecutor(self.workers, mp_context=_MP_CONTEXT) as pool:
+            permutations = list(pool.map(_argsort, payloads))
+        order = np.concatenate([np.asarray(bucket)[np.asarray(perm, dtype=np.intp)]
+                                for bucket, perm in zip(buckets, permutations)]).tolist()
+        if reverse:
+            order.reverse()
+        arr[:] = [items[i] for i in order]
+        return arr
+
+    def _sort_array(self, arr: np.ndarray, reverse: bool) -> np.ndarray:
+        if len(arr) < self.threshold or self.workers == 1:
+            result = np.sort(arr)
+        else:
+            buckets = _partition_numeric(arr, self.workers, self._rng())
+            with ProcessPoolExecutor(self.workers, mp_context=_MP_CONTEXT) as pool:
+                result = np.concatenate(list(pool.map(np.sort, (arr[bucket] for bucket in buckets))))
+        return result[::-1].copy() if reverse else result
+
+    def _rng(self) -> random.Random:
+        return random.Random(self.seed)
+
+
+def _numeric_keys(keys: list) -> np.ndarray | None:
+    # NumPy — только для ключей одного типа: только int (в пределах int64)
+    # или только float. Смесь int и float в float64 теряет точность целых
+    # больше 2**53, поэтому такие ключи идут по общему пути.
+    kinds = set(map(type, keys))
+    if kinds == {float}:
+        return np.asarray(keys, dtype=np.float64)
+    if kinds == {int}:
+        try:
+            return np.asarray(keys, dtype=np.int64)
+        except OverflowError:
+            return None
+    return None
+
+
+def _splitters(sample: list, parts: int) -> list:
+    sample.sort()
+    return [sample[len(sample) * i // parts] for i in range(1, parts)]
+
+
+def _partition_numeric(keys: np.ndarray, parts: int, rng: random.Random) -> list[np.ndarray]:
+    # номера элементов каждой корзины в исходном порядке
+    picks = np.random.default_rng(rng.getrandbits(64)).integers(0, len(keys), parts * OVERSAMPLING)
+    splitters = np.array(_splitters(keys[picks].tolist(), parts), dtype=keys.dtype)
+    bucket_ids = np.searchsorted(splitters, keys, side="right")
+    # раскладка подсчётом: границы корзин — накопленные суммы их размеров, а
+    # устойчивый argsort numpy для uint8/uint16 — один проход подсчётом, O(n)
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(bucket_ids, minlength=parts))))
+    order = np.argsort(bucket_ids.astype(np.min_scalar_type(parts)), kind="stable")
+    return [order[lo:hi] for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+def _partition_objects(keys: list, parts: int, rng: random.Random) -> list[list[int]]:
+    splitters = _splitters([keys[rng.randrange(len(keys))] for _ in range(parts * OVERSAMPLING)], parts)
+    buckets: list[list[int]] = [[] for _ in range(parts)]
+    for i, k in enumerate(keys):
+        buckets[bisect_right(splitters, k)].append(i)
+    return [bucket for bucket in buckets if bucket]
+
+
+def _argsort(keys):
+    # выполняется в исполнителе: устойчивая перестановка корзины
+    if isinstance(keys, np.ndarray):
+        return np.argsort(keys, kind="stable")
+    return sorted(range(len(keys)), key=keys.__getitem__)
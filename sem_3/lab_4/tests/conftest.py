@@ -0,0 +1,12 @@
+import pytest
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+
+
+@pytest.fixture
+def small_graph() -> DirectedGraphIncidence[str]:
+    # A -> C, A -> B, C -> A, петля B -> B и изолированная D
+    return DirectedGraphIncidence[str].from_edge_list(
+        [("A", "C"), ("A", "B"), ("C", "A"), ("B", "B")],
+        vertices=["A", "B", "C", "D"]
+    )
@@ -5,7 +5,8 @@ from graph.exceptions import (
     VertexNotExistsError,
     VertexAlreadyExistsError,
     EdgeNotExistsError,
-    EdgeAlreadyExistsError
+    EdgeAlreadyExistsError,
+    ConcurrentModificationError
 )
 from graph.iterators.BidirectionalIterator import BidirectionalIterator
 from graph.iterators.ConstBidirectionalIterator import ConstBidirectionalIterator
@@ -192,6 +193,55 @@ class TestDirectedGraphIncidence:
         g.erase_edge(it)
         assert g.edge_count() == 0
 
+    def test_iterators_of_same_kind_are_equal(self):
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B")])
+        assert g.begin_vertices() == g.begin_vertices()
+        assert g.const_begin_vertices() == g.begin_vertices()
+        assert g.begin_edges() == g.begin_edges()
+        assert g.begin_incident_edges("A") == g.begin_incident_edges("A")
+        assert g.begin_vertices() != g.begin_edges()
+        assert g.begin_incident_edges("A") != g.begin_incident_edges("B")
+        assert g.begin_vertices() != DirectedGraphIncidence[str].from_edge_list([("A", "B")]).begin_vertices()
+        it = g.begin_vertices()
+        next(it)
+        assert it != g.begin_vertices()
+
+    def test_erase_while_iterating(self):
+        g = DirectedGraphIncidence[int].from_edge_list([(i, i + 1) for i in range(9)])
+        it = g.begin_vertices()
+        seen = []
+        while it._index < len(it._container):
+            value = it._container[it._index]
+            seen.append(value)
+            if value % 2:
+                g.erase_vertex(it)
+            else:
+                next(it)
+        assert sorted(seen) == list(range(10))
+        assert sorted(g.begin_vertices()) == [0, 2, 4, 6, 8]
+
+        g = DirectedGraphIncidence[int].from_edge_list([(0, i) for i in range(1, 6)])
+        for reverse in (False, True):
+            fork = g.fork()
+            it = fork.rbegin_incident_edges(0) if reverse else fork.begin_incident_edges(0)
+            for _ in range(3):
+                fork.erase_edge(it)
+            assert sorted(fork.begin_edges()) == ([(0, 1), (0, 2)] if reverse else [(0, 4), (0, 5)])
+            assert list(it) == sorted(fork.begin_edges(), reverse=reverse)
+            assert g.edge_count() == 5
+
+        it = g.rbegin_edges()
+        while True:
+            try:
+                u, v = it._container[it._index]
+            except IndexError:
+                break
+            if v % 2:
+                g.erase_edge(it)
+            else:
+                next(it)
+        assert sorted(g.begin_edges()) == [(0, 2), (0, 4)]
+
     # === 10. Сравнения и копирование ===
     def test_equality(self):
         g1 = DirectedGraphIncidence[str]()
@@ -261,4 +311,698 @@ class TestDirectedGraphIncidence:
         assert g.has_vertex(a)
         assert g.has_edge(a, b)
         assert g.in_degree(b) == 1
-        assert g.out_degree(a) == 1
\ No newline at end of file
+        assert g.out_degree(a) == 1
+
+    # === 13. Индекс вершин ===
+    def test_vertex_index_after_remove(self):
+        g = DirectedGraphIncidence[str]()
+        for v in "ABCD":
+            g.add_vertex(v)
+        g.add_edge("C", "D")
+        g.remove_vertex("A")
+        assert g.has_vertex("D")
+        assert g.has_edge("C", "D")
+        assert g.out_degree("C") == 1
+        g.add_vertex("A")
+        g.add_edge("A", "D")
+        assert g.in_degree("D") == 2
+
+    def test_unhashable_vertices(self):
+        g = DirectedGraphIncidence[list]()
+        g.add_vertex([1])
+        g.add_vertex([2])
+        g.add_edge([1], [2])
+        assert g.has_edge([1], [2])
+        with pytest.raises(VertexAlreadyExistsError):
+            g.add_vertex([1])
+        g.remove_vertex([1])
+        assert not g.has_vertex([1])
+        assert g.has_vertex([2])
+
+    # === 14. Разреженное хранение инцидентности ===
+    def test_incidence_matrix(self):
+        g = DirectedGraphIncidence[str]()
+        for v in "ABC":
+            g.add_vertex(v)
+        g.add_edge("A", "B")
+        g.add_edge("B", "C")
+        g.add_edge("C", "C")
+        assert g.incidence_matrix() == [
+            [-1, 0, 0],
+            [1, -1, 0],
+            [0, 1, 1],
+        ]
+        g.remove_edge("A", "B")
+        assert g.incidence_matrix() == [
+            [0, 0],
+            [0, -1],
+            [1, 1],
+        ]
+
+    def test_self_loop_degree_and_incident_edges(self):
+        g = DirectedGraphIncidence[str]()
+        g.add_vertex("A")
+        g.add_vertex("B")
+        g.add_edge("A", "A")
+        g.add_edge("B", "A")
+        assert g.in_degree("A") == 2
+        assert g.out_degree("A") == 1
+        assert list(g.begin_incident_edges("A")) == [("A", "A"), ("B", "A")]
+        assert list(g.begin_adjacent_vertices("A")) == ["A"]
+
+    # === 15. Индекс дуг ===
+    def test_edge_index_random_operations(self):
+        import random
+        rng = random.Random(7)
+        g = DirectedGraphIncidence[int]()
+        vertices, edges = set(), set()
+        for _ in range(2000):
+            op = rng.random()
+            a, b = rng.randrange(30), rng.randrange(30)
+            if op < 0.2 and a not in vertices:
+                g.add_vertex(a)
+                vertices.add(a)
+            elif op < 0.6 and a in vertices and b in vertices and (a, b) not in edges:
+                g.add_edge(a, b)
+                edges.add((a, b))
+            elif op < 0.85 and (a, b) in edges:
+                g.remove_edge(a, b)
+                edges.discard((a, b))
+            elif op >= 0.85 and a in vertices:
+                g.remove_vertex(a)
+                vertices.discard(a)
+                edges = {(u, v) for u, v in edges if a not in (u, v)}
+            assert set(g.begin_vertices()) == vertices
+            assert set(g.begin_edges()) == edges
+        for v in vertices:
+            assert g.out_degree(v) == sum(1 for u, _ in edges if u == v)
+            assert g.in_degree(v) == sum(1 for _, w in edges if w == v)
+            assert set(g.begin_adjacent_vertices(v)) == {w for u, w in edges if u == v}
+        for u in vertices:
+            for v in vertices:
+                assert g.has_edge(u, v) == ((u, v) in edges)
+
+    # === 16. Ленивые итераторы ===
+    def test_lazy_iterator_prev(self):
+        g = DirectedGraphIncidence[str]()
+        for v in "ABC":
+            g.add_vertex(v)
+        g.add_edge("A", "B")
+        g.add_edge("A", "C")
+        g.add_edge("C", "A")
+        it = g.begin_incident_edges("A")
+        assert next(it) == ("A", "B")
+        assert next(it) == ("A", "C")
+        assert it.prev() == ("A", "C")
+        assert list(it) == [("A", "C"), ("C", "A")]
+        rit = g.rbegin_adjacent_vertices("A")
+        assert next(rit) == "C"
+        assert rit.prev() == "C"
+
+    def test_iterator_detects_modification(self):
+        g = DirectedGraphIncidence[str]()
+        g.add_vertex("A")
+        g.add_vertex("B")
+        g.add_edge("A", "B")
+        it = g.begin_edges()
+        next(it)
+        g.add_edge("B", "A")
+        with pytest.raises(ConcurrentModificationError):
+            next(it)
+        vertices, other = g.begin_vertices(), g.begin_vertices()
+        g.erase_vertex(vertices)
+        assert next(vertices) == "B"
+        with pytest.raises(ConcurrentModificationError):
+            next(other)
+
+    # === 17. Массовое построение ===
+    def test_from_edge_list(self):
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B"), ("B", "C"), ("C", "A")])
+        assert list(g.begin_vertices()) == ["A", "B", "C"]
+        assert list(g.begin_edges()) == [("A", "B"), ("B", "C"), ("C", "A")]
+        assert g.in_degree("A") == 1
+
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B")], vertices=["A", "B", "Z"])
+        assert g.has_vertex("Z")
+        assert g.out_degree("Z") == 0
+
+    def test_add_edges_from_numpy(self):
+        np = pytest.importorskip("numpy")
+        g = DirectedGraphIncidence[int]()
+        g.add_vertices_from(range(4))
+        g.add_edges_from(np.array([[0, 1], [1, 2], [2, 3], [3, 3]]))
+        assert g.edge_count() == 4
+        assert g.has_edge(3, 3)
+        assert list(g.begin_adjacent_vertices(1)) == [2]
+
+    def test_bulk_errors_report_index_and_leave_graph_unchanged(self):
+        g = DirectedGraphIncidence[str]()
+        g.add_vertices_from(["A", "B"])
+        with pytest.raises(VertexAlreadyExistsError, match="#2"):
+            g.add_vertices_from(["C", "D", "A"])
+        with pytest.raises(EdgeAlreadyExistsError, match="#1"):
+            g.add_edges_from([("A", "B"), ("A", "B")])
+        with pytest.raises(VertexNotExistsError, match="#1"):
+            g.add_edges_from([("A", "B"), ("B", "X")])
+        assert g.vertex_count() == 2
+        assert g.edge_count() == 0
+
+    # === 18. Копирование при записи ===
+    def test_fork_is_independent(self):
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B"), ("B", "C"), ("C", "A")])
+        f = g.fork()
+        assert f == g
+
+        f.remove_vertex("A")
+        f.add_edge("C", "B")
+        g.add_vertex("D")
+        g.add_edge("A", "D")
+
+        assert set(g.begin_edges()) == {("A", "B"), ("B", "C"), ("C", "A"), ("A", "D")}
+        assert set(f.begin_edges()) == {("B", "C"), ("C", "B")}
+        assert g.out_degree("A") == 2
+        assert f.in_degree("B") == 1
+        assert not f.has_vertex("D")
+
+    def test_fork_random_operations(self):
+        import random
+        rng = random.Random(3)
+        g = DirectedGraphIncidence[int].from_edge_list([(i, (i * 7) % 20) for i in range(20)])
+        graphs = [g]
+        models = [set(g.begin_edges())]
+        for _ in range(600):
+            k = rng.randrange(len(graphs))
+            graph, edges = graphs[k], models[k]
+            a, b = rng.randrange(20), rng.randrange(20)
+            op = rng.random()
+            if op < 0.05:
+                graphs.append(graph.fork())
+                models.append(set(edges))
+            elif op < 0.5 and graph.has_vertex(a) and graph.has_vertex(b) and (a, b) not in edges:
+                graph.add_edge(a, b)
+                edges.add((a, b))
+            elif op < 0.9 and (a, b) in edges:
+                graph.remove_edge(a, b)
+                edges.discard((a, b))
+            elif op >= 0.9 and graph.has_vertex(a):
+                graph.remove_vertex(a)
+                models[k] = {(u, v) for u, v in edges if a not in (u, v)}
+            for graph, edges in zip(graphs, models):
+                assert set(graph.begin_edges()) == edges
+        for graph, edges in zip(graphs, models):
+            for v in graph.begin_vertices():
+                assert graph.out_degree(v) == sum(1 for u, _ in edges if u == v)
+                assert graph.in_degree(v) == sum(1 for _, w in edges if w == v)
+
+    def test_fork_edge_changes_are_copy_on_write(self, tmp_path):
+        # что копируются только куски хранилища, проверяет бенчмарк
+        # fork_and_change_edges; здесь — только видимое поведение
+        n = 5000
+        g = DirectedGraphIncidence[int].from_edge_list([(i, (i + 1) % n) for i in range(n)], weights=range(n))
+        f = g.fork()
+        f.set_edge_weight(10, 11, -1.0)
+        f.remove_edge(20, 21)
+        f.add_edge(0, 2)
+
+        assert f.edge_weight(10, 11) == -1.0 and g.edge_weight(10, 11) == 10.0
+        assert not f.has_edge(20, 21) and g.has_edge(20, 21)
+        assert f.has_edge(0, 2) and not g.has_edge(0, 2)
+        assert f.edge_weight(n - 1, 0) == n - 1
+        assert g.edge_count() == n and f.edge_count() == n
+        assert g.out_degree(0) == 1 and f.out_degree(0) == 2
+
+        # и в обратную сторону: изменения исходного графа не видны в копии
+        g.set_edge_weight(30, 31, -2.0)
+        g.remove_edge(40, 41)
+        g.add_edge(5, 7, weight=0.5)
+        g.add_vertex(n)
+
+        assert g.edge_weight(30, 31) == -2.0 and f.edge_weight(30, 31) == 30.0
+        assert not g.has_edge(40, 41) and f.has_edge(40, 41)
+        assert g.has_edge(5, 7) and not f.has_edge(5, 7)
+        assert g.has_vertex(n) and not f.has_vertex(n)
+        assert f.edge_weight(10, 11) == -1.0 and g.edge_weight(10, 11) == 10.0
+        assert g.edge_count() == n and f.edge_count() == n
+
+        f.save(tmp_path / "fork.dgig")
+        g.save(tmp_path / "graph.dgig")
+        loaded_fork = DirectedGraphIncidence.load(tmp_path / "fork.dgig")
+        loaded_graph = DirectedGraphIncidence.load(tmp_path / "graph.dgig")
+        assert loaded_fork == f and loaded_graph == g and loaded_fork != loaded_graph
+        assert loaded_fork.edge_weight(10, 11) == -1.0 and loaded_graph.edge_weight(30, 31) == -2.0
+
+    def test_fork_random_operations_large(self):
+        import random
+        rng = random.Random(5)
+        n = 300
+        g = DirectedGraphIncidence[int].from_edge_list([(i, j) for i in range(n) for j in range(i + 1, min(i + 10, n))])
+        g.add_edge_attribute("weight", 1.0)
+        graphs = [g]
+        models = [{edge: 1.0 for edge in g.begin_edges()}]
+        for step in range(1500):
+            k = rng.randrange(len(graphs))
+            graph, edges = graphs[k], models[k]
+            a, b = rng.randrange(n), rng.randrange(n)
+            op = rng.random()
+            if op < 0.03:
+                graphs.append(graph.fork())
+                models.append(dict(edges))
+            elif op < 0.4 and (a, b) not in edges and graph.has_vertex(a) and graph.has_vertex(b):
+                graph.add_edge(a, b, weight=step)
+                edges[(a, b)] = step
+            elif op < 0.7 and edges:
+                edge = rng.choice(list(edges))
+                graph.remove_edge(*edge)
+                del edges[edge]
+            elif op < 0.95 and edges:
+                edge = rng.choice(list(edges))
+                graph.set_edge_weight(*edge, -step)
+                edges[edge] = -step
+            elif graph.has_vertex(a):
+                graph.remove_vertex(a)
+                models[k] = {edge: w for edge, w in edges.items() if a not in edge}
+        for graph, edges in zip(graphs, models):
+            assert {edge: graph.edge_weight(*edge) for edge in graph.begin_edges()} == edges
+            assert all(graph.has_edge(*edge) for edge in edges)
+
+    def test_copy_uses_fork(self):
+        from copy import copy
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B")])
+        c = copy(g)
+        c.clear()
+        assert g.has_edge("A", "B")
+        assert c.empty()
+
+    # === 19. Веса, атрибуты дуг и мультиграф ===
+    def test_edge_weights(self):
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B"), ("A", "C")])
+        assert g.edge_weight("A", "B") == 1.0
+        g.set_edge_weight("A", "B", 2.5)
+        g.add_edge("C", "B", weight=4.0)
+        assert g.edge_weight("A", "B") == 2.5
+        assert g.edge_weight("A", "C") == 1.0
+        assert g.out_degree("A", weighted=True) == 3.5
+        assert g.in_degree("B", weighted=True) == 6.5
+        g.remove_edge("A", "B")
+        assert g.edge_weight("C", "B") == 4.0
+        with pytest.raises(EdgeNotExistsError):
+            g.edge_weight("A", "B")
+
+    def test_edge_attributes(self):
+        g = DirectedGraphIncidence[str].from_edge_list([("A", "B"), ("B", "C"), ("C", "A")],
+                                                       weights=[1, 2, 3])
+        g.add_edge_attribute("capacity", default=10.0)
+        g.set_edge_attribute("B", "C", "capacity", 5.0)
+        g.add_vertex("D")
+        g.add_edge("D", "A")
+        assert g.edge_attributes() == ["weight", "capacity"]
+        assert g.edge_attribute("D", "A", "capacity") == 10.0
+        g.remove_vertex("A")
+        assert g.edge_attribute("B", "C", "capacity") == 5.0
+        assert g.edge_weight("B", "C") == 2.0
+        with pytest.raises(KeyError):
+            g.edge_attribute("B", "C", "length")
+
+    def test_multigraph(self):
+        g = DirectedGraphIncidence[str](multigraph=True)
+        g.add_vertices_from(["A", "B"])
+        g.add_edge("A", "B", weight=1.0)
+        g.add_edge("A", "B", weight=2.0)
+        g.add_edges_from([("A", "B"), ("B", "A")])
+        assert g.edge_count() == 4
+        assert g.edge_multiplicity("A", "B") == 3
+        assert g.out_degree("A") == 3
+        assert g.out_degree("A", weighted=True) == 4.0
+        g.remove_edge("A", "B")
+        g.remove_edge("A", "B")
+        assert g.edge_multiplicity("A", "B") == 1
+        assert g.has_edge("A", "B")
+        g.remove_edge("A", "B")
+        assert not g.has_edge("A", "B")
+        assert g.edge_count() == 1
+
+        simple = DirectedGraphIncidence[str]()
+        simple.add_vertices_from(["A", "B"])
+        simple.add_edge("A", "B")
+        with pytest.raises(EdgeAlreadyExistsError):
+            simple.add_edge("A", "B")
+
+    def test_multigraph_random_operations(self):
+        import random
+        from collections import Counter
+        rng = random.Random(11)
+        g = DirectedGraphIncidence[int](multigraph=True)
+        g.add_vertices_from(range(8))
+        edges = Counter()
+        vertices = set(range(8))
+        for _ in range(1500):
+            a, b = rng.randrange(8), rng.randrange(8)
+            op = rng.random()
+            if op < 0.55 and a in vertices and b in vertices:
+                g.add_edge(a, b, weight=a * 10 + b)
+                edges[(a, b)] += 1
+            elif op < 0.95 and edges[(a, b)]:
+                g.remove_edge(a, b)
+                edges[(a, b)] -= 1
+            elif op >= 0.95 and a in vertices:
+                g.remove_vertex(a)
+                vertices.discard(a)
+                edges = Counter({k: c for k, c in edges.items() if a not in k})
+            assert g.edge_count() == sum(edges.values())
+        for (a, b), count in edges.items():
+            assert g.edge_multiplicity(a, b) == count
+            if count:
+                assert g.edge_weight(a, b) == a * 10 + b
+
+    # === 20. Пакетное удаление и транзакции ===
+    def _ring(self, n: int) -> DirectedGraphIncidence[int]:
+        edges = [(i, (i + 1) % n) for i in range(n)] + [(i, (i * 3) % n) for i in range(n) if (i * 3) % n != (i + 1) % n]
+        return DirectedGraphIncidence[int].from_edge_list(edges, weights=[float(u) for u, _ in edges])
+
+    @pytest.mark.parametrize("count", [1, 30])
+    def test_remove_vertices(self, count):
+        g = self._ring(60)
+        expected = g.fork()
+        doomed = list(range(0, 2 * count, 2))
+        for v in doomed:
+            expected.remove_vertex(v)
+        g.remove_vertices(doomed)
+        assert set(g.begin_vertices()) == set(expected.begin_vertices())
+        assert set(g.begin_edges()) == set(expected.begin_edges())
+        for u, v in g.begin_edges():
+            assert g.edge_weight(u, v) == float(u)
+        for v in g.begin_vertices():
+            assert g.in_degree(v) == expected.in_degree(v)
+
+    @pytest.mark.parametrize("count", [1, 40])
+    def test_remove_edges(self, count):
+        g = self._ring(60)
+        doomed = list(g.begin_edges())[:count]
+        g.remove_edges(doomed)
+        assert g.edge_count() == self._ring(60).edge_count() - count
+        assert not any(g.has_edge(u, v) for u, v in doomed)
+        for u, v in g.begin_edges():
+            assert g.edge_weight(u, v) == float(u)
+
+    def test_bulk_remove_is_atomic(self):
+        g = self._ring(10)
+        with pytest.raises(VertexNotExistsError, match="#2"):
+            g.remove_vertices([1, 2, 99])
+        with pytest.raises(EdgeNotExistsError, match="#1"):
+            g.remove_edges([(0, 1), (0, 1)])
+        assert g.vertex_count() == 10
+        assert g.has_edge(0, 1)
+
+    def test_batch_commit(self):
+        g = self._ring(40)
+        with g.batch() as batch:
+            for v in range(20):
+                batch.remove_vertex(v)
+            batch.remove_edge(30, 31)
+            assert g.vertex_count() == 40
+        assert g.vertex_count() == 20
+        assert not g.has_edge(30, 31)
+        assert g.has_edge(31, 32)
+
+    def test_batch_rollback(self):
+        g = self._ring(10)
+        before = set(g.begin_edges())
+        it = g.begin_edges()
+        with pytest.raises(RuntimeError):
+            with g.batch() as batch:
+                g.add_vertex(100)
+                g.remove_edge(0, 1)
+                batch.remove_vertex(5)
+                raise RuntimeError("boom")
+        assert set(g.begin_edges()) == before
+        assert not g.has_vertex(100)
+        with pytest.raises(ConcurrentModificationError):
+            next(it)
+
+        with pytest.raises(EdgeNotExistsError):
+            with g.batch() as batch:
+                batch.remove_vertex(3)
+                batch.remove_edge(5, 9)
+        assert g.has_vertex(3)
+        assert set(g.begin_edges()) == before
+
+    # === 21. Стабильные дескрипторы вершин ===
+    def test_handles_survive_removal(self):
+        g = DirectedGraphIncidence[str]()
+        handles = g.add_vertices_from("abcde")
+        g.add_edges_from([("a", "b"), ("b", "c"), ("d", "e"), ("e", "a")])
+        g.remove_vertex("b")
+        assert not g.is_valid_handle(handles[1])
+        for value, handle in zip("acde", handles[:1] + handles[2:]):
+            assert g.vertex_value(handle) == value
+            assert g.vertex_handle(value) == handle
+        with pytest.raises(VertexNotExistsError):
+            g.vertex_value(handles[1])
+
+        # слот переиспользуется, но старый дескриптор остаётся недействительным
+        new = g.add_vertex("f")
+        assert new != handles[1]
+        assert not g.is_valid_handle(handles[1])
+        assert g.vertex_value(new) == "f"
+        assert set(g.begin_vertices()) == set("acdef")
+        assert set(g.begin_edges()) == {("d", "e"), ("e", "a")}
+
+    def test_erase_by_handles(self):
+        g = DirectedGraphIncidence[int].from_edge_list([(0, 1), (1, 2), (2, 0)])
+        h0, h1 = g.vertex_handle(0), g.vertex_handle(1)
+        g.erase_edge((h0, h1))
+        assert not g.has_edge(0, 1)
+        with pytest.raises(EdgeNotExistsError):
+            g.erase_edge((h0, h1))
+        g.erase_vertex(h1)
+        assert not g.has_vertex(1)
+        with pytest.raises(VertexNotExistsError):
+            g.erase_vertex(h1)
+        assert list(g.begin_edges()) == [(2, 0)]
+
+    def test_erase_through_incident_view(self):
+        g = DirectedGraphIncidence[int]()
+        g.add_vertices_from(range(3))
+        g.add_edges_from([(0, 1), (0, 2), (1, 0)])
+        it = g.begin_incident_edges(0)
+        next(it)
+        g.erase_edge(it)
+        assert g.edge_count() == 2
+        assert g.out_degree(0) + g.in_degree(0) == 2
+
+    def test_unhashable_after_removal(self):
+        g = DirectedGraphIncidence[ExampleClass]()
+        a, b, c = ExampleClass(1), ExampleClass(2), ExampleClass(3)
+        handles = g.add_vertices_from([a, b, c])
+        g.add_edge(a, c)
+        g.remove_vertex(b)
+        assert g.has_vertex(c)
+        assert g.vertex_handle(c) == handles[2]
+        assert g.has_edge(a, c)
+
+    def test_slot_compaction_fuzz(self):
+        import random
+        rng = random.Random(7)
+        g = DirectedGraphIncidence[int]()
+        alive = {}
+        for step in range(3000):
+            if alive and rng.random() < 0.45:
+                value = rng.choice(list(alive))
+                g.remove_vertex(value)
+                del alive[value]
+            else:
+                alive[step] = g.add_vertex(step)
+                if len(alive) > 1:
+                    other = rng.choice(list(alive))
+                    if other != step:
+                        g.add_edge(step, other)
+        assert g.vertex_count() == len(alive)
+        assert set(g.begin_vertices()) == set(alive)
+        assert all(g.vertex_value(h) == v for v, h in alive.items())
+        assert len(g._vertices) <= 2 * len(alive) + 16 or len(g._free) <= 2 * len(g._vertices) + 16
+        assert g == deepcopy(g)
+        assert g.freeze().vertex_count() == len(alive)
+
+    # === 22. Счётчики степеней и журнал изменений ===
+    @staticmethod
+    def _replay(log, replica: DirectedGraphIncidence) -> None:
+        for op, u, v in log:
+            if op == "clear":
+                replica.clear()
+            elif op in ("add_vertex", "remove_vertex"):
+                getattr(replica, op)(u)
+            else:
+                getattr(replica, op)(u, v)
+
+    def test_degree_counters_fuzz(self):
+        import random
+        rng = random.Random(3)
+        g = DirectedGraphIncidence[int](multigraph=True)
+        g.add_vertices_from(range(30))
+        for _ in range(2000):
+            r = rng.random()
+            if r < 0.5:
+                g.add_edge(rng.randrange(30), rng.randrange(30))
+            elif r < 0.85 and g.edge_count():
+                g.remove_edge(*rng.choice(list(g.begin_edges())))
+            elif r < 0.95:
+                g.remove_edges([e for e in g.begin_edges() if rng.random() < 0.3])
+            else:
+                value = rng.randrange(30)
+                g.remove_vertex(value)
+                g.add_vertex(value)
+        edges = list(g.begin_edges())
+        for v in range(30):
+            assert g.in_degree(v) == sum(1 for _, to in edges if to == v)
+            assert g.out_degree(v) == sum(1 for frm, _ in edges if frm == v)
+            assert g.in_degree(v, weighted=True) == g.in_degree(v)
+
+    def test_mutation_log_replay(self):
+        g = DirectedGraphIncidence[int]()
+        with pytest.raises(ValueError):
+            g.mutation_log()
+        g.enable_mutation_log()
+        g.add_vertices_from(range(6))
+        g.add_edges_from([(0, 1), (1, 2), (2, 0), (3, 4)])
+        g.add_edge(4, 4)
+        g.remove_edge(1, 2)
+        g.remove_vertex(0)
+        assert g.mutation_log()[:2] == [("add_vertex", 0, None), ("add_vertex", 1, None)]
+        # удаление вершины записывается вместе с её дугами
+        assert g.mutation_log(-3) == [("remove_edge", 0, 1), ("remove_edge", 2, 0), ("remove_vertex", 0, None)]
+
+        replica = DirectedGraphIncidence[int]()
+        self._replay(g.mutation_log(), replica)
+        assert set(replica.begin_vertices()) == set(g.begin_vertices())
+        assert sorted(replica.begin_edges()) == sorted(g.begin_edges())
+
+        # копия журнал не наследует
+        assert g.fork()._log is None
+        g.disable_mutation_log()
+        g.add_vertex(100)
+        with pytest.raises(ValueError):
+            g.mutation_log()
+
+    def test_mutation_log_rollback(self):
+        g = self._ring(8)
+        g.enable_mutation_log()
+        with pytest.raises(RuntimeError):
+            with g.batch() as batch:
+                g.add_vertex(100)
+                g.add_edge(100, 0)
+                batch.remove_vertex(1)
+                raise RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            with g.batch():
+                g.remove_vertex(2)
+                g.clear()
+                raise RuntimeError("boom")
+
+        replica = self._ring(8)
+        self._replay(g.mutation_log(), replica)
+        assert sorted(replica.begin_vertices()) == sorted(g.begin_vertices())
+        assert sorted(replica.begin_edges()) == sorted(g.begin_edges())
+        assert ("remove_vertex", 100, None) in g.mutation_log()
+
+    # === 23. Отпечаток графа и сравнение ===
+    def test_equality_ignores_insertion_order(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 3)]
+        g1 = DirectedGraphIncidence[int].from_edge_list(edges, vertices=range(4))
+        g2 = DirectedGraphIncidence[int].from_edge_list(edges[::-1], vertices=[3, 1, 2, 0])
+        assert g1 == g2
+        assert g1.graph_fingerprint() == g2.graph_fingerprint()
+        g2.remove_edge(2, 3)
+        assert g1 != g2
+        assert g1.graph_fingerprint() != g2.graph_fingerprint()
+        g2.add_edge(3, 2)
+        assert g1 != g2
+        g2.remove_edge(3, 2)
+        g2.add_edge(2, 3)
+        assert g1 == g2
+
+    def test_fingerprint_incremental_matches_full(self):
+        import random
+        rng = random.Random(11)
+        g = DirectedGraphIncidence[str](multigraph=True)
+        g.graph_fingerprint()
+        for step in range(1500):
+            r = rng.random()
+            names = list(g.begin_vertices())
+            if r < 0.3 or len(names) < 2:
+                g.add_vertex(f"v{step}")
+            elif r < 0.7:
+                g.add_edge(rng.choice(names), rng.choice(names))
+            elif r < 0.8 and g.edge_count():
+                g.remove_edge(*rng.choice(list(g.begin_edges())))
+            elif r < 0.9:
+                g.remove_vertices(rng.sample(names, len(names) // 5))
+            else:
+                g.remove_vertex(rng.choice(names))
+        incremental = g.graph_fingerprint()
+        g._fingerprint = None
+        assert g.graph_fingerprint() == incremental
+        assert 0 <= incremental < 2 ** 128
+        g.clear()
+        assert g.graph_fingerprint() == DirectedGraphIncidence[str]().graph_fingerprint() == 0
+
+    def test_fingerprint_multiset_and_unhashable(self):
+        g1 = DirectedGraphIncidence[int](multigraph=True)
+        g2 = DirectedGraphIncidence[int](multigraph=True)
+        for g in (g1, g2):
+            g.add_vertices_from([0, 1])
+            g.add_edge(0, 1)
+        g1.add_edge(0, 1)
+        assert g1.graph_fingerprint() != g2.graph_fingerprint()
+        assert g1 != g2
+
+        a, b = ExampleClass(1), ExampleClass(2)
+        h1 = DirectedGraphIncidence[ExampleClass].from_edge_list([(a, b)], vertices=[a, b])
+        h2 = DirectedGraphIncidence[ExampleClass].from_edge_list([(b, a)], vertices=[b, a])
+        assert h1.graph_fingerprint() == h2.graph_fingerprint()
+        assert h1 != h2
+
+    def test_fingerprint_separates_values_hash_confuses(self):
+        # hash(-1) == hash(-2) и hash(0) == hash(2**61 - 1) в CPython
+        g1 = DirectedGraphIncidence[int].from_edge_list([(-1, 5)])
+        g2 = DirectedGraphIncidence[int].from_edge_list([(-2, 5)])
+        assert g1.graph_fingerprint() != g2.graph_fingerprint()
+        h1 = DirectedGraphIncidence[int].from_edge_list([], vertices=[0])
+        h2 = DirectedGraphIncidence[int].from_edge_list([], vertices=[2 ** 61 - 1])
+        assert h1.graph_fingerprint() != h2.graph_fingerprint()
+        # равные значения разных типов дают равный отпечаток, как и ==
+        f1 = DirectedGraphIncidence.from_edge_list([(1, 2.5)])
+        f2 = DirectedGraphIncidence.from_edge_list([(1.0, 2.5)])
+        assert f1 == f2
+        assert f1.graph_fingerprint() == f2.graph_fingerprint()
+
+    def test_fingerprint_of_decimal_and_fraction(self):
+        from decimal import Decimal
+        from fractions import Fraction
+        g = DirectedGraphIncidence.from_edge_list([(1, 0.5)])
+        for first, second in [(Decimal(1), Decimal("0.5")), (Fraction(1), Fraction(1, 2)), (True, Decimal("0.50"))]:
+            h = DirectedGraphIncidence.from_edge_list([(first, second)])
+            assert h.graph_fingerprint() == g.graph_fingerprint()
+            assert h == g
+        # Decimal("0.1") != 0.1: двоичная дробь 0.1 не равна десятичной
+        assert DirectedGraphIncidence.from_edge_list([], vertices=[Decimal("0.1")]) != \
+            DirectedGraphIncidence.from_edge_list([], vertices=[0.1])
+        assert DirectedGraphIncidence.from_edge_list([], vertices=[Fraction(1, 3)]).graph_fingerprint() != \
+            DirectedGraphIncidence.from_edge_list([], vertices=[Fraction(2, 3)]).graph_fingerprint()
+
+    def test_fingerprint_same_across_processes(self):
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+        code = (
+            "from graph.DirectedGraphIncidence import DirectedGraphIncidence as G;"
+            "print(G.from_edge_list([('a', 'b'), (b'x', ('a', 1)), (None, 2.5)]).graph_fingerprint())"
+        )
+        results = set()
+        for seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            out = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent, env=env,
+                                 capture_output=True, text=True, check=True)
+            results.add(int(out.stdout))
+        g = DirectedGraphIncidence.from_edge_list([("a", "b"), (b"x", ("a", 1)), (None, 2.5)])
+        assert results == {g.graph_fingerprint()}
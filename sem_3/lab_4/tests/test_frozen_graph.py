@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.FrozenGraph import FrozenGraph
+from graph.exceptions import VertexNotExistsError
+
+
+class TestFrozenGraph:
+
+    def test_to_csr(self, small_graph):
+        indptr, indices, vertices = small_graph.to_csr()
+        assert indptr.tolist() == [0, 2, 3, 4, 4]
+        assert indices.tolist() == [1, 2, 1, 0]
+        assert vertices == ("A", "B", "C", "D")
+
+    def test_queries_match_graph(self, small_graph):
+        g = small_graph
+        frozen = g.freeze()
+        assert frozen.vertex_count() == g.vertex_count()
+        assert frozen.edge_count() == g.edge_count()
+        for u in "ABCD":
+            assert frozen.out_degree(u) == g.out_degree(u)
+            assert frozen.in_degree(u) == g.in_degree(u)
+            assert set(frozen.adjacent_vertices(u)) == set(g.begin_adjacent_vertices(u))
+            for v in "ABCD":
+                assert frozen.has_edge(u, v) == g.has_edge(u, v)
+        assert not frozen.has_edge("A", "X")
+        with pytest.raises(VertexNotExistsError):
+            frozen.out_degree("X")
+
+    def test_degree_arrays(self, small_graph):
+        frozen = small_graph.freeze()
+        assert frozen.out_degrees().tolist() == [2, 1, 1, 0]
+        assert frozen.in_degrees().tolist() == [1, 2, 1, 0]
+
+    def test_read_only_and_picklable(self, small_graph):
+        frozen = FrozenGraph.from_graph(small_graph)
+        with pytest.raises(ValueError):
+            frozen.indices[0] = 3
+        restored = pickle.loads(pickle.dumps(frozen))
+        assert restored.has_edge("C", "A")
+        assert list(restored.begin_vertices()) == ["A", "B", "C", "D"]
+
+    def test_empty_graph(self):
+        frozen = DirectedGraphIncidence[int]().freeze()
+        assert frozen.empty()
+        assert frozen.edge_count() == 0
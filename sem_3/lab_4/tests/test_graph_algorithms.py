@@ -0,0 +1,102 @@
+import pytest
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.exceptions import GraphHasCycleError, VertexNotExistsError
+from graph.algorithms import (
+    bfs,
+    dfs,
+    is_reachable,
+    reachable_vertices,
+    topological_sort,
+    strongly_connected_components,
+    dijkstra
+)
+
+
+def make_graph(edges, vertices=None) -> DirectedGraphIncidence[str]:
+    return DirectedGraphIncidence[str].from_edge_list(edges, vertices=vertices)
+
+
+class TestTraversal:
+
+    def test_bfs_order(self):
+        g = make_graph([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E")])
+        assert bfs(g, "A") == ["A", "B", "C", "D", "E"]
+        assert bfs(g, "D") == ["D", "E"]
+
+    def test_dfs_order(self):
+        g = make_graph([("A", "B"), ("A", "C"), ("B", "D"), ("C", "E")])
+        assert dfs(g, "A") == ["A", "B", "D", "C", "E"]
+
+    def test_unknown_source_raises(self):
+        g = make_graph([("A", "B")])
+        with pytest.raises(VertexNotExistsError):
+            bfs(g, "X")
+
+    def test_reachability(self):
+        g = make_graph([("A", "B"), ("B", "C")], vertices=["A", "B", "C", "D"])
+        assert is_reachable(g, "A", "C")
+        assert not is_reachable(g, "C", "A")
+        assert reachable_vertices(g, "B") == {"B", "C"}
+
+    def test_reachability_stops_at_target(self):
+        g = make_graph([("A", "B"), ("A", "C"), ("C", "D")], vertices=["A", "B", "C", "D"])
+        assert is_reachable(g, "A", "A")
+        assert is_reachable(g, "A", "B")
+        assert is_reachable(g, "A", "D")
+        assert not is_reachable(g, "B", "D")
+
+
+class TestOrdering:
+
+    def test_topological_sort(self):
+        g = make_graph([("shirt", "tie"), ("tie", "jacket"), ("pants", "shoes"), ("pants", "jacket")])
+        order = topological_sort(g)
+        for u, v in g.begin_edges():
+            assert order.index(u) < order.index(v)
+
+    def test_topological_sort_cycle_raises(self):
+        g = make_graph([("A", "B"), ("B", "A")])
+        with pytest.raises(GraphHasCycleError):
+            topological_sort(g)
+
+    def test_strongly_connected_components(self):
+        g = make_graph([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E"), ("E", "D")],
+                       vertices=["A", "B", "C", "D", "E", "F"])
+        components = {frozenset(c) for c in strongly_connected_components(g)}
+        assert components == {frozenset("ABC"), frozenset("DE"), frozenset("F")}
+
+    def test_scc_deep_chain_has_no_recursion_limit(self):
+        n = 20000
+        g = DirectedGraphIncidence[int].from_edge_list([(i, i + 1) for i in range(n)] + [(n, 0)])
+        assert len(strongly_connected_components(g)) == 1
+
+
+class TestDijkstra:
+
+    def test_unweighted(self):
+        g = make_graph([("A", "B"), ("B", "C"), ("A", "C")], vertices=["A", "B", "C", "D"])
+        assert dijkstra(g, "A") == {"A": 0, "B": 1, "C": 1}
+
+    def test_weighted(self):
+        weights = {("A", "B"): 1, ("B", "C"): 2, ("A", "C"): 5}
+        g = make_graph(list(weights))
+        assert dijkstra(g, "A", weight=lambda u, v: weights[(u, v)]) == {"A": 0, "B": 1, "C": 3}
+
+    def test_negative_weight_raises(self):
+        g = make_graph([("A", "B")])
+        with pytest.raises(ValueError):
+            dijkstra(g, "A", weight=lambda u, v: -1)
+
+    def test_weight_attribute(self):
+        g = DirectedGraphIncidence[str](multigraph=True)
+        g.add_vertices_from("ABC")
+        g.add_edge("A", "B", weight=5)
+        g.add_edge("A", "B", weight=1)
+        g.add_edge("B", "C", weight=1)
+        assert dijkstra(g, "A", weight="weight") == {"A": 0, "B": 1, "C": 2}
+        with pytest.raises(KeyError):
+            dijkstra(g, "A", weight="length")
+
+    def test_weight_attribute_missing_means_unit_weights(self):
+        g = make_graph([("A", "B"), ("B", "C"), ("A", "C")])
+        assert dijkstra(g, "A", weight="weight") == {"A": 0, "B": 1, "C": 1}
@@ -0,0 +1,110 @@
+import gc
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.GraphAnalytics import GraphAnalytics
+
+
+def random_graph(n: int, m: int, seed: int = 1) -> DirectedGraphIncidence[int]:
+    rng = random.Random(seed)
+    edges = {(rng.randrange(n), rng.randrange(n)) for _ in range(m)}
+    return DirectedGraphIncidence[int].from_edge_list(sorted(edges), vertices=range(n))
+
+
+def reference_pagerank(g, damping=0.85, iterations=200):
+    vertices = list(g.begin_vertices())
+    n = len(vertices)
+    rank = {v: 1.0 / n for v in vertices}
+    for _ in range(iterations):
+        dangling = sum(rank[v] for v in vertices if g.out_degree(v) == 0)
+        new = {v: (1.0 - damping) / n + damping * dangling / n for v in vertices}
+        for u, v in g.begin_edges():
+            new[v] += damping * rank[u] / g.out_degree(u)
+        rank = new
+    return rank
+
+
+def reference_triangles(g) -> int:
+    neighbours = {v: set() for v in g.begin_vertices()}
+    for u, v in g.begin_edges():
+        if u != v:
+            neighbours[u].add(v)
+            neighbours[v].add(u)
+    return sum(len(neighbours[u] & neighbours[v]) for u in neighbours for v in neighbours[u]) // 6
+
+
+class TestGraphAnalytics:
+
+    def test_small_graph(self):
+        g = DirectedGraphIncidence[str].from_edge_list(
+            [("A", "B"), ("B", "C"), ("C", "A"), ("A", "C"), ("D", "E"), ("F", "F")],
+            vertices="ABCDEFG"
+        )
+        with GraphAnalytics(g, workers=1) as analytics:
+            assert analytics.degree_histogram() == ([2, 4, 1], [2, 4, 1])
+            assert analytics.weakly_connected_components() == [["A", "B", "C"], ["D", "E"], ["F"], ["G"]]
+            assert analytics.triangle_count() == 1
+            ranks = analytics.pagerank()
+        assert [v for v, _ in ranks] == list(g.begin_vertices())
+        ranks = dict(ranks)
+        assert sum(ranks.values()) == pytest.approx(1.0)
+        assert ranks["D"] == pytest.approx(ranks["G"])
+
+    def test_matches_reference(self):
+        g = random_graph(60, 150)
+        with GraphAnalytics(g, workers=1) as analytics:
+            ranks = dict(analytics.pagerank(tol=1e-12, max_iter=200))
+            assert analytics.triangle_count() == reference_triangles(g)
+            components = analytics.weakly_connected_components()
+        expected = reference_pagerank(g)
+        assert all(ranks[v] == pytest.approx(expected[v]) for v in expected)
+        assert sorted(v for c in components for v in c) == list(range(60))
+
+    def test_workers_give_identical_results(self):
+        g = random_graph(300, 900, seed=5)
+        with GraphAnalytics(g, workers=1) as serial:
+            expected = (serial.degree_histogram(), serial.weakly_connected_components(),
+                        serial.pagerank(), serial.triangle_count())
+        with GraphAnalytics(g.freeze(), workers=2) as parallel:
+            assert len(parallel._ranges) > 1
+            result = (parallel.degree_histogram(), parallel.weakly_connected_components(),
+                      parallel.pagerank(), parallel.triangle_count())
+        assert result == expected
+
+    def test_unhashable_vertices(self):
+        from sort.ExampleClass import ExampleClass
+        a, b, c = ExampleClass(1), ExampleClass(2), ExampleClass(3)
+        g = DirectedGraphIncidence[ExampleClass].from_edge_list([(a, b), (b, a), (c, a)], vertices=[a, b, c])
+        with GraphAnalytics(g, workers=1) as analytics:
+            ranks = analytics.pagerank(tol=1e-12, max_iter=200)
+            assert analytics.weakly_connected_components() == [[a, b, c]]
+        assert [v for v, _ in ranks] == [a, b, c]
+        expected = reference_pagerank(DirectedGraphIncidence[int].from_edge_list([(1, 2), (2, 1), (3, 1)]))
+        assert [rank for _, rank in ranks] == pytest.approx([expected[1], expected[2], expected[3]])
+
+    def test_empty_and_closed(self):
+        with GraphAnalytics(DirectedGraphIncidence[int](), workers=1) as analytics:
+            assert analytics.degree_histogram() == ([], [])
+            assert analytics.weakly_connected_components() == []
+            assert analytics.pagerank() == []
+            assert analytics.triangle_count() == 0
+        with pytest.raises(ValueError):
+            analytics.triangle_count()
+        with pytest.raises(ValueError):
+            GraphAnalytics(DirectedGraphIncidence[int](), workers=0)
+
+    def test_shared_memory_released_without_close(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        analytics = GraphAnalytics(random_graph(50, 100), workers=2)
+        names = [block.name for block in analytics._blocks]
+        assert names
+        del analytics
+        gc.collect()
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                SharedMemory(name=name)
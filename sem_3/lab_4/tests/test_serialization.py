@@ -0,0 +1,94 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from graph.DirectedGraphIncidence import DirectedGraphIncidence
+from graph.FrozenGraph import FrozenGraph
+from graph.exceptions import GraphFormatError
+from graph.serialization import load, open_frozen, register_codec, HEADER_SIZE
+from sort.ExampleClass import ExampleClass
+
+
+class TestSerialization:
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_round_trip(self, tmp_path, mmap, small_graph):
+        g = small_graph
+        path = tmp_path / "graph.bin"
+        g.save(path)
+        loaded = DirectedGraphIncidence.load(path, mmap=mmap)
+        assert list(loaded.begin_vertices()) == list(g.begin_vertices())
+        assert set(loaded.begin_edges()) == set(g.begin_edges())
+        loaded.add_edge("D", "A")
+        assert loaded.in_degree("A") == 2
+
+    def test_frozen_view(self, tmp_path, small_graph):
+        path = tmp_path / "graph.bin"
+        small_graph.save(path)
+        view = load(path, frozen=True)
+        assert isinstance(view, FrozenGraph)
+        assert isinstance(view.indices, np.memmap)
+        assert view.has_edge("C", "A")
+        assert not view.has_edge("D", "A")
+        assert view.out_degrees().tolist() == [2, 1, 1, 0]
+        assert view.vertices[2] == "C"
+
+    @pytest.mark.parametrize("vertices", [[10, -3, 2 ** 40], [ExampleClass(1), ExampleClass(2), ExampleClass(3)]])
+    def test_codecs(self, tmp_path, vertices):
+        g = DirectedGraphIncidence.from_edge_list([(vertices[0], vertices[1])], vertices=vertices)
+        path = tmp_path / "graph.bin"
+        g.save(path)
+        loaded = DirectedGraphIncidence.load(path)
+        assert list(loaded.begin_vertices()) == vertices
+        assert loaded.has_edge(vertices[0], vertices[1])
+
+    def test_custom_codec(self, tmp_path, small_graph):
+        class UpperCodec:
+            name = "upper"
+
+            def encode(self, value: str) -> bytes:
+                return value.upper().encode()
+
+            def decode(self, data: bytes) -> str:
+                return data.decode()
+
+        register_codec(UpperCodec())
+        path = tmp_path / "graph.bin"
+        small_graph.save(path, codec="upper")
+        assert list(open_frozen(path).vertices) == ["A", "B", "C", "D"]
+
+    def test_empty_graph(self, tmp_path):
+        path = tmp_path / "graph.bin"
+        DirectedGraphIncidence[int]().save(path)
+        assert DirectedGraphIncidence.load(path).empty()
+
+    def test_bad_file(self, tmp_path, small_graph):
+        path = tmp_path / "graph.bin"
+        path.write_bytes(b"not a graph".ljust(HEADER_SIZE, b"\0"))
+        with pytest.raises(GraphFormatError):
+            DirectedGraphIncidence.load(path)
+
+        small_graph.save(path)
+        data = bytearray(path.read_bytes())
+        data[4] = 99  # версия формата
+        path.write_bytes(bytes(data))
+        with pytest.raises(GraphFormatError):
+            load(path)
+
+    def test_edge_attributes_and_multigraph(self, tmp_path):
+        g = DirectedGraphIncidence[str](multigraph=True)
+        g.add_vertices_from(["B", "A"])
+        g.add_edge("B", "A", weight=3.0)
+        g.add_edge("A", "B", weight=2.0)
+        g.add_edge("A", "B", weight=2.0)
+        g.add_edge_attribute("capacity", default=7.0)
+        path = tmp_path / "graph.bin"
+        g.save(path)
+        loaded = DirectedGraphIncidence.load(path)
+        assert loaded.is_multigraph()
+        assert loaded.edge_multiplicity("A", "B") == 2
+        assert loaded.edge_weight("B", "A") == 3.0
+        assert loaded.edge_weight("A", "B") == 2.0
+        assert loaded.edge_attribute("A", "B", "capacity") == 7.0
+        loaded.add_edge("B", "B")
+        assert loaded.edge_attribute("B", "B", "capacity") == 7.0
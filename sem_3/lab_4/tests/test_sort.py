@@ -2,6 +2,11 @@ import pytest
 from sort.ExampleClass import ExampleClass
 from sort.GnomeSort import GnomeSort
 from sort.PigeonholeSort import PigeonholeSort
+from sort.MergeSort import MergeSort
+from sort.IntroSort import IntroSort
+from sort.RadixSort import RadixSort
+from sort.ExternalSort import ExternalSort
+from sort.SampleSort import SampleSort
 
 
 class TestGnomeSort:
@@ -93,6 +98,227 @@ class TestPigeonholeSort:
         assert result == expected
 
 
+class TestVectorizedPigeonholeSort:
+
+    def test_key_and_stability(self):
+        pairs = [("a", 3), ("b", 1), ("c", 3), ("d", -2), ("e", 1)]
+        result = PigeonholeSort().pigeonhole_sort(pairs, key=lambda p: p[1])
+        assert result == [("d", -2), ("b", 1), ("e", 1), ("a", 3), ("c", 3)]
+        result = PigeonholeSort().pigeonhole_sort(pairs, key=lambda p: p[1], reverse=True)
+        assert result == [("a", 3), ("c", 3), ("b", 1), ("e", 1), ("d", -2)]
+
+    def test_sparse_range_uses_radix(self, monkeypatch):
+        import sort.PigeonholeSort as module
+        calls = []
+        original = module.lsd_argsort
+        monkeypatch.setattr(module, "lsd_argsort", lambda keys: calls.append(len(keys)) or original(keys))
+        arr = [ExampleClass(v) for v in [10 ** 15, -10 ** 12, 7, 7, 0]]
+        result = PigeonholeSort().pigeonhole_sort(arr)
+        assert result == sorted(arr, key=lambda x: x.value)
+        assert calls == [5]
+
+    def test_int_array(self):
+        np = pytest.importorskip("numpy")
+        arr = np.array([5, -3, 5, 0, 2, -3], dtype=np.int32)
+        result = PigeonholeSort().pigeonhole_sort(arr)
+        assert result.dtype == np.int32
+        assert result.tolist() == [-3, -3, 0, 2, 5, 5]
+        assert PigeonholeSort().pigeonhole_sort(arr, reverse=True).tolist() == [5, 5, 2, 0, -3, -3]
+        wide = np.array([2 ** 40, -(2 ** 40), 3])
+        assert PigeonholeSort().pigeonhole_sort(wide).tolist() == sorted(wide.tolist())
+
+    def test_non_integer_keys(self):
+        with pytest.raises(TypeError):
+            PigeonholeSort().pigeonhole_sort([ExampleClass(1.5), ExampleClass(2)])
+
+    def test_uint64_keys_above_int64(self):
+        np = pytest.importorskip("numpy")
+        big = 2 ** 63 + 5
+        sort = PigeonholeSort().pigeonhole_sort
+        assert sort(np.array([0, big], dtype=np.uint64)).tolist() == [0, big]
+        assert sort(np.array([3, big, 1], dtype=np.uint64)).tolist() == [1, 3, big]
+        assert sort(np.array([big + 2, big, big + 1], dtype=np.uint64)).tolist() == [big, big + 1, big + 2]
+        values = [2 ** 64 - 1, 2 ** 63, 7, 2 ** 63 + 1, 0]
+        assert sort([ExampleClass(v) for v in values]) == [ExampleClass(v) for v in sorted(values)]
+        assert RadixSort().radix_sort(values.copy()) == sorted(values)
+
+
+class TestRadixSort:
+
+    def test_lsd_matches_sorted(self):
+        import random
+        rng = random.Random(4)
+        for bound in [1, 200, 70000, 2 ** 62]:
+            values = [rng.randrange(-bound, bound + 1) for _ in range(2000)]
+            pairs = list(enumerate(values))
+            expected = sorted(pairs, key=lambda p: p[1])
+            assert RadixSort().radix_sort(pairs.copy(), key=lambda p: p[1]) == expected
+            expected = sorted(pairs, key=lambda p: p[1], reverse=True)
+            assert RadixSort().radix_sort(pairs.copy(), key=lambda p: p[1], reverse=True) == expected
+
+
+    def test_msd_strings(self):
+        import random
+        rng = random.Random(5)
+        words = ["", "a", "ab", "abc", "b", "ba", "\u044f", "A"]
+        words += ["prefix/" * 40 + "".join(rng.choice("xyz") for _ in range(rng.randrange(6))) for _ in range(300)]
+        words += ["".join(rng.choice("abcd") for _ in range(rng.randrange(8))) for _ in range(2000)]
+        pairs = list(enumerate(words))
+        for reverse in (False, True):
+            expected = sorted(pairs, key=lambda p: p[1], reverse=reverse)
+            assert RadixSort().msd_radix_sort(pairs.copy(), key=lambda p: p[1], reverse=reverse) == expected
+            assert RadixSort().radix_sort(pairs.copy(), key=lambda p: p[1], reverse=reverse) == expected
+
+    def test_wrong_key_types(self):
+        with pytest.raises(TypeError):
+            RadixSort().msd_radix_sort([1, 2, 3])
+        with pytest.raises(TypeError):
+            RadixSort().lsd_radix_sort(["b", "a"])
+
+
+class TestMergeSort:
+
+    def test_merge_sort_example_class(self):
+        arr = [ExampleClass(v) for v in [5, 2, 8, 1, 5, 3]]
+        result = MergeSort().merge_sort(arr)
+        assert result is arr
+        assert result == [ExampleClass(v) for v in [1, 2, 3, 5, 5, 8]]
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_merge_sort_stable(self, reverse):
+        import random
+        rng = random.Random(1)
+        for n in [0, 1, 2, 63, 64, 65, 500, 3000]:
+            pairs = [(rng.randrange(20), i) for i in range(n)]
+            expected = sorted(pairs, key=lambda p: p[0], reverse=reverse)
+            assert MergeSort().merge_sort(pairs, key=lambda p: p[0], reverse=reverse) == expected
+
+    def test_merge_sort_runs(self):
+        # серии, обратные серии и галоп
+        arr = list(range(1000)) + list(range(2000, 1000, -1)) + list(range(500, 1500)) + [7] * 100
+        assert MergeSort().merge_sort(arr.copy()) == sorted(arr)
+
+
+class TestIntroSort:
+
+    def test_intro_sort_example_class(self):
+        arr = [ExampleClass(v) for v in [4, -1, 9, 0, 4, 2]]
+        assert IntroSort().intro_sort(arr, reverse=True) == [ExampleClass(v) for v in [9, 4, 4, 2, 0, -1]]
+
+    def test_intro_sort_key_and_sizes(self):
+        import random
+        rng = random.Random(2)
+        for n in [0, 1, 2, 16, 17, 100, 5000]:
+            arr = [rng.randrange(50) for _ in range(n)]
+            assert IntroSort().intro_sort(arr.copy(), key=lambda x: -x) == sorted(arr, reverse=True)
+            assert IntroSort().intro_sort(sorted(arr)) == sorted(arr)
+
+    def test_intro_sort_heap_fallback(self):
+        from sort.IntroSort import _introsort
+        arr = [(i * 7919) % 1000 for i in range(1000)]
+        order = list(range(len(arr)))
+        _introsort(arr, order, 0, len(arr), 0)
+        assert [arr[i] for i in order] == sorted(arr)
+
+
+def example_value(x: ExampleClass):
+    return x.value
+
+
+class TestExternalSort:
+
+    def _records(self, n: int) -> list[ExampleClass]:
+        import random
+        rng = random.Random(6)
+        records = []
+        for i in range(n):
+            record = ExampleClass(rng.randrange(100))
+            record.position = i
+            records.append(record)
+        return records
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_external_sort_spills_and_is_stable(self, tmp_path, reverse):
+        records = self._records(5000)
+        sorter = ExternalSort(memory_budget=20_000, tmpdir=str(tmp_path), max_fan_in=4)
+        result = list(sorter.external_sort(iter(records), key=example_value, reverse=reverse))
+        expected = sorted(records, key=example_value, reverse=reverse)
+        assert [(r.value, r.position) for r in result] == [(r.value, r.position) for r in expected]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_external_sort_in_memory_and_empty(self):
+        assert list(ExternalSort().external_sort([])) == []
+        assert list(ExternalSort().external_sort([3, 1, 2])) == [1, 2, 3]
+        with pytest.raises(ValueError):
+            ExternalSort(memory_budget=0)
+
+    def test_external_sort_process_pool(self, tmp_path):
+        records = self._records(3000)
+        sorter = ExternalSort(memory_budget=30_000, tmpdir=str(tmp_path), workers=2)
+        result = list(sorter.external_sort(records, key=example_value))
+        assert [(r.value, r.position) for r in result] == \
+            [(r.value, r.position) for r in sorted(records, key=example_value)]
+
+    def test_external_sort_early_close_cleans_up(self, tmp_path):
+        sorter = ExternalSort(memory_budget=10_000, tmpdir=str(tmp_path))
+        gen = sorter.external_sort(range(5000, 0, -1))
+        assert next(gen) == 1
+        assert any(tmp_path.iterdir())
+        gen.close()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSampleSort:
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_sample_sort_numeric_keys(self, reverse):
+        import random
+        rng = random.Random(7)
+        records = self._records(rng, 4000, lambda: rng.randrange(50))
+        result = SampleSort(workers=3, threshold=1000, seed=1).sample_sort(records.copy(), key=example_value,
+                                                                           reverse=reverse)
+        expected = sorted(records, key=example_value, reverse=reverse)
+        assert [r.position for r in result] == [r.position for r in expected]
+
+    def test_sample_sort_string_and_float_keys(self):
+        import random
+        rng = random.Random(8)
+        words = ["".join(rng.choice("abc") for _ in range(rng.randrange(5))) for _ in range(3000)]
+        assert SampleSort(workers=2, threshold=100).sample_sort(words.copy()) == sorted(words)
+        floats = [rng.random() for _ in range(3000)]
+        assert SampleSort(workers=2, threshold=100).sample_sort(floats.copy(), reverse=True) == \
+            sorted(floats, reverse=True)
+
+    def test_sample_sort_mixed_and_huge_numeric_keys(self):
+        # смесь int/float и целые за пределами int64 не должны терять точность
+        mixed = [2 ** 53 + 1, 2 ** 53, 0.5] * 40
+        assert SampleSort(workers=2, threshold=10, seed=0).sample_sort(mixed.copy()) == sorted(mixed)
+        huge = [2 ** 70 + i for i in (3, 1, 2)] * 40 + [-(2 ** 65)] * 5
+        assert SampleSort(workers=2, threshold=10, seed=0).sample_sort(huge.copy()) == sorted(huge)
+
+    def test_sample_sort_array(self):
+        np = pytest.importorskip("numpy")
+        arr = np.random.default_rng(3).integers(-1000, 1000, 5000)
+        sorter = SampleSort(workers=2, threshold=100)
+        assert sorter.sample_sort(arr).tolist() == sorted(arr.tolist())
+        assert sorter.sample_sort(arr, reverse=True).tolist() == sorted(arr.tolist(), reverse=True)
+
+    def test_sample_sort_serial_fallback(self):
+        arr = [ExampleClass(v) for v in [3, 1, 2]]
+        assert SampleSort(workers=4).sample_sort(arr) == [ExampleClass(1), ExampleClass(2), ExampleClass(3)]
+        with pytest.raises(ValueError):
+            SampleSort(workers=0)
+
+    @staticmethod
+    def _records(rng, n, value):
+        records = []
+        for i in range(n):
+            record = ExampleClass(value())
+            record.position = i
+            records.append(record)
+        return records
+
+
 # === Дополнительный тест: сравнение с встроенной сортировкой ===
 def test_gnome_vs_builtin():
     arr = [ExampleClass(v) for v in [10, 3, 7, 1, 9, 4]]